@@ -0,0 +1,127 @@
+"""Benchmark the streaming sentence segmenter against the old regex flusher.
+
+Run from the repository root:
+
+    python benchmarks/bench_sentence_segmenter.py
+
+The segmenter module has no Home Assistant imports, so it is loaded straight
+from its file and this script runs without a Home Assistant install.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import re
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+SEGMENTER_PATH = (
+    ROOT / "custom_components" / "openwebui_conversation" / "sentence_segmenter.py"
+)
+TOKEN_STREAM_PATH = Path(__file__).resolve().parent / "data" / "token_stream.json"
+
+
+def _load_segmenter():
+    spec = importlib.util.spec_from_file_location("sentence_segmenter", SEGMENTER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SentenceSegmenter
+
+
+def legacy_flush_stream_buffer(pending: list[str], *, force: bool = False) -> str:
+    """The sentence-safe branch of the previous _flush_stream_buffer."""
+    if not pending:
+        return ""
+    text = "".join(pending)
+    if not text.strip():
+        pending.clear()
+        return ""
+    if not force:
+        split_match = re.search(r"^(.+?[.!?](?:\s+|$))(.*)$", text, re.DOTALL)
+        if split_match:
+            emit = split_match.group(1)
+            remainder = split_match.group(2)
+            pending[:] = [remainder] if remainder else []
+            return emit if emit.strip() else ""
+        return ""
+    pending.clear()
+    return text if text.strip() else ""
+
+
+def run_legacy(deltas: list[str]) -> list[str]:
+    pending: list[str] = []
+    chunks: list[str] = []
+    for delta in deltas:
+        pending.append(delta)
+        if emit := legacy_flush_stream_buffer(pending):
+            chunks.append(emit)
+    if emit := legacy_flush_stream_buffer(pending, force=True):
+        chunks.append(emit)
+    return chunks
+
+
+def run_segmenter(segmenter_cls, deltas: list[str]) -> list[str]:
+    segmenter = segmenter_cls()
+    chunks: list[str] = []
+    for delta in deltas:
+        chunks.extend(segmenter.feed(delta))
+    if rest := segmenter.flush():
+        chunks.append(rest)
+    return chunks
+
+
+def _time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        func()
+        best = min(best, perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    segmenter_cls = _load_segmenter()
+    recorded = json.loads(TOKEN_STREAM_PATH.read_text(encoding="utf-8"))["deltas"]
+    scenarios = {
+        "recorded_reply": recorded,
+        # A long run without punctuation, e.g. a model listing entity names.
+        "unpunctuated_run": ["word "] * 4000,
+    }
+
+    results: dict[str, dict[str, float | int]] = {}
+    for name, deltas in scenarios.items():
+        legacy = _time(lambda: run_legacy(deltas), args.repeat)
+        current = _time(lambda: run_segmenter(segmenter_cls, deltas), args.repeat)
+        results[name] = {
+            "deltas": len(deltas),
+            "chars": sum(len(delta) for delta in deltas),
+            "legacy_us_per_delta": legacy / len(deltas) * 1e6,
+            "segmenter_us_per_delta": current / len(deltas) * 1e6,
+            "speedup": legacy / current if current else float("inf"),
+            "legacy_chunks": len(run_legacy(deltas)),
+            "segmenter_chunks": len(run_segmenter(segmenter_cls, deltas)),
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, result in results.items():
+        print(
+            f"{name:18} {result['deltas']:6} deltas  "
+            f"legacy {result['legacy_us_per_delta']:8.2f} us/delta  "
+            f"segmenter {result['segmenter_us_per_delta']:6.2f} us/delta  "
+            f"x{result['speedup']:.1f}  "
+            f"chunks {result['legacy_chunks']}/{result['segmenter_chunks']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Benchmark the bytes-level SSE framer against the old line-based parser.
+
+Run from the repository root:
+
+    python benchmarks/bench_sse_framer.py
+
+Both parsers are fed the same synthetic chat-completion stream, cut into
+network-sized reads and delivered through an async iterator the way aiohttp
+hands them over. The legacy path reproduces ``async for line in
+response.content`` (one await per line, decode each line, join the
+``data:`` lines, ``json.loads`` the string); the framer gets one await per
+read via ``iter_any()``. Allocation cost is reported as
+tracemalloc peak bytes per frame, measured in a separate pass so the timing
+runs are not slowed by tracing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+import sys
+from time import perf_counter
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parent.parent
+SSE_PATH = ROOT / "custom_components" / "openwebui_conversation" / "sse.py"
+
+
+def _load_framer():
+    spec = importlib.util.spec_from_file_location("sse", SSE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["sse"] = module
+    spec.loader.exec_module(module)
+    return module.SSEFramer
+
+
+def build_stream(frames: int) -> bytes:
+    """Return an OpenAI-style streamed completion of ``frames`` chunks."""
+    parts = []
+    for number in range(frames):
+        chunk = {
+            "id": "chatcmpl-benchmark",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "llama3.1:8b",
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"content": f"token{number} "},
+                    "finish_reason": None,
+                }
+            ],
+        }
+        parts.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    parts.append(b"data: [DONE]\n\n")
+    return b"".join(parts)
+
+
+def split_reads(stream: bytes, size: int) -> list[bytes]:
+    return [stream[offset : offset + size] for offset in range(0, len(stream), size)]
+
+
+async def _legacy_lines(reads: list[bytes]):
+    # What aiohttp's StreamReader line iterator hands back.
+    pending = b""
+    for read in reads:
+        pending += read
+        while (newline := pending.find(b"\n")) != -1:
+            yield pending[: newline + 1]
+            pending = pending[newline + 1 :]
+    if pending:
+        yield pending
+
+
+async def _iter_any(reads: list[bytes]):
+    for read in reads:
+        yield read
+
+
+async def _legacy(reads: list[bytes]) -> int:
+    decoded = 0
+    pending_data: list[str] = []
+    async for raw_line in _legacy_lines(reads):
+        line = raw_line.decode("utf-8", errors="ignore").rstrip("\r\n")
+        if not line:
+            payload = "\n".join(pending_data).strip()
+            pending_data.clear()
+            if not payload:
+                continue
+            if payload == "[DONE]":
+                break
+            try:
+                json.loads(payload)
+                decoded += 1
+            except json.JSONDecodeError:
+                continue
+            continue
+        if line.startswith(":"):
+            continue
+        if line.startswith("data:"):
+            pending_data.append(line[5:].lstrip())
+        else:
+            pending_data.append(line)
+    return decoded
+
+
+async def _framer(framer_cls, reads: list[bytes]) -> int:
+    decoded = 0
+    framer = framer_cls()
+    async for read in _iter_any(reads):
+        for frame in framer.feed(read):
+            data = frame.data.strip()
+            if data == b"[DONE]":
+                return decoded
+            json.loads(data.decode("utf-8"))
+            decoded += 1
+    return decoded
+
+
+def run_legacy(reads: list[bytes]) -> int:
+    return asyncio.run(_legacy(reads))
+
+
+def run_framer(framer_cls, reads: list[bytes]) -> int:
+    return asyncio.run(_framer(framer_cls, reads))
+
+
+def _time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        func()
+        best = min(best, perf_counter() - started)
+    return best
+
+
+def _peak_bytes(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    framer_cls = _load_framer()
+    stream = build_stream(args.frames)
+    scenarios = {
+        # One event per read, as a local model streaming token by token.
+        "frame_per_read": [frame + b"\n\n" for frame in stream.split(b"\n\n")[:-1]],
+        # Events cut mid-frame by small reads.
+        "small_reads": split_reads(stream, 64),
+        # Coalesced reads, as a fast model behind a proxy.
+        "mtu_sized_reads": split_reads(stream, 1400),
+        "large_reads": split_reads(stream, 64 * 1024),
+    }
+
+    results: dict[str, dict[str, float | int]] = {}
+    for name, reads in scenarios.items():
+        frames = run_legacy(reads)
+        if run_framer(framer_cls, reads) != frames:
+            raise SystemExit(f"{name}: parsers decoded different frame counts")
+        legacy = _time(lambda: run_legacy(reads), args.repeat)
+        current = _time(lambda: run_framer(framer_cls, reads), args.repeat)
+        legacy_peak = _peak_bytes(lambda: run_legacy(reads))
+        framer_peak = _peak_bytes(lambda: run_framer(framer_cls, reads))
+        results[name] = {
+            "reads": len(reads),
+            "frames": frames,
+            "legacy_frames_per_sec": frames / legacy,
+            "framer_frames_per_sec": frames / current,
+            "speedup": legacy / current if current else float("inf"),
+            "legacy_peak_bytes_per_frame": legacy_peak / frames,
+            "framer_peak_bytes_per_frame": framer_peak / frames,
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, result in results.items():
+        print(
+            f"{name:18} {result['frames']:6} frames  "
+            f"legacy {result['legacy_frames_per_sec']:10.0f}/s  "
+            f"framer {result['framer_frames_per_sec']:10.0f}/s  "
+            f"x{result['speedup']:.2f}  "
+            f"peak B/frame {result['legacy_peak_bytes_per_frame']:.1f}"
+            f"/{result['framer_peak_bytes_per_frame']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,530 @@
+"""End-to-end voice latency of the conversation agent against a mock backend.
+
+Run from the repository root in an environment with Home Assistant
+installed (the integration's development environment):
+
+    python benchmarks/bench_voice_latency.py
+    python benchmarks/bench_voice_latency.py --save-baseline
+    python benchmarks/bench_voice_latency.py --baseline --tolerance 0.15
+
+Each scenario starts ``mock_openwebui.MockOpenWebUI`` with a scripted model,
+builds an ``OpenWebUIAgent`` on a bare Home Assistant core with one
+registered light, and calls ``_async_handle_message`` the way the Assist
+pipeline does. A fake chat log timestamps what would reach TTS: the first
+assistant text (time to first spoken chunk), the point where the spoken
+text first contains the turn's response (time to final text) and the return
+of the turn (total). A turn whose response would be spoken more than once,
+or not at all, fails the run. Scenarios:
+
+* ``plain_answer`` - a model without OpenWebUI tools, so the local JSON
+  tool prompt is sent and the reply's opening is still classified.
+* ``tool_capable_answer`` - a model with tool ids answering in prose.
+* ``single_tool`` - one native light call, then the spoken answer.
+* ``multi_step_wait`` - on, wait, off in one round, then the answer.
+* ``follow_up_rounds`` - three follow-up rounds of tool calls before the
+  answer.
+
+Every scenario runs streamed and non-streamed. The light's service call and
+its state report are delayed like a real device (``--service-latency``,
+``--report-latency``). Medians and maxima per scenario and mode are printed
+or written as JSON (``--json``, ``--output``). ``--save-baseline`` stores
+them in ``benchmarks/data/voice_latency_baseline.json``; ``--baseline``
+compares against that file and exits non-zero when a median is slower than
+the baseline by more than the tolerance plus ``--slack-ms``, so a change to
+``_flush_stream_buffer`` or the tool loop shows up as a number.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from statistics import median
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from homeassistant.components import conversation
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import entity_registry, intent
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from custom_components.openwebui_conversation.api import (  # noqa: E402
+    OpenWebUIApiClient,
+)
+from custom_components.openwebui_conversation.const import (  # noqa: E402
+    CONF_ENABLE_STREAMING,
+    CONF_MODEL,
+    CONF_NARRATE_STREAMING_PROGRESS,
+    CONF_SHOW_DEBUG_BUBBLES,
+    CONF_STATE_VERIFY_TIMEOUT,
+    DOMAIN,
+)
+from custom_components.openwebui_conversation.conversation import (  # noqa: E402
+    OpenWebUIAgent,
+)
+from custom_components.openwebui_conversation.keep_alive import (  # noqa: E402
+    ModelKeepAlive,
+)
+from custom_components.openwebui_conversation.latency import (  # noqa: E402
+    LatencyStats,
+)
+from custom_components.openwebui_conversation.model_catalog import (  # noqa: E402
+    ModelCatalog,
+)
+from custom_components.openwebui_conversation.usage import UsageStats  # noqa: E402
+from mock_openwebui import DEFAULT_MODEL, MockBehavior, MockOpenWebUI  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "data" / "voice_latency_baseline.json"
+LIGHT = "light.kitchen"
+METRICS = ("first_spoken_ms", "final_text_ms", "total_ms")
+MODES = ("stream", "non_stream")
+ANSWER = (
+    "The kitchen light is on and set to half brightness. "
+    "Let me know if you want it dimmer."
+)
+
+
+def _light(state: str, **parameters: Any) -> dict[str, Any]:
+    return {
+        "name": "control_lights",
+        "arguments": {"entity_ids": [LIGHT], "state": state, **parameters},
+    }
+
+
+@dataclass
+class Scenario:
+    """One utterance and the rounds the mock model answers it with."""
+
+    name: str
+    utterance: str
+    script: list[dict[str, Any]] = field(default_factory=list)
+    tool_ids: list[str] | None = None
+
+
+SCENARIOS = (
+    Scenario(
+        "plain_answer",
+        "What is the capital of France?",
+        tool_ids=[],
+    ),
+    Scenario("tool_capable_answer", "What is the capital of France?"),
+    Scenario(
+        "single_tool",
+        "Turn on the kitchen light.",
+        [{"tool_calls": [_light("on")]}, {"content": "The kitchen light is on."}],
+    ),
+    Scenario(
+        "multi_step_wait",
+        "Turn on the kitchen light, wait a second, then turn it off.",
+        [
+            {
+                "tool_calls": [
+                    _light("on"),
+                    {"name": "wait", "arguments": {"seconds": 1}},
+                    _light("off"),
+                ]
+            },
+            {"content": "I turned the kitchen light on and off again."},
+        ],
+    ),
+    Scenario(
+        "follow_up_rounds",
+        "Turn on the kitchen light, dim it to half, then turn it off.",
+        [
+            {"tool_calls": [_light("on")]},
+            {"tool_calls": [_light("on", brightness_pct=50)]},
+            {"tool_calls": [_light("off")]},
+            {"content": "The kitchen light went on, dimmed to half and is off now."},
+        ],
+    ),
+)
+
+
+class BenchChatLog:
+    """The parts of ``conversation.ChatLog`` the agent uses, with timestamps.
+
+    Assistant text is what the Assist pipeline hands to TTS as it arrives,
+    so the first text timestamp is the first spoken chunk, and the moment
+    the text spoken so far first contains the turn's response is the final
+    text. Everything spoken is kept so a turn can check that the response
+    was spoken exactly once.
+    """
+
+    def __init__(self, utterance: str) -> None:
+        """Start a chat with a system prompt and the user's utterance."""
+        self.conversation_id = "benchmark"
+        self.continue_conversation = False
+        self.content: list[Any] = [
+            conversation.SystemContent(content="You are a voice assistant."),
+            conversation.UserContent(content=utterance),
+        ]
+        self.started = perf_counter()
+        self.first_text: float | None = None
+        self.spoken: list[tuple[float, str]] = []
+
+    @property
+    def spoken_text(self) -> str:
+        """Return all assistant text in the order it would be spoken."""
+        return "".join(text for _, text in self.spoken)
+
+    def final_text_at(self, response: str) -> float | None:
+        """Return when the spoken text first contained the whole response."""
+        spoken = ""
+        for arrived, text in self.spoken:
+            spoken += text
+            if response in spoken:
+                return arrived
+        return None
+
+    def _text_arrived(self, text: str | None) -> None:
+        if not text or not text.strip():
+            return
+        now = perf_counter() - self.started
+        if self.first_text is None:
+            self.first_text = now
+        self.spoken.append((now, text))
+
+    def async_add_assistant_content_without_tools(self, content: Any) -> None:
+        """Add a whole message."""
+        if isinstance(content, conversation.AssistantContent):
+            self._text_arrived(content.content)
+        self.content.append(content)
+
+    async def async_add_delta_content_stream(self, agent_id: str, stream: Any):
+        """Assemble streamed deltas into messages, a new one at each role."""
+        current: dict[str, Any] | None = None
+        async for delta in stream:
+            if "role" in delta:
+                if current is not None:
+                    yield self._add_message(agent_id, current)
+                current = {"role": delta["role"]}
+            if current is None:
+                current = {"role": "assistant"}
+            if text := delta.get("content"):
+                current["content"] = current.get("content", "") + text
+                self._text_arrived(text)
+            for key in ("tool_calls", "tool_call_id", "tool_name", "tool_result"):
+                if key in delta:
+                    current[key] = delta[key]
+        if current is not None:
+            yield self._add_message(agent_id, current)
+
+    def _add_message(self, agent_id: str, message: dict[str, Any]) -> Any:
+        if message["role"] == "tool_result":
+            content: Any = conversation.ToolResultContent(
+                agent_id=agent_id,
+                tool_call_id=message["tool_call_id"],
+                tool_name=message["tool_name"],
+                tool_result=message["tool_result"],
+            )
+        else:
+            content = conversation.AssistantContent(
+                agent_id=agent_id,
+                content=message.get("content"),
+                tool_calls=message.get("tool_calls"),
+            )
+        self.content.append(content)
+        return content
+
+
+async def _async_setup_hass(
+    config_dir: str, service_latency: float, report_latency: float
+) -> HomeAssistant:
+    """Return a core with one light whose state follows its service calls."""
+    hass = HomeAssistant(config_dir)
+    await entity_registry.async_load(hass)
+    entity_registry.async_get(hass).async_get_or_create(
+        "light",
+        "benchmark",
+        "kitchen",
+        suggested_object_id="kitchen",
+        original_name="Kitchen",
+    )
+    hass.states.async_set(LIGHT, "off", {"friendly_name": "Kitchen"})
+
+    async def _async_light_service(call: ServiceCall) -> None:
+        await asyncio.sleep(service_latency)
+        state = "off" if call.service == "turn_off" else "on"
+        for entity_id in call.data["entity_id"]:
+            hass.loop.call_later(
+                report_latency,
+                hass.states.async_set,
+                entity_id,
+                state,
+                {"friendly_name": "Kitchen"},
+            )
+
+    hass.services.async_register("light", "turn_on", _async_light_service)
+    hass.services.async_register("light", "turn_off", _async_light_service)
+    return hass
+
+
+async def _async_create_agent(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    streaming: bool,
+    narrate: bool,
+) -> OpenWebUIAgent:
+    """Build an agent on the pieces async_setup_entry would give it."""
+    options = {
+        CONF_MODEL: DEFAULT_MODEL,
+        CONF_ENABLE_STREAMING: streaming,
+        CONF_NARRATE_STREAMING_PROGRESS: narrate,
+        CONF_SHOW_DEBUG_BUBBLES: False,
+        CONF_STATE_VERIFY_TIMEOUT: 3.0,
+    }
+    entry = SimpleNamespace(
+        entry_id=f"benchmark_{'stream' if streaming else 'non_stream'}",
+        title="OpenWebUI benchmark",
+        data={},
+        options=options,
+    )
+    client = OpenWebUIApiClient(url, "benchmark", 60, False, session)
+    model_catalog = ModelCatalog(hass, client)
+    await model_catalog.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = SimpleNamespace(
+        client=client,
+        model_catalog=model_catalog,
+        keep_alive=ModelKeepAlive(hass, client, model_catalog, options, lambda: None),
+        latency=LatencyStats(),
+        usage=UsageStats(0, lambda: None),
+    )
+    agent = OpenWebUIAgent(hass, entry)
+    agent.entity_id = "conversation.openwebui_benchmark"
+    return agent
+
+
+async def _async_turn(agent: OpenWebUIAgent, utterance: str) -> dict[str, float]:
+    """Run one turn and return its timings in milliseconds."""
+    chat_log = BenchChatLog(utterance)
+    user_input = SimpleNamespace(text=utterance, language="en")
+    result = await agent._async_handle_message(user_input, chat_log)
+    total = perf_counter() - chat_log.started
+    if result.response.response_type == intent.IntentResponseType.ERROR:
+        raise RuntimeError(result.response.speech["plain"]["speech"])
+    if chat_log.first_text is None:
+        raise RuntimeError(f"Nothing would have been spoken for {utterance!r}")
+    response = result.response.speech["plain"]["speech"].strip()
+    if (spoken := chat_log.spoken_text.count(response)) != 1:
+        raise RuntimeError(
+            f"The response to {utterance!r} would have been spoken {spoken} times: "
+            f"{chat_log.spoken_text!r}"
+        )
+    return {
+        "first_spoken_ms": chat_log.first_text * 1000,
+        "final_text_ms": chat_log.final_text_at(response) * 1000,
+        "total_ms": total * 1000,
+    }
+
+
+async def _async_run_scenario(
+    hass: HomeAssistant, scenario: Scenario, args: argparse.Namespace
+) -> dict[str, dict[str, Any]]:
+    behavior = MockBehavior(
+        ttft=args.ttft,
+        tokens_per_second=args.tokens_per_second,
+        reply=ANSWER,
+        script=scenario.script,
+        seed=0,
+    )
+    if scenario.tool_ids is not None:
+        behavior.tool_ids = scenario.tool_ids
+    results: dict[str, dict[str, Any]] = {}
+    async with MockOpenWebUI(behavior) as server, aiohttp.ClientSession() as session:
+        for mode in MODES:
+            agent = await _async_create_agent(
+                hass,
+                session,
+                server.url,
+                streaming=mode == "stream",
+                narrate=args.narrate,
+            )
+            for _ in range(args.warmup):
+                await _async_turn(agent, scenario.utterance)
+            runs = [
+                await _async_turn(agent, scenario.utterance)
+                for _ in range(args.repeat)
+            ]
+            results[mode] = {
+                "runs": len(runs),
+                **{
+                    metric: {
+                        "median": round(median(run[metric] for run in runs), 1),
+                        "max": round(max(run[metric] for run in runs), 1),
+                    }
+                    for metric in METRICS
+                },
+            }
+    return results
+
+
+async def _async_run(args: argparse.Namespace) -> dict[str, Any]:
+    with TemporaryDirectory() as config_dir:
+        hass = await _async_setup_hass(
+            config_dir, args.service_latency, args.report_latency
+        )
+        try:
+            scenarios = {
+                scenario.name: await _async_run_scenario(hass, scenario, args)
+                for scenario in SCENARIOS
+                if not args.scenario or scenario.name in args.scenario
+            }
+        finally:
+            await hass.async_stop(force=True)
+    return {
+        "settings": {
+            "ttft": args.ttft,
+            "tokens_per_second": args.tokens_per_second,
+            "service_latency": args.service_latency,
+            "report_latency": args.report_latency,
+            "narrate": args.narrate,
+            "repeat": args.repeat,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+    slack_ms: float,
+) -> list[dict[str, Any]]:
+    """Return every median that is slower than the baseline allows."""
+    regressions = []
+    for name, modes in results["scenarios"].items():
+        for mode, metrics in modes.items():
+            expected = baseline.get("scenarios", {}).get(name, {}).get(mode)
+            if not expected:
+                continue
+            for metric in METRICS:
+                before = expected[metric]["median"]
+                after = metrics[metric]["median"]
+                if after > before * (1 + tolerance) + slack_ms:
+                    regressions.append(
+                        {
+                            "scenario": name,
+                            "mode": mode,
+                            "metric": metric,
+                            "baseline": before,
+                            "current": after,
+                        }
+                    )
+    return regressions
+
+
+def _print_results(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    print(
+        f"{'scenario':<22}{'mode':<12}"
+        + "".join(f"{metric:>18}" for metric in METRICS)
+    )
+    for name, modes in results["scenarios"].items():
+        for mode, metrics in modes.items():
+            expected = (baseline or {}).get("scenarios", {}).get(name, {}).get(mode)
+            cells = []
+            for metric in METRICS:
+                current = metrics[metric]["median"]
+                cell = f"{current:.1f}"
+                if expected:
+                    cell += f" ({current - expected[metric]['median']:+.1f})"
+                cells.append(f"{cell:>18}")
+            print(f"{name:<22}{mode:<12}" + "".join(cells))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="run only this scenario (repeatable)",
+    )
+    parser.add_argument("--ttft", type=float, default=0.2)
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--service-latency", type=float, default=0.05)
+    parser.add_argument("--report-latency", type=float, default=0.1)
+    parser.add_argument(
+        "--narrate", action="store_true", help="narrate streamed tool progress"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    parser.add_argument("--output", type=Path, help="also write JSON results here")
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const=BASELINE_PATH,
+        type=Path,
+        help="compare with a baseline file (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=BASELINE_PATH,
+        type=Path,
+        help="store these results as the baseline (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed slowdown as a fraction of the baseline median",
+    )
+    parser.add_argument(
+        "--slack-ms",
+        type=float,
+        default=20.0,
+        help="allowed slowdown in milliseconds on top of the tolerance",
+    )
+    args = parser.parse_args()
+    if args.baseline and not args.baseline.is_file():
+        parser.error(
+            f"no baseline at {args.baseline}; create one with --save-baseline"
+        )
+
+    results = asyncio.run(_async_run(args))
+    baseline = (
+        json.loads(args.baseline.read_text(encoding="utf-8"))
+        if args.baseline
+        else None
+    )
+    if baseline is not None:
+        results["regressions"] = compare(
+            results, baseline, args.tolerance, args.slack_ms
+        )
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        stored = {key: results[key] for key in ("settings", "scenarios")}
+        args.save_baseline.write_text(
+            json.dumps(stored, indent=2) + "\n", encoding="utf-8"
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_results(results, baseline)
+        for regression in results.get("regressions", []):
+            print(
+                f"REGRESSION {regression['scenario']}/{regression['mode']} "
+                f"{regression['metric']}: {regression['baseline']:.1f} -> "
+                f"{regression['current']:.1f} ms"
+            )
+    if results.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+"""A local stand-in for OpenWebUI with a simulated model.
+
+Run from the repository root and point the integration (or a benchmark) at
+the printed URL:
+
+    python benchmarks/mock_openwebui.py --ttft 0.35 --tokens-per-second 40
+    python benchmarks/mock_openwebui.py \
+        --script examples/native_multistep_response.json
+
+Serves ``/health``, ``/api/models`` (each model carries
+``info.meta.toolIds``), ``/ollama/api/ps`` and ``/api/chat/completions``,
+streamed as SSE or in one response. Replies are timed from the
+configured time to first token, tokens per second and jitter, so a run with
+a fixed seed is repeatable. Each completion can fail on purpose with an
+HTTP error, a mid-stream stall or a truncated stream.
+
+Scripted rounds decide what the model answers: round ``n`` is used for a
+request with ``n`` assistant messages after the last user message, so a
+tool turn walks through the script without the server keeping state. A round is
+either an OpenAI completion response (such as
+``examples/native_multistep_response.json``) or a short form:
+
+    {"content": "Done.", "tool_calls": [{"name": "control_lights",
+     "arguments": {"names": ["Kitchen"], "state": "on"}}], "format": "native"}
+
+``"format": "json"`` sends the tool calls as a JSON plan in the message
+content instead of native tool calls. Requests past the end of the script
+get the plain ``reply``.
+
+From tests, start it on a free port inside the test's event loop:
+
+    async with MockOpenWebUI(MockBehavior(ttft=0.0)) as server:
+        client = OpenWebUIApiClient(server.url, "key", 10, False, session)
+
+Only aiohttp is needed; Home Assistant is not imported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass, field
+import json
+from pathlib import Path
+import random
+import re
+from time import time
+from typing import Any
+
+from aiohttp import web
+
+DEFAULT_MODEL = "llama3.1:8b"
+DEFAULT_TOOL_ID = "home_assistant_tool"
+ERROR_KINDS = ("status", "stall", "truncate")
+_TOKEN = re.compile(r"\s*\S+\s*|\s+")
+
+
+@dataclass
+class MockBehavior:
+    """How the simulated model answers."""
+
+    # Seconds from receiving the request to the first token.
+    ttft: float = 0.2
+    tokens_per_second: float = 50.0
+    # Each delay is scaled by a random factor in [1 - jitter, 1 + jitter].
+    jitter: float = 0.0
+    # Tokens per SSE event, and SSE events per network write.
+    chunk_tokens: int = 1
+    events_per_write: int = 1
+    # Share of completions that fail, and how.
+    error_rate: float = 0.0
+    error_kind: str = "status"
+    error_status: int = 500
+    stall_seconds: float = 30.0
+    reply: str = "The kitchen light is on."
+    script: list[dict[str, Any]] = field(default_factory=list)
+    models: list[str] = field(default_factory=lambda: [DEFAULT_MODEL])
+    tool_ids: list[str] = field(default_factory=lambda: [DEFAULT_TOOL_ID])
+    seed: int | None = 0
+
+
+@dataclass
+class _Round:
+    content: str = ""
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    format: str = "native"
+
+
+def _round_from_script(entry: dict[str, Any]) -> _Round:
+    if "choices" not in entry:
+        return _Round(
+            content=entry.get("content") or "",
+            tool_calls=[
+                {"name": call["name"], "arguments": call.get("arguments") or {}}
+                for call in entry.get("tool_calls") or []
+            ],
+            format=entry.get("format", "native"),
+        )
+    message = (entry["choices"][0] or {}).get("message") or {}
+    tool_calls = []
+    for call in message.get("tool_calls") or []:
+        function = call.get("function") or {}
+        arguments = function.get("arguments") or {}
+        if isinstance(arguments, str):
+            arguments = json.loads(arguments or "{}")
+        tool_calls.append({"name": function.get("name"), "arguments": arguments})
+    return _Round(content=message.get("content") or "", tool_calls=tool_calls)
+
+
+def load_script(path: str | Path) -> list[dict[str, Any]]:
+    """Read a script file: one round or a list of rounds."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return data if isinstance(data, list) else [data]
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN.findall(text)
+
+
+def _round_index(messages: list[dict[str, Any]]) -> int:
+    # Each earlier round left one assistant message after the user's turn.
+    index = 0
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            break
+        if message.get("role") == "assistant":
+            index += 1
+    return index
+
+
+def _json_plan(tool_calls: list[dict[str, Any]]) -> str:
+    return json.dumps(
+        {
+            "tool_calls": [
+                {
+                    "name": f"{DEFAULT_TOOL_ID}/{call['name']}",
+                    "parameters": call["arguments"],
+                }
+                for call in tool_calls
+            ]
+        }
+    )
+
+
+def _native_calls(tool_calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"call_{index}",
+            "type": "function",
+            "function": {
+                "name": call["name"],
+                "arguments": json.dumps(call["arguments"]),
+            },
+        }
+        for index, call in enumerate(tool_calls)
+    ]
+
+
+class MockOpenWebUI:
+    """An aiohttp application that answers like OpenWebUI and a model."""
+
+    def __init__(self, behavior: MockBehavior | None = None) -> None:
+        """Initialize the server; nothing listens until start()."""
+        self.behavior = behavior or MockBehavior()
+        self.random = random.Random(self.behavior.seed)
+        # Decoded completion request bodies, in arrival order.
+        self.requests: list[dict[str, Any]] = []
+        self.url = ""
+        self.app = web.Application()
+        self.app.router.add_get("/health", self._health)
+        self.app.router.add_get("/api/models", self._models)
+        self.app.router.add_get("/ollama/api/ps", self._running_models)
+        self.app.router.add_post("/api/chat/completions", self._completions)
+        self._runner: web.AppRunner | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Listen on the host and port (0 picks a free one); return the URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def close(self) -> None:
+        """Stop listening."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockOpenWebUI:
+        """Start on a free local port."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        await self.close()
+
+    def _delay(self, seconds: float) -> float:
+        jitter = self.behavior.jitter
+        if not jitter:
+            return seconds
+        return max(0.0, seconds * self.random.uniform(1 - jitter, 1 + jitter))
+
+    def _failure(self) -> str | None:
+        if self.behavior.error_rate and self.random.random() < self.behavior.error_rate:
+            return self.behavior.error_kind
+        return None
+
+    def _round(self, messages: list[dict[str, Any]]) -> _Round:
+        index = _round_index(messages)
+        if index < len(self.behavior.script):
+            return _round_from_script(self.behavior.script[index])
+        return _Round(content=self.behavior.reply)
+
+    def _usage(self, body: dict[str, Any], completion_tokens: int) -> dict[str, Any]:
+        # Roughly four characters per token, like most BPE vocabularies.
+        prompt_tokens = len(json.dumps(body.get("messages", []))) // 4
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    async def _health(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": True})
+
+    async def _models(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "data": [
+                    {
+                        "id": model,
+                        "name": model,
+                        "object": "model",
+                        "info": {"meta": {"toolIds": list(self.behavior.tool_ids)}},
+                    }
+                    for model in self.behavior.models
+                ]
+            }
+        )
+
+    async def _running_models(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"models": [{"name": model} for model in self.behavior.models]}
+        )
+
+    async def _completions(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.requests.append(body)
+        failure = self._failure()
+        if failure == "status":
+            return web.json_response(
+                {"detail": "injected failure"}, status=self.behavior.error_status
+            )
+        scripted = self._round(body.get("messages") or [])
+        content = scripted.content
+        if scripted.tool_calls and scripted.format == "json":
+            content = _json_plan(scripted.tool_calls)
+        tool_calls = scripted.tool_calls if scripted.format != "json" else []
+        if body.get("stream"):
+            return await self._stream(request, body, content, tool_calls, failure)
+        return await self._respond(body, content, tool_calls, failure)
+
+    async def _respond(
+        self,
+        body: dict[str, Any],
+        content: str,
+        tool_calls: list[dict[str, Any]],
+        failure: str | None,
+    ) -> web.Response:
+        tokens = len(_tokens(content)) + sum(
+            len(json.dumps(call["arguments"])) // 4 + 1 for call in tool_calls
+        )
+        await asyncio.sleep(
+            self._delay(self.behavior.ttft)
+            + self._delay(tokens / self.behavior.tokens_per_second)
+        )
+        if failure == "stall":
+            await asyncio.sleep(self.behavior.stall_seconds)
+        if failure == "truncate":
+            # A one-shot reply can't be cut short; answer with no choices.
+            return web.json_response({"id": "chatcmpl-mock", "choices": []})
+        message: dict[str, Any] = {"role": "assistant", "content": content}
+        if tool_calls:
+            message["tool_calls"] = _native_calls(tool_calls)
+        return web.json_response(
+            {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time()),
+                "model": body.get("model"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": message,
+                        "finish_reason": "tool_calls" if tool_calls else "stop",
+                    }
+                ],
+                "usage": self._usage(body, tokens),
+            }
+        )
+
+    async def _stream(
+        self,
+        request: web.Request,
+        body: dict[str, Any],
+        content: str,
+        tool_calls: list[dict[str, Any]],
+        failure: str | None,
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        model = body.get("model")
+        pending: list[bytes] = []
+
+        async def send(
+            delta: dict[str, Any] | None,
+            finish_reason: str | None = None,
+            **extra: Any,
+        ) -> None:
+            chunk: dict[str, Any] = {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": int(time()),
+                "model": model,
+                "choices": (
+                    [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                    if delta is not None
+                    else []
+                ),
+                **extra,
+            }
+            pending.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+            if len(pending) >= self.behavior.events_per_write:
+                await flush()
+
+        async def flush() -> None:
+            if pending:
+                await response.write(b"".join(pending))
+                pending.clear()
+
+        per_token = 1 / self.behavior.tokens_per_second
+        chunk_tokens = max(1, self.behavior.chunk_tokens)
+        await asyncio.sleep(self._delay(self.behavior.ttft))
+        await send({"role": "assistant", "content": ""})
+
+        tokens = _tokens(content)
+        pieces = [
+            "".join(tokens[start : start + chunk_tokens])
+            for start in range(0, len(tokens), chunk_tokens)
+        ]
+        # Injected stream failures strike halfway through the content.
+        fail_at = len(pieces) // 2 if failure else -1
+        for number, piece in enumerate(pieces):
+            if number:
+                await asyncio.sleep(self._delay(per_token * chunk_tokens))
+            if number == fail_at:
+                await flush()
+                if failure == "truncate":
+                    return response
+                await asyncio.sleep(self.behavior.stall_seconds)
+            await send({"content": piece})
+        if failure and not pieces:
+            await flush()
+            if failure == "truncate":
+                return response
+            await asyncio.sleep(self.behavior.stall_seconds)
+        completion_tokens = len(tokens)
+
+        for index, call in enumerate(tool_calls):
+            arguments = json.dumps(call["arguments"])
+            await send(
+                {
+                    "tool_calls": [
+                        {
+                            "index": index,
+                            "id": f"call_{index}",
+                            "type": "function",
+                            "function": {"name": call["name"], "arguments": ""},
+                        }
+                    ]
+                }
+            )
+            # Arguments arrive in a few fragments, as real models send them.
+            step = max(1, len(arguments) // 3)
+            for start in range(0, len(arguments), step):
+                await asyncio.sleep(self._delay(per_token * chunk_tokens))
+                await send(
+                    {
+                        "tool_calls": [
+                            {
+                                "index": index,
+                                "function": {
+                                    "arguments": arguments[start : start + step]
+                                },
+                            }
+                        ]
+                    }
+                )
+            completion_tokens += len(arguments) // 4 + 1
+
+        await send({}, "tool_calls" if tool_calls else "stop")
+        if (body.get("stream_options") or {}).get("include_usage"):
+            await send(None, usage=self._usage(body, completion_tokens))
+        pending.append(b"data: [DONE]\n\n")
+        await flush()
+        await response.write_eof()
+        return response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--ttft", type=float, default=MockBehavior.ttft)
+    parser.add_argument(
+        "--tokens-per-second", type=float, default=MockBehavior.tokens_per_second
+    )
+    parser.add_argument("--jitter", type=float, default=MockBehavior.jitter)
+    parser.add_argument("--chunk-tokens", type=int, default=MockBehavior.chunk_tokens)
+    parser.add_argument(
+        "--events-per-write", type=int, default=MockBehavior.events_per_write
+    )
+    parser.add_argument("--error-rate", type=float, default=MockBehavior.error_rate)
+    parser.add_argument(
+        "--error-kind", choices=ERROR_KINDS, default=MockBehavior.error_kind
+    )
+    parser.add_argument(
+        "--error-status", type=int, default=MockBehavior.error_status
+    )
+    parser.add_argument(
+        "--stall-seconds", type=float, default=MockBehavior.stall_seconds
+    )
+    parser.add_argument("--reply", default=MockBehavior.reply)
+    parser.add_argument("--script", help="JSON file with one round or a list")
+    parser.add_argument("--model", action="append", dest="models")
+    parser.add_argument("--tool-id", action="append", dest="tool_ids")
+    parser.add_argument("--seed", type=int, default=MockBehavior.seed)
+    args = parser.parse_args()
+
+    behavior = MockBehavior(
+        ttft=args.ttft,
+        tokens_per_second=args.tokens_per_second,
+        jitter=args.jitter,
+        chunk_tokens=args.chunk_tokens,
+        events_per_write=args.events_per_write,
+        error_rate=args.error_rate,
+        error_kind=args.error_kind,
+        error_status=args.error_status,
+        stall_seconds=args.stall_seconds,
+        reply=args.reply,
+        script=load_script(args.script) if args.script else [],
+        models=args.models or [DEFAULT_MODEL],
+        tool_ids=args.tool_ids or [DEFAULT_TOOL_ID],
+        seed=args.seed,
+    )
+
+    async def serve() -> None:
+        server = MockOpenWebUI(behavior)
+        url = await server.start(args.host, args.port)
+        print(f"Mock OpenWebUI listening on {url}")
+        print(json.dumps(asdict(behavior), indent=2))
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import aiohttp
+from aiohttp.hdrs import USER_AGENT
+
 from homeassistant.components import conversation as haconversation
 from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context, get_default_no_verify_context
 
+from .alias_overrides import async_release_alias_overrides, async_setup_alias_overrides
 from .api import OpenWebUIApiClient
 from .const import (
     DOMAIN,
@@ -15,31 +20,89 @@ from .const import (
     CONF_API_KEY,
     CONF_TIMEOUT,
     CONF_VERIFY_SSL,
+    CONF_CONNECT_TIMEOUT,
+    CONF_FIRST_BYTE_TIMEOUT,
+    CONF_FIRST_TOKEN_TIMEOUT,
+    CONF_CHUNK_TIMEOUT,
     DEFAULT_TIMEOUT,
     DEFAULT_VERIFY_SSL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_FIRST_BYTE_TIMEOUT,
+    DEFAULT_FIRST_TOKEN_TIMEOUT,
+    DEFAULT_CHUNK_TIMEOUT,
 )
 from .conversation import OpenWebUIAgent
 from .coordinator import OpenWebUIDataUpdateCoordinator
+from .entity_index import async_release_entity_index, async_setup_entity_index
 from .exceptions import ApiClientError
+from .fast_path import async_release_fast_path, async_setup_fast_path
+from .plan_cache import async_release_plan_cache, async_setup_plan_cache
+from .response_cache import async_release_response_cache, async_setup_response_cache
 
-PLATFORMS = (Platform.CONVERSATION,)
+PLATFORMS = (Platform.BINARY_SENSOR, Platform.CONVERSATION, Platform.SENSOR)
 
+# Connection pool for the entry's dedicated session. Voice turns are short and
+# minutes apart, so keep idle connections around long enough to be reused and
+# cache DNS instead of resolving on every turn.
+CONNECTION_LIMIT = 10
+CONNECTION_LIMIT_PER_HOST = 4
+KEEPALIVE_TIMEOUT_SECONDS = 120
+DNS_CACHE_TTL_SECONDS = 300
 
-# https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up OpenWebUI conversation using UI."""
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = entry
-    client = OpenWebUIApiClient(
+
+@callback
+def _async_create_client(hass: HomeAssistant, entry: ConfigEntry) -> OpenWebUIApiClient:
+    """Return an API client with its own connection pool for this entry."""
+    verify_ssl = entry.options.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+        ssl=client_context() if verify_ssl else get_default_no_verify_context(),
+        enable_cleanup_closed=True,
+    )
+    session = aiohttp.ClientSession(
+        connector=connector, headers={USER_AGENT: SERVER_SOFTWARE}
+    )
+    return OpenWebUIApiClient(
         base_url=entry.data[CONF_BASE_URL],
         api_key=entry.data[CONF_API_KEY],
         timeout=entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
-        session=async_get_clientsession(hass),
-        verify_ssl=entry.options.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+        session=session,
+        verify_ssl=verify_ssl,
+        connect_timeout=entry.options.get(
+            CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
+        ),
+        first_byte_timeout=entry.options.get(
+            CONF_FIRST_BYTE_TIMEOUT, DEFAULT_FIRST_BYTE_TIMEOUT
+        ),
+        first_token_timeout=entry.options.get(
+            CONF_FIRST_TOKEN_TIMEOUT, DEFAULT_FIRST_TOKEN_TIMEOUT
+        ),
+        chunk_timeout=entry.options.get(CONF_CHUNK_TIMEOUT, DEFAULT_CHUNK_TIMEOUT),
+        owns_session=True,
     )
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator = OpenWebUIDataUpdateCoordinator(
+
+# https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up OpenWebUI conversation using UI."""
+    client = _async_create_client(hass, entry)
+    entry.async_on_unload(client.async_close)
+
+    async def _async_close_client(_event: Event) -> None:
+        await client.async_close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    )
+
+    coordinator = OpenWebUIDataUpdateCoordinator(
         hass,
         client,
+        entry,
     )
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     await coordinator.async_config_entry_first_refresh()
@@ -51,6 +114,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except ApiClientError as err:
         raise ConfigEntryNotReady(err) from err
 
+    # Only published once the server answered: a failed attempt closes the
+    # client, and nothing may keep a coordinator around that still uses it.
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    async_setup_entity_index(hass)
+    entry.async_on_unload(lambda: async_release_entity_index(hass))
+    async_setup_alias_overrides(hass, entry)
+    entry.async_on_unload(lambda: async_release_alias_overrides(hass, entry))
+    async_setup_response_cache(hass, entry)
+    entry.async_on_unload(lambda: async_release_response_cache(hass, entry))
+    async_setup_plan_cache(hass, entry)
+    entry.async_on_unload(lambda: async_release_plan_cache(hass, entry))
+    async_setup_fast_path(hass, entry)
+    entry.async_on_unload(lambda: async_release_fast_path(hass, entry))
+
     haconversation.async_set_agent(hass, entry, OpenWebUIAgent(hass, entry))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
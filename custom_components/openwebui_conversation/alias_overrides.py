@@ -0,0 +1,173 @@
+"""Compiled local alias overrides (``name -> entity_id`` layout lines)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+import re
+from time import monotonic, time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_LOCAL_ALIAS_OVERRIDES,
+    DEFAULT_LOCAL_ALIAS_OVERRIDES,
+    DOMAIN,
+    LOGGER,
+)
+from .entity_index import lookup_key
+
+DATA_ALIAS_OVERRIDES = f"{DOMAIN}_alias_overrides"
+
+_HOME_LAYOUT_LINE = re.compile(
+    r"^\s*[-*]?\s*(?P<name>.+?)\s*(?:->|→)\s*(?P<entity_id>[a-z0-9_]+\.[a-z0-9_]+)\s*$",
+    re.IGNORECASE,
+)
+
+
+def _clean_layout_name(value: str) -> str:
+    text = value.strip()
+    text = re.sub(r"`", "", text)
+    text = re.sub(r"\*\*", "", text)
+    text = re.sub(r"\*", "", text)
+    text = re.sub(r"^[-:\s]+", "", text)
+    text = re.sub(r"[:\s]+$", "", text)
+    return text.strip()
+
+
+def _alias_keys(name: str) -> set[str]:
+    text = re.sub(r"\s+", " ", name.casefold()).strip()
+    normalized = text.replace("_", " ").replace("-", " ")
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    return {
+        name,
+        text,
+        normalized,
+        re.sub(r"^the\s+", "", normalized),
+    }
+
+
+class AliasOverrides(Mapping[str, str]):
+    """Alias overrides parsed once into a flat ``key -> entity_id`` table.
+
+    Every ``_alias_keys`` variant and its ``lookup_key`` form is stored up
+    front, so resolving a spoken name is a couple of dict lookups. Entity ids
+    are not checked at compile time (entities may load after the entry); they
+    are validated lazily against the state machine on resolution and the
+    outcome is kept for diagnostics.
+    """
+
+    def __init__(self, content: str = "") -> None:
+        """Parse the overrides text."""
+        started = monotonic()
+        self._aliases: dict[str, str] = {}
+        self.lines = 0
+        self.parsed_lines = 0
+        self.ignored_lines = 0
+        self.resolutions = 0
+        self._missing: set[str] = set()
+        self._seen: set[str] = set()
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            self.lines += 1
+            matched = _HOME_LAYOUT_LINE.match(line)
+            if not matched:
+                self.ignored_lines += 1
+                continue
+            name = _clean_layout_name(matched.group("name"))
+            entity_id = matched.group("entity_id").strip().lower()
+            if not name:
+                self.ignored_lines += 1
+                continue
+            self.parsed_lines += 1
+            for key in _alias_keys(name):
+                if key:
+                    self._aliases[key] = entity_id
+                    if lookup := lookup_key(key):
+                        self._aliases.setdefault(lookup, entity_id)
+        self.entity_ids = frozenset(self._aliases.values())
+        self.compiled_at = time()
+        self.compile_seconds = monotonic() - started
+
+    def __getitem__(self, key: str) -> str:
+        """Return the entity id for an exact key."""
+        return self._aliases[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the alias keys."""
+        return iter(self._aliases)
+
+    def __len__(self) -> int:
+        """Return the number of alias keys."""
+        return len(self._aliases)
+
+    def lookup(self, text: str) -> str | None:
+        """Return the entity id a spoken name maps to, if any."""
+        return (
+            self._aliases.get(text)
+            or self._aliases.get(text.casefold())
+            or self._aliases.get(lookup_key(text))
+        )
+
+    @callback
+    def async_resolve(self, hass: HomeAssistant, text: str) -> str | None:
+        """Return the mapped entity id if it currently exists in Home Assistant."""
+        entity_id = self.lookup(text)
+        if entity_id is None:
+            return None
+        self.resolutions += 1
+        self._seen.add(entity_id)
+        if hass.states.get(entity_id) is None:
+            LOGGER.debug("Alias override %r maps to missing entity %r", text, entity_id)
+            self._missing.add(entity_id)
+            return None
+        self._missing.discard(entity_id)
+        return entity_id
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return parse and validation statistics."""
+        return {
+            "lines": self.lines,
+            "parsed_lines": self.parsed_lines,
+            "ignored_lines": self.ignored_lines,
+            "keys": len(self._aliases),
+            "entity_ids": len(self.entity_ids),
+            "compiled_at": self.compiled_at,
+            "compile_seconds": self.compile_seconds,
+            "resolutions": self.resolutions,
+            "validated_entity_ids": len(self._seen),
+            "missing_entity_ids": sorted(self._missing),
+        }
+
+
+@callback
+def async_setup_alias_overrides(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> AliasOverrides:
+    """Compile the entry's alias overrides and keep them for its lifetime."""
+    overrides = AliasOverrides(
+        entry.options.get(CONF_LOCAL_ALIAS_OVERRIDES, DEFAULT_LOCAL_ALIAS_OVERRIDES)
+    )
+    hass.data.setdefault(DATA_ALIAS_OVERRIDES, {})[entry.entry_id] = overrides
+    return overrides
+
+
+@callback
+def async_get_alias_overrides(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> AliasOverrides:
+    """Return the compiled alias overrides for an entry."""
+    overrides: AliasOverrides | None = hass.data.get(DATA_ALIAS_OVERRIDES, {}).get(
+        entry.entry_id
+    )
+    if overrides is None:
+        return async_setup_alias_overrides(hass, entry)
+    return overrides
+
+
+@callback
+def async_release_alias_overrides(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the entry's compiled alias overrides."""
+    hass.data.get(DATA_ALIAS_OVERRIDES, {}).pop(entry.entry_id, None)
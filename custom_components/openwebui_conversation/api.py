@@ -4,13 +4,70 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncGenerator
-import json
 import socket
+from time import monotonic, time
+from typing import Any
 
 import aiohttp
 import async_timeout
 
-from .exceptions import ApiClientError, ApiCommError, ApiJsonError, ApiTimeoutError
+from .codec import JSONDecodeError, json_bytes, json_loads
+from .exceptions import (
+    ApiChunkTimeoutError,
+    ApiClientError,
+    ApiCommError,
+    ApiConnectTimeoutError,
+    ApiFirstByteTimeoutError,
+    ApiFirstTokenTimeoutError,
+    ApiJsonError,
+    ApiTimeoutError,
+)
+from .latency import record_phase, record_usage, timed
+from .sse import DEFAULT_EVENT, SSEFrame, SSEFramer
+
+_STREAM_DONE = object()
+
+
+def _encode_body(data: dict | bytes | None) -> bytes | None:
+    """Return a request body, encoding payload dicts with the shared codec."""
+    if data is None or isinstance(data, bytes):
+        return data
+    return json_bytes(data)
+
+
+_STREAM_TIMEOUT_MESSAGES: dict[type[ApiTimeoutError], str] = {
+    ApiFirstByteTimeoutError: (
+        "the server did not start responding within {0.first_byte_timeout}s"
+    ),
+    ApiFirstTokenTimeoutError: (
+        "the model produced no output within {0.first_token_timeout}s"
+    ),
+    ApiChunkTimeoutError: "the stream stalled for more than {0.chunk_timeout}s",
+}
+
+
+def _has_token(payload: dict) -> bool:
+    """Return True if a completion chunk carries content or a tool call."""
+    for choice in payload.get("choices") or ():
+        delta = (choice or {}).get("delta") or (choice or {}).get("message") or {}
+        if delta.get("content") or delta.get("tool_calls"):
+            return True
+    return False
+
+
+def _decode_stream_frame(frame: SSEFrame) -> dict | object | None:
+    """Decode one completion event, or return _STREAM_DONE at the end marker."""
+    data = frame.data
+    if len(data) < 16 and data.strip() == b"[DONE]":
+        return _STREAM_DONE
+    if frame.event == "error":
+        raise ApiJsonError(data.decode("utf-8", errors="replace"))
+    if frame.event != DEFAULT_EVENT:
+        return None
+    try:
+        return json_loads(data)
+    except JSONDecodeError as err:
+        raise ApiJsonError(f"invalid JSON in stream event: {data[:200]!r}") from err
 
 
 class OpenWebUIApiClient:
@@ -23,13 +80,81 @@ class OpenWebUIApiClient:
         timeout: int,
         verify_ssl: bool,
         session: aiohttp.ClientSession,
+        *,
+        connect_timeout: float | None = None,
+        first_byte_timeout: float | None = None,
+        first_token_timeout: float | None = None,
+        chunk_timeout: float | None = None,
+        owns_session: bool = False,
     ) -> None:
         """Sample API Client."""
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self.timeout = timeout
+        # Streaming phase deadlines; unset ones fall back to the API timeout.
+        self.connect_timeout = connect_timeout or timeout
+        self.first_byte_timeout = first_byte_timeout or timeout
+        self.first_token_timeout = first_token_timeout or timeout
+        self.chunk_timeout = chunk_timeout or timeout
         self._verify_ssl = verify_ssl
         self._session = session
+        self._owns_session = owns_session
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_error: str | None = None
+        self.last_error_at: float | None = None
+        self.last_success_at: float | None = None
+
+    def _succeeded(self) -> None:
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.last_success_at = time()
+
+    def _failed(
+        self,
+        err: ApiClientError,
+        response: aiohttp.ClientResponse | None = None,
+    ) -> ApiClientError:
+        if response is not None:
+            err.status = response.status
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = f"{type(err).__name__}: {err}"
+        self.last_error_at = time()
+        return err
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return request outcomes, timeouts and connection pool limits."""
+        connector = self._session.connector
+        pool: dict[str, Any] = {"closed": self._session.closed}
+        if connector is not None:
+            pool |= {
+                "limit": connector.limit,
+                "limit_per_host": connector.limit_per_host,
+            }
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+            "last_error_at": self.last_error_at,
+            "last_success_at": self.last_success_at,
+            "timeouts": {
+                "total": self.timeout,
+                "connect": self.connect_timeout,
+                "first_byte": self.first_byte_timeout,
+                "first_token": self.first_token_timeout,
+                "chunk": self.chunk_timeout,
+            },
+            "pool": pool,
+        }
+
+    async def async_close(self) -> None:
+        """Close the session (and its connection pool) if this client owns it."""
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
 
     async def async_get_heartbeat(self) -> bool:
         """Get heartbeat from the API."""
@@ -48,28 +173,76 @@ class OpenWebUIApiClient:
         )
         return response.get("data", [])
 
-    async def async_generate(
-        self,
-        data: dict | None = None,
-    ) -> any:
-        """Generate a completion from the API."""
-        return await self._api_wrapper(
-            method="post",
-            url=f"{self._base_url}/api/chat/completions",
-            data=data,
+    async def async_get_running_models(self) -> list[str]:
+        """Get the models the Ollama backend currently holds in memory."""
+        response = await self._api_wrapper(
+            method="get",
+            url=f"{self._base_url}/ollama/api/ps",
             headers={
                 "Content-type": "application/json; charset=UTF-8",
                 "Authorization": f"Bearer {self._api_key}",
             },
         )
+        return [
+            str(model.get("name") or model.get("model"))
+            for model in response.get("models", [])
+            if isinstance(model, dict)
+        ]
+
+    async def async_generate(
+        self,
+        data: dict | bytes | None = None,
+    ) -> any:
+        """Generate a completion from the API.
+
+        The whole round trip counts as the turn's generation phase, and the
+        response's usage block is added to the turn.
+        """
+        started = monotonic()
+        with timed("generation"):
+            response = await self._api_wrapper(
+                method="post",
+                url=f"{self._base_url}/api/chat/completions",
+                data=data,
+                headers={
+                    "Content-type": "application/json; charset=UTF-8",
+                    "Authorization": f"Bearer {self._api_key}",
+                },
+            )
+        if isinstance(response, dict):
+            record_usage(response.get("usage"), monotonic() - started)
+        return response
 
     async def async_generate_stream(
         self,
-        data: dict | None = None,
+        data: dict | bytes | None = None,
     ) -> AsyncGenerator[dict, None]:
-        """Generate a streamed completion from the API."""
+        """Generate a streamed completion from the API.
+
+        ``data`` may be a payload dict or an already encoded JSON body.
+
+        Instead of one deadline for the whole answer, each phase of the
+        stream has its own: connecting, the first response bytes (counted
+        from sending the request), the first content or tool-call token and
+        then the gap between chunks. Time spent by the caller between
+        yielded chunks does not count against any of them. A stalled phase
+        raises the matching ApiTimeoutError subclass.
+
+        The turn's connect phase runs until the response headers arrive,
+        first_token until the first content or tool-call token and
+        generation from there to the end of the stream. A usage block,
+        which backends send on the last chunk when asked for it with
+        ``stream_options.include_usage``, is added to the turn.
+        """
+        loop = asyncio.get_running_loop()
+        phase = ApiFirstByteTimeoutError
+        mark = monotonic()
+        response: aiohttp.ClientResponse | None = None
         try:
-            async with async_timeout.timeout(self.timeout):
+            async with asyncio.timeout(None) as deadline:
+                deadline.reschedule(
+                    loop.time() + self.connect_timeout + self.first_byte_timeout
+                )
                 response = await self._session.request(
                     method="post",
                     url=f"{self._base_url}/api/chat/completions",
@@ -77,88 +250,128 @@ class OpenWebUIApiClient:
                         "Content-type": "application/json; charset=UTF-8",
                         "Authorization": f"Bearer {self._api_key}",
                     },
-                    json=data,
+                    data=_encode_body(data),
                     verify_ssl=self._verify_ssl,
+                    timeout=aiohttp.ClientTimeout(
+                        total=None, sock_connect=self.connect_timeout
+                    ),
                 )
 
                 if response.status == 404:
-                    error_json = await response.json()
+                    error_json = json_loads(await response.read())
                     raise ApiJsonError(error_json["error"])
 
                 response.raise_for_status()
+                record_phase("connect", monotonic() - mark)
+                mark = monotonic()
 
-                pending_data: list[str] = []
-                async for raw_line in response.content:
-                    line = raw_line.decode("utf-8", errors="ignore").rstrip("\r\n")
-                    if not line:
-                        payload = "\n".join(pending_data).strip()
-                        pending_data.clear()
-                        if not payload:
-                            continue
-                        if payload == "[DONE]":
-                            break
-                        try:
-                            yield json.loads(payload)
-                        except json.JSONDecodeError:
+                framer = SSEFramer()
+                first_token_deadline = 0.0
+                async for chunk in response.content.iter_any():
+                    deadline.reschedule(None)
+                    if phase is ApiFirstByteTimeoutError:
+                        phase = ApiFirstTokenTimeoutError
+                        first_token_deadline = loop.time() + self.first_token_timeout
+                    for frame in framer.feed(chunk):
+                        if (payload := _decode_stream_frame(frame)) is _STREAM_DONE:
+                            self._succeeded()
+                            return
+                        if payload is None:
                             continue
-                        continue
-
-                    if line.startswith(":"):
-                        continue
-
-                    if line.startswith("data:"):
-                        pending_data.append(line[5:].lstrip())
-                    else:
-                        pending_data.append(line)
-
-                payload = "\n".join(pending_data).strip()
-                if payload and payload != "[DONE]":
-                    try:
-                        yield json.loads(payload)
-                    except json.JSONDecodeError:
-                        return
+                        if usage := payload.get("usage"):
+                            record_usage(
+                                usage,
+                                monotonic() - mark
+                                if phase is ApiChunkTimeoutError
+                                else None,
+                            )
+                        if phase is ApiFirstTokenTimeoutError and _has_token(payload):
+                            phase = ApiChunkTimeoutError
+                            record_phase("first_token", monotonic() - mark)
+                            mark = monotonic()
+                        yield payload
+                    deadline.reschedule(
+                        loop.time() + self.chunk_timeout
+                        if phase is ApiChunkTimeoutError
+                        else first_token_deadline
+                    )
+                deadline.reschedule(None)
+                if (frame := framer.flush()) is not None:
+                    payload = _decode_stream_frame(frame)
+                    if payload is not None and payload is not _STREAM_DONE:
+                        record_usage(payload.get("usage"))
+                        yield payload
+                self._succeeded()
         except ApiJsonError as e:
-            raise e
+            raise self._failed(e)
+        except aiohttp.ConnectionTimeoutError as e:
+            raise self._failed(
+                ApiConnectTimeoutError(
+                    f"could not connect to the server within {self.connect_timeout}s"
+                )
+            ) from e
         except asyncio.TimeoutError as e:
-            raise ApiTimeoutError("timeout while talking to the server") from e
+            raise self._failed(
+                phase(_STREAM_TIMEOUT_MESSAGES[phase].format(self))
+            ) from e
         except (aiohttp.ClientError, socket.gaierror) as e:
-            raise ApiCommError("unknown error while talking to the server") from e
+            raise self._failed(
+                ApiCommError("unknown error while talking to the server")
+            ) from e
         except Exception as e:  # pylint: disable=broad-except
-            raise ApiClientError("something really went wrong!") from e
+            raise self._failed(ApiClientError("something really went wrong!")) from e
+        finally:
+            if phase is ApiChunkTimeoutError:
+                record_phase("generation", monotonic() - mark)
+            # Hand the connection back (or close it mid-stream) now rather
+            # than when the response is garbage collected; the entry's pool
+            # only has a few per host.
+            if response is not None:
+                response.release()
 
     async def _api_wrapper(
         self,
         method: str,
         url: str,
-        data: dict | None = None,
+        data: dict | bytes | None = None,
         headers: dict | None = None,
         decode_json: bool = True,
     ) -> any:
         """Get information from the API."""
+        response: aiohttp.ClientResponse | None = None
         try:
             async with async_timeout.timeout(self.timeout):
                 response = await self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
-                    json=data,
+                    data=_encode_body(data),
                     verify_ssl=self._verify_ssl,
                 )
 
                 if response.status == 404 and decode_json:
-                    json = await response.json()
-                    raise ApiJsonError(json["error"])
+                    error_json = json_loads(await response.read())
+                    raise ApiJsonError(error_json["error"])
 
                 response.raise_for_status()
 
                 if decode_json:
-                    return await response.json()
-                return await response.text()
+                    result = json_loads(await response.read())
+                else:
+                    result = await response.text()
         except ApiJsonError as e:
-            raise e
+            raise self._failed(e, response)
         except asyncio.TimeoutError as e:
-            raise ApiTimeoutError("timeout while talking to the server") from e
+            raise self._failed(
+                ApiTimeoutError("timeout while talking to the server")
+            ) from e
         except (aiohttp.ClientError, socket.gaierror) as e:
-            raise ApiCommError("unknown error while talking to the server") from e
+            raise self._failed(
+                ApiCommError("unknown error while talking to the server"), response
+            ) from e
         except Exception as e:  # pylint: disable=broad-except
-            raise ApiClientError("something really went wrong!") from e
+            raise self._failed(
+                ApiClientError("something really went wrong!"), response
+            ) from e
+        self._succeeded()
+        return result
@@ -0,0 +1,50 @@
+"""Binary sensor platform for openwebui_conversation."""
+
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import OpenWebUIDataUpdateCoordinator
+from .entity import OpenWebUIEntity
+
+MODEL_LOADED = BinarySensorEntityDescription(
+    key="model_loaded",
+    translation_key="model_loaded",
+    name="Model loaded",
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the binary sensor platform."""
+    coordinator: OpenWebUIDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([OpenWebUIModelLoadedSensor(coordinator, entry)])
+
+
+class OpenWebUIModelLoadedSensor(OpenWebUIEntity, BinarySensorEntity):
+    """Whether the chat model is loaded on the backend."""
+
+    def __init__(
+        self, coordinator: OpenWebUIDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, MODEL_LOADED)
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the model is loaded, None if the backend can't tell."""
+        return self.coordinator.keep_alive.model_loaded
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str]:
+        """Return the model and keep-alive policy."""
+        keep_alive = self.coordinator.keep_alive
+        return {"model": keep_alive.model, "policy": keep_alive.policy}
@@ -0,0 +1,96 @@
+"""JSON codec shared by the API client, stream parsing and tool execution.
+
+orjson is used when it is importable (Home Assistant ships it); otherwise the
+stdlib ``json`` module is used with matching behaviour for our payloads.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError.
+JSONDecodeError = ValueError
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+
+    def json_loads(data: bytes | bytearray | str) -> Any:
+        """Decode JSON from bytes or text."""
+        return orjson.loads(data)
+
+    def json_bytes(value: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON bytes."""
+        return orjson.dumps(value)
+
+    def json_dumps(value: Any) -> str:
+        """Encode a value as compact JSON text."""
+        return orjson.dumps(value).decode("utf-8")
+
+else:
+    JSON_BACKEND = "json"
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def json_loads(data: bytes | bytearray | str) -> Any:
+        """Decode JSON from bytes or text."""
+        if not isinstance(data, str):
+            # The stdlib decoder is faster on str than on bytes input.
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+    def json_bytes(value: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON bytes."""
+        return _encoder.encode(value).encode("utf-8")
+
+    def json_dumps(value: Any) -> str:
+        """Encode a value as compact JSON text."""
+        return _encoder.encode(value)
+
+
+class RequestEncoder:
+    """Encode chat request bodies, reusing encoded messages between rounds.
+
+    Tool follow-up rounds resend the whole conversation with a few messages
+    appended. Messages are treated as immutable once sent: each one is
+    encoded the first time it appears and its bytes are reused while the
+    same message object stays at the same position, so a round only pays
+    for the messages it added plus the small top-level fields.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the encoder."""
+        self._messages: list[tuple[Any, bytes]] = []
+        self.encoded_messages = 0
+        self.reused_messages = 0
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        """Return the JSON body for a chat completion payload."""
+        messages = payload.get("messages")
+        if not isinstance(messages, list):
+            return json_bytes(payload)
+        cache = self._messages
+        parts: list[bytes] = []
+        for position, message in enumerate(messages):
+            if position < len(cache) and cache[position][0] is message:
+                parts.append(cache[position][1])
+                self.reused_messages += 1
+                continue
+            del cache[position:]
+            encoded = json_bytes(message)
+            cache.append((message, encoded))
+            parts.append(encoded)
+            self.encoded_messages += 1
+        del cache[len(messages) :]
+
+        head = json_bytes(
+            {key: value for key, value in payload.items() if key != "messages"}
+        )
+        separator = b"," if len(head) > 2 else b""
+        return b"".join(
+            (head[:-1], separator, b'"messages":[', b",".join(parts), b"]}")
+        )
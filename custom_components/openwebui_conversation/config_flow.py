@@ -11,7 +11,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     BooleanSelector,
     BooleanSelectorConfig,
@@ -23,6 +23,7 @@ from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
+    TimeSelector,
 )
 
 from .api import OpenWebUIApiClient
@@ -45,6 +46,26 @@ from .const import (
     CONF_NARRATE_STREAMING_PROGRESS,
     CONF_SHOW_DEBUG_BUBBLES,
     CONF_LOCAL_ALIAS_OVERRIDES,
+    CONF_STATE_VERIFY_TIMEOUT,
+    CONF_CONNECT_TIMEOUT,
+    CONF_FIRST_BYTE_TIMEOUT,
+    CONF_FIRST_TOKEN_TIMEOUT,
+    CONF_CHUNK_TIMEOUT,
+    CONF_KEEP_ALIVE_POLICY,
+    CONF_KEEP_ALIVE_START,
+    CONF_KEEP_ALIVE_END,
+    CONF_KEEP_ALIVE_IDLE_MINUTES,
+    CONF_RESPONSE_CACHE_ENABLED,
+    CONF_RESPONSE_CACHE_TTL,
+    CONF_RESPONSE_CACHE_SIZE,
+    CONF_PLAN_CACHE_ENABLED,
+    CONF_PLAN_CACHE_TTL,
+    CONF_PLAN_CACHE_SIZE,
+    CONF_PLAN_CACHE_MIN_CONFIDENCE,
+    CONF_FAST_PATH_ENABLED,
+    CONF_SKIP_TOOL_FOLLOW_UP,
+    CONF_PROMPT_TOKEN_BUDGET,
+    KEEP_ALIVE_POLICIES,
     DEFAULT_SERVICE_NAME,
     DEFAULT_BASE_URL,
     DEFAULT_TIMEOUT,
@@ -59,6 +80,25 @@ from .const import (
     DEFAULT_NARRATE_STREAMING_PROGRESS,
     DEFAULT_SHOW_DEBUG_BUBBLES,
     DEFAULT_LOCAL_ALIAS_OVERRIDES,
+    DEFAULT_STATE_VERIFY_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_FIRST_BYTE_TIMEOUT,
+    DEFAULT_FIRST_TOKEN_TIMEOUT,
+    DEFAULT_CHUNK_TIMEOUT,
+    DEFAULT_KEEP_ALIVE_POLICY,
+    DEFAULT_KEEP_ALIVE_START,
+    DEFAULT_KEEP_ALIVE_END,
+    DEFAULT_KEEP_ALIVE_IDLE_MINUTES,
+    DEFAULT_RESPONSE_CACHE_ENABLED,
+    DEFAULT_RESPONSE_CACHE_TTL,
+    DEFAULT_RESPONSE_CACHE_SIZE,
+    DEFAULT_PLAN_CACHE_ENABLED,
+    DEFAULT_PLAN_CACHE_TTL,
+    DEFAULT_PLAN_CACHE_SIZE,
+    DEFAULT_PLAN_CACHE_MIN_CONFIDENCE,
+    DEFAULT_FAST_PATH_ENABLED,
+    DEFAULT_SKIP_TOOL_FOLLOW_UP,
+    DEFAULT_PROMPT_TOKEN_BUDGET,
 )
 from .exceptions import ApiClientError, ApiCommError, ApiTimeoutError
 
@@ -89,6 +129,25 @@ DEFAULT_OPTIONS = types.MappingProxyType(
         CONF_NARRATE_STREAMING_PROGRESS: DEFAULT_NARRATE_STREAMING_PROGRESS,
         CONF_SHOW_DEBUG_BUBBLES: DEFAULT_SHOW_DEBUG_BUBBLES,
         CONF_LOCAL_ALIAS_OVERRIDES: DEFAULT_LOCAL_ALIAS_OVERRIDES,
+        CONF_STATE_VERIFY_TIMEOUT: DEFAULT_STATE_VERIFY_TIMEOUT,
+        CONF_CONNECT_TIMEOUT: DEFAULT_CONNECT_TIMEOUT,
+        CONF_FIRST_BYTE_TIMEOUT: DEFAULT_FIRST_BYTE_TIMEOUT,
+        CONF_FIRST_TOKEN_TIMEOUT: DEFAULT_FIRST_TOKEN_TIMEOUT,
+        CONF_CHUNK_TIMEOUT: DEFAULT_CHUNK_TIMEOUT,
+        CONF_KEEP_ALIVE_POLICY: DEFAULT_KEEP_ALIVE_POLICY,
+        CONF_KEEP_ALIVE_START: DEFAULT_KEEP_ALIVE_START,
+        CONF_KEEP_ALIVE_END: DEFAULT_KEEP_ALIVE_END,
+        CONF_KEEP_ALIVE_IDLE_MINUTES: DEFAULT_KEEP_ALIVE_IDLE_MINUTES,
+        CONF_RESPONSE_CACHE_ENABLED: DEFAULT_RESPONSE_CACHE_ENABLED,
+        CONF_RESPONSE_CACHE_TTL: DEFAULT_RESPONSE_CACHE_TTL,
+        CONF_RESPONSE_CACHE_SIZE: DEFAULT_RESPONSE_CACHE_SIZE,
+        CONF_PLAN_CACHE_ENABLED: DEFAULT_PLAN_CACHE_ENABLED,
+        CONF_PLAN_CACHE_TTL: DEFAULT_PLAN_CACHE_TTL,
+        CONF_PLAN_CACHE_SIZE: DEFAULT_PLAN_CACHE_SIZE,
+        CONF_PLAN_CACHE_MIN_CONFIDENCE: DEFAULT_PLAN_CACHE_MIN_CONFIDENCE,
+        CONF_FAST_PATH_ENABLED: DEFAULT_FAST_PATH_ENABLED,
+        CONF_SKIP_TOOL_FOLLOW_UP: DEFAULT_SKIP_TOOL_FOLLOW_UP,
+        CONF_PROMPT_TOKEN_BUDGET: DEFAULT_PROMPT_TOKEN_BUDGET,
     }
 )
 
@@ -121,7 +180,7 @@ class OpenWebUIConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 base_url=cv.url_no_path(user_input[CONF_BASE_URL]),
                 api_key=user_input[CONF_API_KEY],
                 timeout=user_input[CONF_TIMEOUT],
-                session=async_create_clientsession(self.hass),
+                session=async_get_clientsession(self.hass),
                 verify_ssl=user_input[CONF_VERIFY_SSL],
             )
             response = await self.client.async_get_heartbeat()
@@ -197,14 +256,20 @@ class OpenWebUIOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=self.options)
 
         try:
-            client = OpenWebUIApiClient(
-                base_url=cv.url_no_path(self.config_entry.data[CONF_BASE_URL]),
-                api_key=self.config_entry.data[CONF_API_KEY],
-                timeout=self.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
-                session=async_create_clientsession(self.hass),
-                verify_ssl=self.options.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
-            )
-            models = await client.async_get_models()
+            if coordinator := self.hass.data.get(DOMAIN, {}).get(
+                self.config_entry.entry_id
+            ):
+                # Served from the entry's catalog, refreshed in the background.
+                models = await coordinator.model_catalog.async_get_models()
+            else:
+                client = OpenWebUIApiClient(
+                    base_url=cv.url_no_path(self.config_entry.data[CONF_BASE_URL]),
+                    api_key=self.config_entry.data[CONF_API_KEY],
+                    timeout=self.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+                    session=async_get_clientsession(self.hass),
+                    verify_ssl=self.options.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+                )
+                models = await client.async_get_models()
         except ApiClientError as exception:
             LOGGER.exception("Unexpected exception: %s", exception)
             models = []
@@ -295,6 +360,132 @@ def openwebui_schema_general_config(options: MappingProxyType[str, Any]) -> dict
             },
             default=DEFAULT_LOCAL_ALIAS_OVERRIDES,
         ): TemplateSelector(TemplateSelectorConfig()),
+        vol.Optional(
+            CONF_STATE_VERIFY_TIMEOUT,
+            description={
+                "suggested_value": options.get(
+                    CONF_STATE_VERIFY_TIMEOUT, DEFAULT_STATE_VERIFY_TIMEOUT
+                )
+            },
+            default=DEFAULT_STATE_VERIFY_TIMEOUT,
+        ): vol.Coerce(float),
+        vol.Optional(
+            CONF_CONNECT_TIMEOUT,
+            description={
+                "suggested_value": options.get(
+                    CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
+                )
+            },
+            default=DEFAULT_CONNECT_TIMEOUT,
+        ): vol.Coerce(float),
+        vol.Optional(
+            CONF_FIRST_BYTE_TIMEOUT,
+            description={
+                "suggested_value": options.get(
+                    CONF_FIRST_BYTE_TIMEOUT, DEFAULT_FIRST_BYTE_TIMEOUT
+                )
+            },
+            default=DEFAULT_FIRST_BYTE_TIMEOUT,
+        ): vol.Coerce(float),
+        vol.Optional(
+            CONF_FIRST_TOKEN_TIMEOUT,
+            description={
+                "suggested_value": options.get(
+                    CONF_FIRST_TOKEN_TIMEOUT, DEFAULT_FIRST_TOKEN_TIMEOUT
+                )
+            },
+            default=DEFAULT_FIRST_TOKEN_TIMEOUT,
+        ): vol.Coerce(float),
+        vol.Optional(
+            CONF_CHUNK_TIMEOUT,
+            description={
+                "suggested_value": options.get(
+                    CONF_CHUNK_TIMEOUT, DEFAULT_CHUNK_TIMEOUT
+                )
+            },
+            default=DEFAULT_CHUNK_TIMEOUT,
+        ): vol.Coerce(float),
+        vol.Required(
+            CONF_RESPONSE_CACHE_ENABLED,
+            description={
+                "suggested_value": options.get(
+                    CONF_RESPONSE_CACHE_ENABLED, DEFAULT_RESPONSE_CACHE_ENABLED
+                )
+            },
+            default=DEFAULT_RESPONSE_CACHE_ENABLED,
+        ): BooleanSelector(BooleanSelectorConfig()),
+        vol.Optional(
+            CONF_RESPONSE_CACHE_TTL,
+            description={
+                "suggested_value": options.get(
+                    CONF_RESPONSE_CACHE_TTL, DEFAULT_RESPONSE_CACHE_TTL
+                )
+            },
+            default=DEFAULT_RESPONSE_CACHE_TTL,
+        ): vol.Coerce(float),
+        vol.Optional(
+            CONF_RESPONSE_CACHE_SIZE,
+            description={
+                "suggested_value": options.get(
+                    CONF_RESPONSE_CACHE_SIZE, DEFAULT_RESPONSE_CACHE_SIZE
+                )
+            },
+            default=DEFAULT_RESPONSE_CACHE_SIZE,
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Required(
+            CONF_PLAN_CACHE_ENABLED,
+            description={
+                "suggested_value": options.get(
+                    CONF_PLAN_CACHE_ENABLED, DEFAULT_PLAN_CACHE_ENABLED
+                )
+            },
+            default=DEFAULT_PLAN_CACHE_ENABLED,
+        ): BooleanSelector(BooleanSelectorConfig()),
+        vol.Optional(
+            CONF_PLAN_CACHE_TTL,
+            description={
+                "suggested_value": options.get(
+                    CONF_PLAN_CACHE_TTL, DEFAULT_PLAN_CACHE_TTL
+                )
+            },
+            default=DEFAULT_PLAN_CACHE_TTL,
+        ): vol.Coerce(float),
+        vol.Optional(
+            CONF_PLAN_CACHE_SIZE,
+            description={
+                "suggested_value": options.get(
+                    CONF_PLAN_CACHE_SIZE, DEFAULT_PLAN_CACHE_SIZE
+                )
+            },
+            default=DEFAULT_PLAN_CACHE_SIZE,
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(
+            CONF_PLAN_CACHE_MIN_CONFIDENCE,
+            description={
+                "suggested_value": options.get(
+                    CONF_PLAN_CACHE_MIN_CONFIDENCE, DEFAULT_PLAN_CACHE_MIN_CONFIDENCE
+                )
+            },
+            default=DEFAULT_PLAN_CACHE_MIN_CONFIDENCE,
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Required(
+            CONF_FAST_PATH_ENABLED,
+            description={
+                "suggested_value": options.get(
+                    CONF_FAST_PATH_ENABLED, DEFAULT_FAST_PATH_ENABLED
+                )
+            },
+            default=DEFAULT_FAST_PATH_ENABLED,
+        ): BooleanSelector(BooleanSelectorConfig()),
+        vol.Required(
+            CONF_SKIP_TOOL_FOLLOW_UP,
+            description={
+                "suggested_value": options.get(
+                    CONF_SKIP_TOOL_FOLLOW_UP, DEFAULT_SKIP_TOOL_FOLLOW_UP
+                )
+            },
+            default=DEFAULT_SKIP_TOOL_FOLLOW_UP,
+        ): BooleanSelector(BooleanSelectorConfig()),
     }
 
 
@@ -326,7 +517,58 @@ def openwebui_schema_model_config(
                 )
             },
             default=DEFAULT_STRIP_MARKDOWN,
-        ): BooleanSelector(BooleanSelectorConfig())
+        ): BooleanSelector(BooleanSelectorConfig()),
+        vol.Required(
+            CONF_KEEP_ALIVE_POLICY,
+            description={
+                "suggested_value": options.get(
+                    CONF_KEEP_ALIVE_POLICY, DEFAULT_KEEP_ALIVE_POLICY
+                )
+            },
+            default=DEFAULT_KEEP_ALIVE_POLICY,
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=KEEP_ALIVE_POLICIES,
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key=CONF_KEEP_ALIVE_POLICY,
+            )
+        ),
+        vol.Optional(
+            CONF_KEEP_ALIVE_START,
+            description={
+                "suggested_value": options.get(
+                    CONF_KEEP_ALIVE_START, DEFAULT_KEEP_ALIVE_START
+                )
+            },
+            default=DEFAULT_KEEP_ALIVE_START,
+        ): TimeSelector(),
+        vol.Optional(
+            CONF_KEEP_ALIVE_END,
+            description={
+                "suggested_value": options.get(
+                    CONF_KEEP_ALIVE_END, DEFAULT_KEEP_ALIVE_END
+                )
+            },
+            default=DEFAULT_KEEP_ALIVE_END,
+        ): TimeSelector(),
+        vol.Optional(
+            CONF_KEEP_ALIVE_IDLE_MINUTES,
+            description={
+                "suggested_value": options.get(
+                    CONF_KEEP_ALIVE_IDLE_MINUTES, DEFAULT_KEEP_ALIVE_IDLE_MINUTES
+                )
+            },
+            default=DEFAULT_KEEP_ALIVE_IDLE_MINUTES,
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(
+            CONF_PROMPT_TOKEN_BUDGET,
+            description={
+                "suggested_value": options.get(
+                    CONF_PROMPT_TOKEN_BUDGET, DEFAULT_PROMPT_TOKEN_BUDGET
+                )
+            },
+            default=DEFAULT_PROMPT_TOKEN_BUDGET,
+        ): vol.All(vol.Coerce(int), vol.Range(min=0)),
     }
 
 
@@ -26,6 +26,30 @@ CONF_ENABLE_STREAMING = "enable_streaming"
 CONF_NARRATE_STREAMING_PROGRESS = "narrate_streaming_progress"
 CONF_SHOW_DEBUG_BUBBLES = "show_debug_bubbles"
 CONF_LOCAL_ALIAS_OVERRIDES = "local_alias_overrides"
+CONF_STATE_VERIFY_TIMEOUT = "state_verify_timeout"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_FIRST_BYTE_TIMEOUT = "first_byte_timeout"
+CONF_FIRST_TOKEN_TIMEOUT = "first_token_timeout"
+CONF_CHUNK_TIMEOUT = "chunk_timeout"
+CONF_KEEP_ALIVE_POLICY = "keep_alive_policy"
+CONF_KEEP_ALIVE_START = "keep_alive_start"
+CONF_KEEP_ALIVE_END = "keep_alive_end"
+CONF_KEEP_ALIVE_IDLE_MINUTES = "keep_alive_idle_minutes"
+CONF_RESPONSE_CACHE_ENABLED = "response_cache_enabled"
+CONF_RESPONSE_CACHE_TTL = "response_cache_ttl"
+CONF_RESPONSE_CACHE_SIZE = "response_cache_size"
+CONF_PLAN_CACHE_ENABLED = "plan_cache_enabled"
+CONF_PLAN_CACHE_TTL = "plan_cache_ttl"
+CONF_PLAN_CACHE_SIZE = "plan_cache_size"
+CONF_PLAN_CACHE_MIN_CONFIDENCE = "plan_cache_min_confidence"
+CONF_FAST_PATH_ENABLED = "fast_path_enabled"
+CONF_SKIP_TOOL_FOLLOW_UP = "skip_tool_follow_up"
+CONF_PROMPT_TOKEN_BUDGET = "prompt_token_budget"
+
+KEEP_ALIVE_ALWAYS = "always_hot"
+KEEP_ALIVE_SCHEDULED = "scheduled"
+KEEP_ALIVE_IDLE = "unload_when_idle"
+KEEP_ALIVE_POLICIES = [KEEP_ALIVE_ALWAYS, KEEP_ALIVE_SCHEDULED, KEEP_ALIVE_IDLE]
 
 DEFAULT_SERVICE_NAME = "OpenWebUI"
 DEFAULT_BASE_URL = "http://openwebui.homeassistant.local"
@@ -42,3 +66,22 @@ DEFAULT_ENABLE_STREAMING = True
 DEFAULT_NARRATE_STREAMING_PROGRESS = False
 DEFAULT_SHOW_DEBUG_BUBBLES = True
 DEFAULT_LOCAL_ALIAS_OVERRIDES = ""
+DEFAULT_STATE_VERIFY_TIMEOUT = 3.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_FIRST_BYTE_TIMEOUT = 30.0
+DEFAULT_FIRST_TOKEN_TIMEOUT = 60.0
+DEFAULT_CHUNK_TIMEOUT = 20.0
+DEFAULT_KEEP_ALIVE_POLICY = KEEP_ALIVE_ALWAYS
+DEFAULT_KEEP_ALIVE_START = "07:00:00"
+DEFAULT_KEEP_ALIVE_END = "23:00:00"
+DEFAULT_KEEP_ALIVE_IDLE_MINUTES = 30
+DEFAULT_RESPONSE_CACHE_ENABLED = False
+DEFAULT_RESPONSE_CACHE_TTL = 3600.0
+DEFAULT_RESPONSE_CACHE_SIZE = 64
+DEFAULT_PLAN_CACHE_ENABLED = False
+DEFAULT_PLAN_CACHE_TTL = 86400.0
+DEFAULT_PLAN_CACHE_SIZE = 128
+DEFAULT_PLAN_CACHE_MIN_CONFIDENCE = 2
+DEFAULT_FAST_PATH_ENABLED = False
+DEFAULT_SKIP_TOOL_FOLLOW_UP = False
+DEFAULT_PROMPT_TOKEN_BUDGET = 0
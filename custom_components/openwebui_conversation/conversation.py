@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
-import json
+from dataclasses import dataclass
+import logging
 import re
+from time import monotonic
 from typing import Any, Literal
 
 from hassil import recognize
@@ -16,55 +19,77 @@ from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import intent, llm
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from markdown_it import MarkdownIt
 from mdit_plain.renderer import RendererPlain
 
+from .alias_overrides import AliasOverrides, async_get_alias_overrides
 from .api import OpenWebUIApiClient
+from .codec import JSONDecodeError, RequestEncoder, json_dumps, json_loads
 from .const import (
-    CONF_API_KEY,
-    CONF_BASE_URL,
     CONF_ENABLE_STREAMING,
     CONF_LANGUAGE_CODE,
-    CONF_LOCAL_ALIAS_OVERRIDES,
     CONF_MODEL,
     CONF_NARRATE_STREAMING_PROGRESS,
     CONF_SEARCH_ENABLED,
     CONF_SEARCH_RESULT_PREFIX,
     CONF_SEARCH_SENTENCES,
     CONF_SHOW_DEBUG_BUBBLES,
+    CONF_SKIP_TOOL_FOLLOW_UP,
+    CONF_STATE_VERIFY_TIMEOUT,
     CONF_STRIP_MARKDOWN,
     CONF_TIMEOUT,
-    CONF_VERIFY_SSL,
     DEFAULT_ENABLE_STREAMING,
     DEFAULT_LANGUAGE_CODE,
-    DEFAULT_LOCAL_ALIAS_OVERRIDES,
     DEFAULT_MODEL,
     DEFAULT_NARRATE_STREAMING_PROGRESS,
     DEFAULT_SEARCH_ENABLED,
     DEFAULT_SEARCH_RESULT_PREFIX,
     DEFAULT_SEARCH_SENTENCES,
     DEFAULT_SHOW_DEBUG_BUBBLES,
+    DEFAULT_SKIP_TOOL_FOLLOW_UP,
+    DEFAULT_STATE_VERIFY_TIMEOUT,
     DEFAULT_STRIP_MARKDOWN,
     DEFAULT_TIMEOUT,
-    DEFAULT_VERIFY_SSL,
     DO_SEARCH_INTENT,
+    DOMAIN,
     LOGGER,
 )
 from .exceptions import ApiCommError, ApiJsonError, ApiTimeoutError
 from .local_executor import (
+    ToolCallDispatcher,
     ToolExecutionResult,
     describe_tool_call,
     describe_tool_execution_result,
+    execute_tool_call_batch,
     execute_tool_calls_detailed,
     extract_tool_calls,
+    is_successful_action_run,
+    plan_tool_call_batches,
     summarize_execution_results,
 )
+from .fast_path import FastPath, async_get_fast_path
+from .keep_alive import ModelKeepAlive
+from .latency import LatencyStats, TurnTrace, active_trace, timed, timed_follow_up
+from .model_catalog import ModelCatalog
+from .plan_cache import PlanCache, async_get_plan_cache
+from .prewarm import PipelinePrewarmer
+from .response_cache import CachedResponse, ResponseCache, async_get_response_cache
+from .sentence_segmenter import SentenceSegmenter
+from .usage import UsageStats
 
-TOOL_ID_CACHE: dict[str, list[str]] = {}
 MAX_TOOL_FOLLOW_UP_ROUNDS = 4
+NO_USABLE_RESPONSE = "I didn't get a usable response from the model."
+_QUESTION_START = re.compile(
+    r"^(?:what|which|who|whose|when|where|why|how|is|are|was|were|do|does|did"
+    r"|can|could|should|would|will|has|have|tell me)\b",
+    re.IGNORECASE,
+)
+# Ask for the usage block on the last stream chunk, for token accounting.
+STREAM_OPTIONS = {"include_usage": True}
+# Speak buffered text at the last word break if no sentence ended this soon.
+STREAM_FLUSH_DEADLINE_SECONDS = 1.0
 LOCAL_TOOL_SYSTEM_PROMPT = """You can control Home Assistant locally by returning tool calls.
 
 Supported tool names:
@@ -140,32 +165,63 @@ def _tool_inputs_from_tool_calls(tool_calls: list[dict[str, Any]]) -> list[llm.T
     return tool_inputs
 
 
-def _normalize_stream_tool_calls(
+def _normalize_stream_tool_call(
+    index: int, partial: dict[str, str]
+) -> dict[str, Any] | None:
+    name = partial.get("name", "").strip()
+    if not name:
+        return None
+    arguments_text = partial.get("arguments", "").strip()
+    parameters: dict[str, Any] = {}
+    if arguments_text:
+        try:
+            parsed = json_loads(arguments_text)
+        except JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict):
+            parameters = parsed
+    return {
+        "id": partial.get("id") or f"tool_call_{index + 1}",
+        "name": name,
+        "parameters": parameters,
+    }
+
+
+def _stream_tool_call_complete(partial: dict[str, str]) -> bool:
+    arguments_text = partial.get("arguments", "").strip()
+    if not partial.get("name", "").strip() or not arguments_text.endswith("}"):
+        return False
+    try:
+        return isinstance(json_loads(arguments_text), dict)
+    except JSONDecodeError:
+        return False
+
+
+def _dispatch_stream_tool_calls(
     partial_tool_calls: dict[int, dict[str, str]],
-) -> list[dict[str, Any]]:
-    tool_calls: list[dict[str, Any]] = []
+    dispatched: set[int],
+    dispatcher: ToolCallDispatcher,
+    *,
+    final: bool = False,
+) -> None:
+    """Hand completed native tool calls to the dispatcher in index order.
+
+    A call is complete once a later index has started or its arguments parse
+    as a JSON object; at the end of the stream every remaining call is.
+    """
+    if not partial_tool_calls:
+        return
+    last_index = max(partial_tool_calls)
     for index in sorted(partial_tool_calls):
-        partial = partial_tool_calls[index]
-        name = partial.get("name", "").strip()
-        if not name:
+        if index in dispatched:
             continue
-        arguments_text = partial.get("arguments", "").strip()
-        parameters: dict[str, Any] = {}
-        if arguments_text:
-            try:
-                parsed = json.loads(arguments_text)
-            except json.JSONDecodeError:
-                parsed = None
-            if isinstance(parsed, dict):
-                parameters = parsed
-        tool_calls.append(
-            {
-                "id": partial.get("id") or f"tool_call_{index + 1}",
-                "name": name,
-                "parameters": parameters,
-            }
-        )
-    return tool_calls
+        partial = partial_tool_calls[index]
+        if not (final or index < last_index or _stream_tool_call_complete(partial)):
+            break
+        dispatched.add(index)
+        tool_call = _normalize_stream_tool_call(index, partial)
+        if tool_call is not None:
+            dispatcher.dispatch(tool_call)
 
 
 def _accumulate_stream_tool_calls(
@@ -238,83 +294,156 @@ def _messages_from_chat_log(
     return messages
 
 
-_HOME_LAYOUT_LINE = re.compile(
-    r"^\s*[-*]?\s*(?P<name>.+?)\s*(?:->|→)\s*(?P<entity_id>[a-z0-9_]+\.[a-z0-9_]+)\s*$",
-    re.IGNORECASE,
-)
+def _all_succeeded(results: list[ToolExecutionResult]) -> bool:
+    return bool(results) and all(
+        result.tool_result.get("success") is True for result in results
+    )
 
 
-def _clean_layout_name(value: str) -> str:
-    text = value.strip()
-    text = re.sub(r"`", "", text)
-    text = re.sub(r"\*\*", "", text)
-    text = re.sub(r"\*", "", text)
-    text = re.sub(r"^[-:\s]+", "", text)
-    text = re.sub(r"[:\s]+$", "", text)
-    return text.strip()
+def _has_chat_history(messages: list[dict[str, Any]]) -> bool:
+    """Return True if anything but system prompts precedes the new utterance."""
+    return any(message.get("role") != "system" for message in messages[:-1])
 
 
-def _alias_keys(name: str) -> set[str]:
-    text = re.sub(r"\s+", " ", name.casefold()).strip()
-    normalized = text.replace("_", " ").replace("-", " ")
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    return {
-        name,
-        text,
-        normalized,
-        re.sub(r"^the\s+", "", normalized),
-    }
+async def _recorded_deltas(
+    stream: AsyncGenerator[dict[str, Any], None],
+    deltas: list[dict[str, Any]] | None,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Pass stream deltas through, keeping a copy when ``deltas`` is a list."""
+    async for delta in stream:
+        if deltas is not None:
+            deltas.append(delta)
+        yield delta
+
+
+async def _replayed_deltas(
+    deltas: tuple[dict[str, Any], ...],
+) -> AsyncGenerator[dict[str, Any], None]:
+    for delta in deltas:
+        yield dict(delta)
 
 
-def _extract_alias_map_from_text(content: str) -> dict[str, str]:
-    alias_map: dict[str, str] = {}
-    for line in content.splitlines():
-        matched = _HOME_LAYOUT_LINE.match(line)
-        if not matched:
-            continue
-        name = _clean_layout_name(matched.group("name"))
-        entity_id = matched.group("entity_id").strip()
-        if not name or not entity_id:
-            continue
-        for key in _alias_keys(name):
-            if key:
-                alias_map[key] = entity_id
-    return alias_map
 def _flush_stream_buffer(
-    pending: list[str],
+    segmenter: SentenceSegmenter,
+    text: str = "",
     *,
     force: bool = False,
-    sentence_safe: bool = False,
 ) -> str:
-    """Emit larger readable chunks instead of token fragments."""
-    if not pending:
-        return ""
-    text = "".join(pending)
-    if not text.strip():
-        pending.clear()
-        return ""
-    if not force:
-        if sentence_safe:
-            split_match = re.search(r"^(.+?[.!?](?:\s+|$))(.*)$", text, re.DOTALL)
-            if split_match:
-                emit = split_match.group(1)
-                remainder = split_match.group(2)
-                pending[:] = [remainder] if remainder else []
-                return emit if emit.strip() else ""
-            return ""
-        if len(text) < 24 and not re.search(r"[\s.,!?;:\n]$", text):
-            return ""
-        split_match = re.search(r"^(.+[\s.,!?;:\n])(.*)$", text, re.DOTALL)
-        if split_match:
-            emit = split_match.group(1)
-            remainder = split_match.group(2)
-            pending[:] = [remainder] if remainder else []
-            if not emit.strip():
-                return ""
-            return emit
-        return ""
-    pending.clear()
-    return text if text.strip() else ""
+    """Feed a delta and return the complete sentences ready to be spoken."""
+    emit = "".join(segmenter.feed(text)) if text else ""
+    if force:
+        emit += segmenter.flush()
+    return emit if emit.strip() else ""
+
+
+async def _paced_stream(
+    hass: HomeAssistant,
+    stream: AsyncGenerator[dict[str, Any], None],
+    segmenter: SentenceSegmenter,
+) -> AsyncGenerator[dict[str, Any] | None, None]:
+    """Yield the stream's chunks, and None whenever buffered text falls due.
+
+    Without this a stream that stalls mid-clause holds the segmenter's text
+    until the next chunk. The stream is read by its own task, so waking up
+    for a deadline never cancels a read and the API client's phase timeouts
+    stay bound to that one task.
+    """
+    queue: asyncio.Queue[dict[str, Any] | Exception | None] = asyncio.Queue()
+
+    async def _async_read() -> None:
+        try:
+            async for chunk in stream:
+                queue.put_nowait(chunk)
+        except Exception as err:  # pylint: disable=broad-except
+            # Raised again on the reading side.
+            queue.put_nowait(err)
+        else:
+            queue.put_nowait(None)
+
+    reader = hass.async_create_background_task(
+        _async_read(), "openwebui_conversation stream reader"
+    )
+    try:
+        while True:
+            if queue.empty() and (wait := segmenter.time_to_deadline()) is not None:
+                try:
+                    async with asyncio.timeout(wait):
+                        item = await queue.get()
+                except TimeoutError:
+                    yield None
+                    continue
+            else:
+                item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        reader.cancel()
+
+
+class _StreamReplyClassifier:
+    """Classify a streamed reply as prose or a JSON tool plan from its opening.
+
+    Prompt-based tool plans open with ``{`` (or ``[``), optionally inside a
+    ``json`` code fence. Anything else is prose and can be spoken right away.
+    Native tool-call deltas seen before the first content mark the reply as a
+    plan.
+    """
+
+    PROSE = "prose"
+    PLAN = "plan"
+    _MAX_UNDECIDED_CHARS = 64
+
+    def __init__(self) -> None:
+        """Initialize the classifier."""
+        self.verdict: str | None = None
+        self._head: list[str] = []
+
+    @property
+    def is_prose(self) -> bool:
+        """Return True once the reply is known to be prose."""
+        return self.verdict == self.PROSE
+
+    def mark_tool_calls(self) -> None:
+        """Record that the model started emitting native tool calls."""
+        if self.verdict is None:
+            self.verdict = self.PLAN
+
+    def feed(self, text: str) -> str | None:
+        """Consume a content delta and return the verdict, if known yet."""
+        if self.verdict is not None:
+            return self.verdict
+        self._head.append(text)
+        head = "".join(self._head).lstrip()
+        if not head:
+            return None
+        self.verdict = self._classify(head)
+        if self.verdict is None and len(head) > self._MAX_UNDECIDED_CHARS:
+            self.verdict = self.PROSE
+        if self.verdict is not None:
+            self._head.clear()
+        return self.verdict
+
+    def _classify(self, head: str) -> str | None:
+        if head[0] in "{[":
+            return self.PLAN
+        if head[0] != "`":
+            return self.PROSE
+        if len(head) < 3:
+            return None
+        if not head.startswith("```"):
+            return self.PROSE
+        info, newline, body = head[3:].partition("\n")
+        if not newline:
+            return None
+        if info.strip().lower() not in ("", "json"):
+            return self.PROSE
+        body = body.lstrip()
+        if not body:
+            return None
+        return self.PLAN if body[0] in "{[" else self.PROSE
 
 
 def _is_tool_capable(payload: dict[str, Any]) -> bool:
@@ -334,6 +463,18 @@ def _tool_flow_lead_in() -> str:
     return "Okay, I'll handle that now."
 
 
+def _text_delta(
+    text: str, *, continues: bool, prefix: str | None = None
+) -> dict[str, Any]:
+    # A delta carrying a role starts a new chat log message; the rest of a
+    # streamed answer is appended to it.
+    if continues:
+        return {"content": text}
+    if prefix:
+        text = f"{prefix} {text.lstrip()}"
+    return {"role": "assistant", "content": text}
+
+
 def _progress_content_delta(text: str, *, final: bool = False) -> dict[str, Any]:
     delta: dict[str, Any] = {"role": "assistant", "content": text}
     if not final:
@@ -356,7 +497,7 @@ def _assistant_tool_call_message(
                 "type": "function",
                 "function": {
                     "name": name,
-                    "arguments": json.dumps(parameters, ensure_ascii=False),
+                    "arguments": json_dumps(parameters),
                 },
             }
         )
@@ -375,12 +516,77 @@ def _tool_result_messages(
             "role": "tool",
             "tool_call_id": result.tool_call_id,
             "name": result.tool_name,
-            "content": json.dumps(result.tool_result, ensure_ascii=False),
+            "content": json_dumps(result.tool_result),
         }
         for result in execution_results
     ]
 
 
+def _required_template_words(sentence: str) -> tuple[str, ...]:
+    """Return the literal words every match of a sentence template must contain.
+
+    Optional ``[...]``, alternative ``(...)``, list ``{...}`` and rule ``<...>``
+    sections are dropped because any of them may be skipped or varied.
+    """
+    depth = 0
+    literal: list[str] = []
+    for char in sentence:
+        if char in "[({<":
+            depth += 1
+            literal.append(" ")
+        elif char in "])}>":
+            depth = max(0, depth - 1)
+            literal.append(" ")
+        elif depth == 0:
+            literal.append(char)
+    text = "".join(literal)
+    if "|" in text:
+        # A top-level alternative means no single word is required.
+        return ()
+    return tuple(
+        word
+        for word in (
+            re.sub(r"[^\w]", "", part) for part in text.casefold().split()
+        )
+        if word
+    )
+
+
+@dataclass(frozen=True)
+class CompiledSearchIntents:
+    """Parsed search trigger intents plus a cheap literal-word prefilter."""
+
+    intents: Intents
+    required_words: tuple[tuple[str, ...], ...]
+
+    def might_match(self, text: str) -> bool:
+        """Return False when no template's required words appear in text."""
+        folded = re.sub(r"[^\w\s]", "", text.casefold())
+        return any(
+            all(word in folded for word in words) for words in self.required_words
+        )
+
+
+def compile_search_intents(
+    language: str, sentences: list[str]
+) -> CompiledSearchIntents:
+    """Parse search trigger sentences and collect their required words."""
+    intents = Intents.from_dict(
+        {
+            "language": language,
+            "settings": {"ignore_whitespace": True},
+            "intents": {DO_SEARCH_INTENT: {"data": [{"sentences": list(sentences)}]}},
+            "lists": {"query": {"wildcard": True}},
+        }
+    )
+    return CompiledSearchIntents(
+        intents=intents,
+        required_words=tuple(
+            _required_template_words(sentence) for sentence in sentences
+        ),
+    )
+
+
 class OpenWebUIAgent(
     conversation.ConversationEntity, conversation.AbstractConversationAgent
 ):
@@ -394,13 +600,7 @@ class OpenWebUIAgent(
         self.hass = hass
         self.entry = entry
         self.timeout = entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
-        self.client = OpenWebUIApiClient(
-            base_url=entry.data[CONF_BASE_URL],
-            api_key=entry.data[CONF_API_KEY],
-            timeout=self.timeout,
-            session=async_get_clientsession(hass),
-            verify_ssl=entry.options.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
-        )
+        self.client: OpenWebUIApiClient = hass.data[DOMAIN][entry.entry_id].client
         self.search_enabled = entry.options.get(
             CONF_SEARCH_ENABLED, DEFAULT_SEARCH_ENABLED
         )
@@ -415,6 +615,7 @@ class OpenWebUIAgent(
             CONF_SEARCH_RESULT_PREFIX, DEFAULT_SEARCH_RESULT_PREFIX
         )
         self.lang = entry.options.get(CONF_LANGUAGE_CODE, DEFAULT_LANGUAGE_CODE).strip()
+        self._search_intents: CompiledSearchIntents | None = None
         self._attr_name = entry.title
         self._attr_unique_id = entry.entry_id
         self.strip_markdown = entry.options.get(
@@ -429,6 +630,32 @@ class OpenWebUIAgent(
         self.show_debug_bubbles = entry.options.get(
             CONF_SHOW_DEBUG_BUBBLES, DEFAULT_SHOW_DEBUG_BUBBLES
         )
+        self.state_verify_timeout = float(
+            entry.options.get(CONF_STATE_VERIFY_TIMEOUT, DEFAULT_STATE_VERIFY_TIMEOUT)
+        )
+        self.skip_tool_follow_up = entry.options.get(
+            CONF_SKIP_TOOL_FOLLOW_UP, DEFAULT_SKIP_TOOL_FOLLOW_UP
+        )
+        self.alias_overrides = async_get_alias_overrides(hass, entry)
+        self.model_catalog: ModelCatalog = hass.data[DOMAIN][
+            entry.entry_id
+        ].model_catalog
+        self.keep_alive: ModelKeepAlive = hass.data[DOMAIN][entry.entry_id].keep_alive
+        self.latency: LatencyStats = hass.data[DOMAIN][entry.entry_id].latency
+        self.usage: UsageStats = hass.data[DOMAIN][entry.entry_id].usage
+        self.response_cache: ResponseCache | None = async_get_response_cache(
+            hass, entry
+        )
+        self.plan_cache: PlanCache | None = async_get_plan_cache(hass, entry)
+        self.fast_path: FastPath | None = async_get_fast_path(hass, entry)
+        self.prewarmer = PipelinePrewarmer(
+            hass,
+            self.client,
+            self.model_catalog,
+            lambda: {self.entity_id, self.entry.entry_id},
+            self._prewarm_local,
+        )
+        hass.data[DOMAIN][entry.entry_id].prewarmer = self.prewarmer
         self.markdown_parser = MarkdownIt(renderer_cls=RendererPlain)
 
     @property
@@ -446,9 +673,11 @@ class OpenWebUIAgent(
         self.entry.async_on_unload(
             self.entry.add_update_listener(self._async_entry_update_listener)
         )
+        self.prewarmer.async_start()
 
     async def async_will_remove_from_hass(self) -> None:
         """When entity will be removed from Home Assistant."""
+        self.prewarmer.async_stop()
         conversation.async_unset_agent(self.hass, self.entry)
         await super().async_will_remove_from_hass()
 
@@ -456,40 +685,128 @@ class OpenWebUIAgent(
         self,
         user_input: conversation.ConversationInput,
         chat_log: conversation.ChatLog,
+    ) -> conversation.ConversationResult:
+        """Process a sentence, timing each phase and counting its tokens.
+
+        With structured tool details shown or debug logging on, the phase
+        timings and token usage are also returned as the
+        ``openwebui_latency`` and ``openwebui_usage`` speech slots, which the
+        Assist pipeline debug view shows with the intent output.
+        """
+        trace = TurnTrace()
+        with active_trace(trace):
+            result = await self._async_process_message(user_input, chat_log, trace)
+        trace.finish()
+        self.latency.async_record(trace)
+        over_budget = self.usage.async_record(
+            self.entry.options.get(CONF_MODEL, DEFAULT_MODEL), trace.usage
+        )
+        if self.show_debug_bubbles or LOGGER.isEnabledFor(logging.DEBUG):
+            usage = {**trace.usage.as_dict(), "over_budget": over_budget}
+            LOGGER.debug("Turn latency (ms): %s, usage: %s", trace.as_dict(), usage)
+            result.response.async_set_speech_slots(
+                {
+                    **result.response.speech_slots,
+                    "openwebui_latency": trace.as_dict(),
+                    "openwebui_usage": usage,
+                }
+            )
+        return result
+
+    async def _async_process_message(
+        self,
+        user_input: conversation.ConversationInput,
+        chat_log: conversation.ChatLog,
+        trace: TurnTrace,
     ) -> conversation.ConversationResult:
         """Process a sentence."""
+        started = monotonic()
         prompt, should_search = self._prepare_prompt(user_input.text)
         model = self.entry.options.get(CONF_MODEL, DEFAULT_MODEL)
+        # The turn's own language, not the search language option.
+        fast_path = (
+            self.fast_path
+            if self.fast_path is not None
+            and self.fast_path.handles_language(user_input.language)
+            else None
+        )
         try:
-            tool_ids = await self._async_get_tool_ids()
+            if (
+                fast_path is not None
+                and not should_search
+                and (
+                    match := fast_path.async_match(
+                        self.hass, user_input.text, self.alias_overrides
+                    )
+                )
+            ):
+                LOGGER.debug(
+                    "Fast path matched %s for %s", match.template, match.entity_id
+                )
+                trace.path = "fast_path"
+                await self._async_answer_locally(chat_log, [match.tool_call])
+                fast_path.record_hit(monotonic() - started)
+                return conversation.async_get_result_from_chat_log(
+                    user_input, chat_log
+                )
+            with timed("tool_ids"):
+                tool_ids = await self._async_get_tool_ids()
             message_list = _messages_from_chat_log(
                 chat_log,
                 prompt,
                 include_local_tool_prompt=not tool_ids,
             )
-            alias_map = _extract_alias_map_from_text(
-                self.entry.options.get(
-                    CONF_LOCAL_ALIAS_OVERRIDES, DEFAULT_LOCAL_ALIAS_OVERRIDES
-                )
-            )
             payload = {
                 "features": {"web_search": should_search},
                 "tool_ids": tool_ids,
                 "model": model,
                 "messages": message_list,
-                "params": {"keep_alive": "-1m"},
-                "options": {"keep_alive": -1},
+                **self.keep_alive.request_fields(),
             }
+            if (
+                self.plan_cache is not None
+                and not should_search
+                and (cached_plan := self.plan_cache.get(user_input.text))
+            ):
+                LOGGER.debug("Replaying cached plan: %s", cached_plan)
+                trace.path = "plan_cache"
+                execution_results = await self._async_answer_locally(
+                    chat_log, cached_plan
+                )
+                if not _all_succeeded(execution_results):
+                    self.plan_cache.discard(user_input.text)
+                return conversation.async_get_result_from_chat_log(
+                    user_input, chat_log
+                )
+            cache_key = (
+                ResponseCache.key(prompt, payload)
+                if self.response_cache is not None and not should_search
+                else None
+            )
+            if cache_key is not None and (
+                cached := self.response_cache.get(cache_key)
+            ):
+                trace.path = "response_cache"
+                await self._async_replay_cached_response(chat_log, cached)
+                return conversation.async_get_result_from_chat_log(
+                    user_input, chat_log
+                )
 
+            stream_state: dict[str, Any] = {}
+            deltas: list[dict[str, Any]] | None = None
             if self.enable_streaming:
-                stream_state: dict[str, Any] = {}
+                if cache_key is not None:
+                    deltas = []
                 async for _content in chat_log.async_add_delta_content_stream(
                     self.entity_id,
-                    self._async_stream_chat(
-                        payload,
-                        should_search=should_search,
-                        alias_map=alias_map,
-                        stream_state=stream_state,
+                    _recorded_deltas(
+                        self._async_stream_chat(
+                            payload,
+                            should_search=should_search,
+                            alias_map=self.alias_overrides,
+                            stream_state=stream_state,
+                        ),
+                        deltas,
                     ),
                 ):
                     pass
@@ -509,10 +826,36 @@ class OpenWebUIAgent(
                     chat_log,
                     payload,
                     should_search=should_search,
-                    alias_map=alias_map,
+                    alias_map=self.alias_overrides,
+                    response_state=stream_state,
                 )
+            if (
+                cache_key is not None
+                and not stream_state.get("tool_flow")
+                and stream_state.get("final_text") not in (None, "", NO_USABLE_RESPONSE)
+            ):
+                self.response_cache.put(cache_key, stream_state["final_text"], deltas)
+            if stream_state.get("tool_flow"):
+                if fast_path is not None:
+                    fast_path.record_model_turn(monotonic() - started)
+                if (
+                    self.plan_cache is not None
+                    and not should_search
+                    and not _has_chat_history(message_list)
+                ):
+                    self.plan_cache.record(
+                        user_input.text, stream_state.get("execution_results") or []
+                    )
         except (ApiCommError, ApiJsonError, ApiTimeoutError) as err:
-            LOGGER.error("Error generating prompt: %s", err)
+            trace.error = f"{type(err).__name__}: {err}"
+            if isinstance(err, ApiTimeoutError):
+                LOGGER.error(
+                    "Timed out generating prompt (%s phase stalled): %s",
+                    err.phase,
+                    err,
+                )
+            else:
+                LOGGER.error("Error generating prompt: %s", err)
             intent_response = intent.IntentResponse(language=user_input.language)
             intent_response.async_set_error(
                 intent.IntentResponseErrorCode.UNKNOWN,
@@ -522,6 +865,7 @@ class OpenWebUIAgent(
                 response=intent_response, conversation_id=chat_log.conversation_id
             )
         except HomeAssistantError as err:
+            trace.error = f"{type(err).__name__}: {err}"
             LOGGER.error("Something went wrong: %s", err)
             intent_response = intent.IntentResponse(language=user_input.language)
             intent_response.async_set_error(
@@ -534,20 +878,32 @@ class OpenWebUIAgent(
 
         return conversation.async_get_result_from_chat_log(user_input, chat_log)
 
+    def _get_search_intents(self) -> CompiledSearchIntents:
+        """Return the compiled search intents, compiling them on first use.
+
+        They live on the agent, so an options change or unload drops them
+        together with the entry.
+        """
+        if self._search_intents is None:
+            self._search_intents = compile_search_intents(
+                self.lang, self.search_sentences
+            )
+        return self._search_intents
+
+    def _prewarm_local(self) -> None:
+        """Compile what the first turn would otherwise compile."""
+        if self.search_enabled and self.search_sentences:
+            self._get_search_intents()
+
     def _prepare_prompt(self, prompt: str) -> tuple[str, bool]:
         """Apply search trigger detection."""
         if not (self.search_enabled and self.search_sentences):
             return prompt, False
 
-        intents = Intents.from_dict(
-            {
-                "language": self.lang,
-                "settings": {"ignore_whitespace": True},
-                "intents": {DO_SEARCH_INTENT: {"data": [{"sentences": self.search_sentences}]}},
-                "lists": {"query": {"wildcard": True}},
-            }
-        )
-        recognized = recognize(prompt, intents)
+        search_intents = self._get_search_intents()
+        if not search_intents.might_match(prompt):
+            return prompt, False
+        recognized = recognize(prompt, search_intents.intents)
         if recognized is None:
             return prompt, False
         if (
@@ -558,16 +914,18 @@ class OpenWebUIAgent(
         return prompt, False
 
     async def _async_get_tool_ids(self) -> list[str]:
-        """Fetch model metadata and cache tool ids."""
+        """Return the model's tool ids from the entry's model catalog.
+
+        The catalog answers from cache and revalidates in the background, so
+        a turn only waits on /api/models, briefly, before the first fetch.
+        """
         model = self.entry.options.get(CONF_MODEL, DEFAULT_MODEL)
-        tool_ids = TOOL_ID_CACHE.get(model)
-        if tool_ids is not None:
-            return tool_ids
-
-        models = await self.client.async_get_models()
-        matching_model = next((m for m in models if m["id"] == model), {})
-        tool_ids = matching_model.get("info", {}).get("meta", {}).get("toolIds", [])
-        TOOL_ID_CACHE[model] = tool_ids
+        tool_ids = await self.model_catalog.async_wait_tool_ids(model)
+        if not self.model_catalog.loaded:
+            LOGGER.debug(
+                "Model catalog unavailable (%s); using the local tool prompt",
+                self.model_catalog.last_error or "not fetched yet",
+            )
         LOGGER.debug("Using tool_ids for model %s: %s", model, tool_ids)
         return tool_ids
 
@@ -577,10 +935,14 @@ class OpenWebUIAgent(
         payload: dict[str, Any],
         *,
         should_search: bool,
-        alias_map: dict[str, str] | None = None,
+        alias_map: AliasOverrides | None = None,
+        response_state: dict[str, Any] | None = None,
     ) -> None:
         """Add a non-streamed response to the chat log."""
-        response = await self.client.async_generate({**payload, "stream": False})
+        encoder = RequestEncoder()
+        response = await self.client.async_generate(
+            encoder.encode({**payload, "stream": False})
+        )
         response_text = _assistant_text_from_response(response)
         execution_results: list[ToolExecutionResult] = []
         flattened_tool_calls: list[dict[str, Any]] = []
@@ -592,16 +954,22 @@ class OpenWebUIAgent(
                 break
             flattened_tool_calls.extend(tool_calls)
             round_results = await execute_tool_calls_detailed(
-                self.hass, tool_calls, alias_map
+                self.hass, tool_calls, alias_map, self.state_verify_timeout
             )
             execution_results.extend(round_results)
+            if self._summary_answers_turn(payload, execution_results):
+                response_text = ""
+                break
             followup_messages.append(
                 _assistant_tool_call_message(tool_calls, response_text)
             )
             followup_messages.extend(_tool_result_messages(round_results))
-            response = await self.client.async_generate(
-                {**payload, "messages": followup_messages, "stream": False}
-            )
+            with timed_follow_up():
+                response = await self.client.async_generate(
+                    encoder.encode(
+                        {**payload, "messages": followup_messages, "stream": False}
+                    )
+                )
             response_text = _assistant_text_from_response(response)
 
         if flattened_tool_calls:
@@ -611,7 +979,7 @@ class OpenWebUIAgent(
                 or "I found a tool call, but couldn't execute it successfully."
             )
         elif not response_text:
-            response_text = "I didn't get a usable response from the model."
+            response_text = NO_USABLE_RESPONSE
 
         final_text = _format_final_text(
             response_text,
@@ -619,6 +987,10 @@ class OpenWebUIAgent(
             markdown_parser=self.markdown_parser,
             search_prefix=self.search_result_prefix if should_search else None,
         )
+        if response_state is not None:
+            response_state["final_text"] = final_text
+            response_state["tool_flow"] = bool(flattened_tool_calls)
+            response_state["execution_results"] = execution_results
         await self._async_add_structured_response(
             chat_log,
             tool_calls=flattened_tool_calls,
@@ -626,6 +998,65 @@ class OpenWebUIAgent(
             final_text=final_text,
         )
 
+    async def _async_replay_cached_response(
+        self, chat_log: conversation.ChatLog, cached: CachedResponse
+    ) -> None:
+        """Answer from the response cache the way the original turn answered."""
+        LOGGER.debug("Answering from the response cache (hit %s)", cached.hits)
+        if not self.enable_streaming:
+            await self._async_add_structured_response(
+                chat_log,
+                tool_calls=[],
+                execution_results=[],
+                final_text=cached.final_text,
+            )
+            return
+        async for _content in chat_log.async_add_delta_content_stream(
+            self.entity_id, _replayed_deltas(cached.deltas)
+        ):
+            pass
+
+    def _summary_answers_turn(
+        self,
+        payload: dict[str, Any],
+        execution_results: list[ToolExecutionResult],
+    ) -> bool:
+        """Return True if the spoken summary can end the turn without the model.
+
+        Only when the option is on, every call so far was a successful pure
+        action and the user gave a command rather than asked a question.
+        """
+        if not self.skip_tool_follow_up or not is_successful_action_run(
+            execution_results
+        ):
+            return False
+        messages = payload.get("messages") or [{}]
+        utterance = _flatten_text_content(messages[-1].get("content"))
+        return not (utterance.endswith("?") or _QUESTION_START.match(utterance))
+
+    async def _async_answer_locally(
+        self,
+        chat_log: conversation.ChatLog,
+        tool_calls: list[dict[str, Any]],
+    ) -> list[ToolExecutionResult]:
+        """Run tool calls locally and answer with their summary, without the model."""
+        execution_results = await execute_tool_calls_detailed(
+            self.hass, tool_calls, self.alias_overrides, self.state_verify_timeout
+        )
+        final_text = _format_final_text(
+            summarize_execution_results(execution_results)
+            or "I found a tool call, but couldn't execute it successfully.",
+            strip_markdown=self.strip_markdown,
+            markdown_parser=self.markdown_parser,
+        )
+        await self._async_add_structured_response(
+            chat_log,
+            tool_calls=tool_calls,
+            execution_results=execution_results,
+            final_text=final_text,
+        )
+        return execution_results
+
     async def _async_add_structured_response(
         self,
         chat_log: conversation.ChatLog,
@@ -668,57 +1099,102 @@ class OpenWebUIAgent(
         payload: dict[str, Any],
         *,
         should_search: bool,
-        alias_map: dict[str, str] | None = None,
+        alias_map: AliasOverrides | None = None,
         stream_state: dict[str, Any] | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Stream the response into Home Assistant chat log deltas."""
         partial_tool_calls: dict[int, dict[str, str]] = {}
-        content_pending: list[str] = []
+        segmenter = SentenceSegmenter(max_delay=STREAM_FLUSH_DEADLINE_SECONDS)
         buffered_content: list[str] = []
         full_content_parts: list[str] = []
         tool_capable = _is_tool_capable(payload)
+        classifier = _StreamReplyClassifier()
         experimental_live_hook = bool(self.narrate_streaming_progress)
+        dispatcher = ToolCallDispatcher(
+            self.hass, alias_map, self.state_verify_timeout
+        )
+        dispatched_indexes: set[int] = set()
+        encoder = RequestEncoder()
+        prose_streamed = False
+        search_prefix = self.search_result_prefix if should_search else None
 
-        async for chunk in self.client.async_generate_stream({**payload, "stream": True}):
-            choices = chunk.get("choices") or []
-            if not choices:
-                continue
-            choice = choices[0] or {}
-            delta = choice.get("delta") or choice.get("message") or {}
-
-            delta_tool_calls = delta.get("tool_calls")
-            if isinstance(delta_tool_calls, list):
-                _accumulate_stream_tool_calls(partial_tool_calls, delta_tool_calls)
+        try:
+            async for chunk in _paced_stream(
+                self.hass,
+                self.client.async_generate_stream(
+                    encoder.encode(
+                        {**payload, "stream": True, "stream_options": STREAM_OPTIONS}
+                    )
+                ),
+                segmenter,
+            ):
+                if chunk is None:
+                    # The stream stalled with buffered prose past its deadline.
+                    if flushed := "".join(segmenter.flush_due()):
+                        yield _text_delta(
+                            flushed, continues=prose_streamed, prefix=search_prefix
+                        )
+                        prose_streamed = True
+                    continue
+                choices = chunk.get("choices") or []
+                if not choices:
+                    continue
+                choice = choices[0] or {}
+                delta = choice.get("delta") or choice.get("message") or {}
+
+                delta_tool_calls = delta.get("tool_calls")
+                if isinstance(delta_tool_calls, list):
+                    _accumulate_stream_tool_calls(
+                        partial_tool_calls, delta_tool_calls
+                    )
+                    _dispatch_stream_tool_calls(
+                        partial_tool_calls, dispatched_indexes, dispatcher
+                    )
+                    if delta_tool_calls:
+                        classifier.mark_tool_calls()
 
-            content_delta = _flatten_stream_content(delta.get("content"))
-            if content_delta:
+                content_delta = _flatten_stream_content(delta.get("content"))
+                if not content_delta:
+                    continue
                 full_content_parts.append(content_delta)
-                if tool_capable:
-                    # Home Assistant streams assistant content straight into TTS.
-                    # Buffer tool-capable turns until we know whether they will
-                    # become tool calls so provisional prose does not get spoken
-                    # out of turn before the final response.
+                if tool_capable and not classifier.is_prose:
+                    # Home Assistant streams assistant content straight into
+                    # TTS. Buffer tool-capable turns until the opening
+                    # characters show whether this is a JSON tool plan, so a
+                    # plan never gets spoken while ordinary answers still
+                    # stream from the first sentence.
                     buffered_content.append(content_delta)
-                else:
-                    content_pending.append(content_delta)
-                    flushed = _flush_stream_buffer(content_pending, sentence_safe=True)
-                    if flushed:
-                        yield {"role": "assistant", "content": flushed}
-
-        tool_calls = _normalize_stream_tool_calls(partial_tool_calls)
+                    if classifier.feed(content_delta) != classifier.PROSE:
+                        continue
+                    content_delta = "".join(buffered_content)
+                    buffered_content.clear()
+                flushed = _flush_stream_buffer(segmenter, content_delta)
+                if flushed:
+                    yield _text_delta(
+                        flushed, continues=prose_streamed, prefix=search_prefix
+                    )
+                    prose_streamed = True
+        except BaseException:
+            # Calls dispatched mid-stream must not outlive a failed stream.
+            await dispatcher.async_cancel()
+            raise
+
+        _dispatch_stream_tool_calls(
+            partial_tool_calls, dispatched_indexes, dispatcher, final=True
+        )
+        tool_calls = list(dispatcher.tool_calls)
         full_content = "".join(full_content_parts).strip()
 
-        if buffered_content and not tool_calls:
-            content_pending.extend(buffered_content)
+        remaining_content = "".join(buffered_content) if not tool_calls else ""
         buffered_content.clear()
-        final_content = (
-            _flush_stream_buffer(content_pending, force=True, sentence_safe=True) or ""
-        ).strip()
+        tail = _flush_stream_buffer(segmenter, remaining_content, force=True)
+        final_content = tail.strip()
         followup_messages = list(payload.get("messages", []))
         execution_results: list[ToolExecutionResult] = []
         flattened_tool_calls: list[dict[str, Any]] = []
 
-        if not tool_calls and full_content:
+        # Prose already spoken is an answer, not a plan, whatever follows it.
+        if not tool_calls and full_content and tool_capable and not classifier.is_prose:
             prompt_plan = extract_tool_calls(
                 {"choices": [{"message": {"content": full_content}}]}
             )
@@ -730,7 +1206,11 @@ class OpenWebUIAgent(
             if experimental_live_hook:
                 yield _progress_content_delta(_tool_flow_lead_in())
             response_text = full_content
+            answer_streamed = False
             current_tool_calls = tool_calls
+            current_dispatcher: ToolCallDispatcher | None = (
+                dispatcher if len(dispatcher) else None
+            )
             for _ in range(MAX_TOOL_FOLLOW_UP_ROUNDS):
                 if not current_tool_calls:
                     break
@@ -740,44 +1220,69 @@ class OpenWebUIAgent(
                     yield {"role": "assistant", "tool_calls": tool_inputs}
 
                 round_results: list[ToolExecutionResult] = []
-                for tool_call in current_tool_calls:
+                if current_dispatcher is not None:
+                    # Already running since the stream delivered them.
+                    batches = [list(enumerate(current_tool_calls, start=1))]
+                else:
+                    batches = plan_tool_call_batches(
+                        self.hass, current_tool_calls, alias_map
+                    )
+                for batch in batches:
                     if experimental_live_hook:
-                        planned_line = describe_tool_call(
-                            tool_call.get("name", ""),
-                            tool_call.get("parameters", {}),
+                        for _index, tool_call in batch:
+                            planned_line = describe_tool_call(
+                                tool_call.get("name", ""),
+                                tool_call.get("parameters", {}),
+                            )
+                            if planned_line:
+                                yield _progress_content_delta(planned_line)
+
+                    if current_dispatcher is not None:
+                        batch_results = await current_dispatcher.async_results()
+                    else:
+                        batch_results = await execute_tool_call_batch(
+                            self.hass, batch, alias_map, self.state_verify_timeout
                         )
-                        if planned_line:
-                            yield _progress_content_delta(planned_line)
-
-                    execution_result = (
-                        await execute_tool_calls_detailed(
-                            self.hass, [tool_call], alias_map
-                        )
-                    )[0]
-                    round_results.append(execution_result)
-                    execution_results.append(execution_result)
-
-                    yield {
-                        "role": "tool_result",
-                        "tool_call_id": execution_result.tool_call_id,
-                        "tool_name": execution_result.tool_name,
-                        "tool_result": execution_result.tool_result,
-                    }
-
-                    if experimental_live_hook and execution_result.step is None:
-                        failure_line = describe_tool_execution_result(execution_result)
-                        if failure_line:
-                            yield _progress_content_delta(failure_line)
-
+                    for execution_result in batch_results:
+                        round_results.append(execution_result)
+                        execution_results.append(execution_result)
+
+                        yield {
+                            "role": "tool_result",
+                            "tool_call_id": execution_result.tool_call_id,
+                            "tool_name": execution_result.tool_name,
+                            "tool_result": execution_result.tool_result,
+                        }
+
+                        if experimental_live_hook and execution_result.step is None:
+                            failure_line = describe_tool_execution_result(
+                                execution_result
+                            )
+                            if failure_line:
+                                yield _progress_content_delta(failure_line)
+
+                if self._summary_answers_turn(payload, execution_results):
+                    response_text = ""
+                    answer_streamed = False
+                    break
                 followup_messages.append(
                     _assistant_tool_call_message(current_tool_calls, response_text)
                 )
                 followup_messages.extend(_tool_result_messages(round_results))
-                response = await self.client.async_generate(
-                    {**payload, "messages": followup_messages, "stream": False}
-                )
-                response_text = _assistant_text_from_response(response)
-                current_tool_calls = extract_tool_calls(response)
+                round_state: dict[str, Any] = {}
+                with timed_follow_up():
+                    async for followup_delta in self._async_stream_followup_round(
+                        {**payload, "messages": followup_messages},
+                        round_state,
+                        alias_map=alias_map,
+                        encoder=encoder,
+                    ):
+                        yield followup_delta
+                response_text = round_state["content"]
+                # Prose from the round already went out sentence by sentence.
+                answer_streamed = round_state["streamed"] and bool(response_text)
+                current_tool_calls = round_state["tool_calls"]
+                current_dispatcher = round_state["dispatcher"]
 
             final_text = (
                 response_text
@@ -785,7 +1290,8 @@ class OpenWebUIAgent(
                 or "I found a tool call, but couldn't execute it successfully."
             )
         else:
-            final_text = full_content or final_content or "I didn't get a usable response from the model."
+            answer_streamed = prose_streamed
+            final_text = full_content or final_content or NO_USABLE_RESPONSE
 
         final_text = _format_final_text(
             final_text,
@@ -796,14 +1302,112 @@ class OpenWebUIAgent(
         if stream_state is not None:
             stream_state["final_text"] = final_text
             stream_state["tool_flow"] = bool(flattened_tool_calls or tool_calls)
-            stream_state["final_streamed"] = False
-        if (flattened_tool_calls or tool_calls) and experimental_live_hook and final_text:
-            if stream_state is not None:
-                stream_state["final_streamed"] = True
-            yield _progress_content_delta(final_text, final=True)
-        elif not (flattened_tool_calls or tool_calls):
+            stream_state["execution_results"] = execution_results
+            stream_state["final_streamed"] = answer_streamed
+        if flattened_tool_calls or tool_calls:
+            if experimental_live_hook and final_text and not answer_streamed:
+                if stream_state is not None:
+                    stream_state["final_streamed"] = True
+                yield _progress_content_delta(final_text, final=True)
+        elif prose_streamed:
+            # The answer is already in the chat log; only its tail is left.
+            if final_content:
+                yield _text_delta(tail.rstrip(), continues=True)
+        else:
             yield {"role": "assistant", "content": final_text}
 
+    async def _async_stream_followup_round(
+        self,
+        payload: dict[str, Any],
+        round_state: dict[str, Any],
+        *,
+        alias_map: AliasOverrides | None = None,
+        encoder: RequestEncoder | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream one post-tool round, speaking prose as soon as it is known.
+
+        Native tool-call deltas or content opening like a JSON tool plan keep
+        the round quiet (see _StreamReplyClassifier); anything else is flushed
+        sentence by sentence.
+        """
+        partial_tool_calls: dict[int, dict[str, str]] = {}
+        content_parts: list[str] = []
+        segmenter = SentenceSegmenter(max_delay=STREAM_FLUSH_DEADLINE_SECONDS)
+        classifier = _StreamReplyClassifier()
+        dispatcher = ToolCallDispatcher(
+            self.hass, alias_map, self.state_verify_timeout
+        )
+        dispatched_indexes: set[int] = set()
+        streamed = False
+
+        if encoder is None:
+            encoder = RequestEncoder()
+        try:
+            async for chunk in _paced_stream(
+                self.hass,
+                self.client.async_generate_stream(
+                    encoder.encode(
+                        {**payload, "stream": True, "stream_options": STREAM_OPTIONS}
+                    )
+                ),
+                segmenter,
+            ):
+                if chunk is None:
+                    if flushed := "".join(segmenter.flush_due()):
+                        yield _text_delta(flushed, continues=streamed)
+                        streamed = True
+                    continue
+                choices = chunk.get("choices") or []
+                if not choices:
+                    continue
+                choice = choices[0] or {}
+                delta = choice.get("delta") or choice.get("message") or {}
+
+                delta_tool_calls = delta.get("tool_calls")
+                if isinstance(delta_tool_calls, list) and delta_tool_calls:
+                    _accumulate_stream_tool_calls(
+                        partial_tool_calls, delta_tool_calls
+                    )
+                    _dispatch_stream_tool_calls(
+                        partial_tool_calls, dispatched_indexes, dispatcher
+                    )
+                    classifier.mark_tool_calls()
+
+                content_delta = _flatten_stream_content(delta.get("content"))
+                if not content_delta:
+                    continue
+                content_parts.append(content_delta)
+                if not classifier.is_prose:
+                    if classifier.feed(content_delta) != classifier.PROSE:
+                        continue
+                    content_delta = "".join(content_parts)
+                flushed = _flush_stream_buffer(segmenter, content_delta)
+                if flushed:
+                    yield _text_delta(flushed, continues=streamed)
+                    streamed = True
+        except BaseException:
+            await dispatcher.async_cancel()
+            raise
+
+        content = "".join(content_parts).strip()
+        _dispatch_stream_tool_calls(
+            partial_tool_calls, dispatched_indexes, dispatcher, final=True
+        )
+        tool_calls = list(dispatcher.tool_calls)
+        # Prose already spoken is an answer, not a plan, whatever follows it.
+        if not tool_calls and content and not classifier.is_prose:
+            tool_calls = extract_tool_calls(
+                {"choices": [{"message": {"content": content}}]}
+            )
+        if classifier.is_prose:
+            flushed = _flush_stream_buffer(segmenter, force=True)
+            if flushed:
+                yield _text_delta(flushed, continues=streamed)
+        round_state["content"] = content
+        round_state["tool_calls"] = tool_calls
+        round_state["dispatcher"] = dispatcher if len(dispatcher) else None
+        round_state["streamed"] = classifier.is_prose
+
     async def _async_entry_update_listener(
         self, hass: HomeAssistant, entry: ConfigEntry
     ) -> None:
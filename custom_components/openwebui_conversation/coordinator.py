@@ -12,8 +12,18 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .api import OpenWebUIApiClient
-from .const import DOMAIN, LOGGER
+from .const import (
+    CONF_PROMPT_TOKEN_BUDGET,
+    DEFAULT_PROMPT_TOKEN_BUDGET,
+    DOMAIN,
+    LOGGER,
+)
 from .exceptions import ApiClientError
+from .keep_alive import ModelKeepAlive
+from .latency import LatencyStats
+from .model_catalog import ModelCatalog
+from .prewarm import PipelinePrewarmer
+from .usage import UsageStats
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -26,9 +36,25 @@ class OpenWebUIDataUpdateCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         client: OpenWebUIApiClient,
+        entry: ConfigEntry,
     ) -> None:
         """Initialize."""
         self.client = client
+        self.model_catalog = ModelCatalog(hass, client)
+        self.keep_alive = ModelKeepAlive(
+            hass, client, self.model_catalog, entry.options, self.async_update_listeners
+        )
+        self.latency = LatencyStats()
+        # Set by the conversation agent, which owns the prewarmer.
+        self.prewarmer: PipelinePrewarmer | None = None
+        self.usage = UsageStats(
+            int(
+                entry.options.get(
+                    CONF_PROMPT_TOKEN_BUDGET, DEFAULT_PROMPT_TOKEN_BUDGET
+                )
+            ),
+            self.async_update_listeners,
+        )
         super().__init__(
             hass=hass,
             logger=LOGGER,
@@ -39,6 +65,11 @@ class OpenWebUIDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         """Update data via library."""
         try:
-            return await self.client.async_get_heartbeat()
+            heartbeat = await self.client.async_get_heartbeat()
         except ApiClientError as exception:
+            self.keep_alive.async_backend_unavailable()
             raise UpdateFailed(exception) from exception
+        await self.model_catalog.async_refresh()
+        # Warming a cold model takes seconds; don't hold up the update for it.
+        self.keep_alive.async_schedule()
+        return heartbeat
@@ -0,0 +1,59 @@
+"""Diagnostics support for OpenWebUI conversation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .alias_overrides import async_get_alias_overrides
+from .const import CONF_API_KEY, CONF_BASE_URL, DOMAIN
+from .entity_index import DATA_ENTITY_INDEX
+from .fast_path import async_get_fast_path
+from .plan_cache import async_get_plan_cache
+from .response_cache import async_get_response_cache
+
+TO_REDACT = {CONF_API_KEY, CONF_BASE_URL}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    response_cache = async_get_response_cache(hass, entry)
+    plan_cache = async_get_plan_cache(hass, entry)
+    fast_path = async_get_fast_path(hass, entry)
+    entity_index = hass.data.get(DATA_ENTITY_INDEX)
+    last_exception = coordinator.last_exception
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "backend": {
+            "available": coordinator.last_update_success,
+            "last_exception": (
+                f"{type(last_exception).__name__}: {last_exception}"
+                if last_exception is not None
+                else None
+            ),
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "client": coordinator.client.as_dict(),
+        },
+        "entity_index": entity_index.as_dict() if entity_index else None,
+        "alias_overrides": async_get_alias_overrides(hass, entry).as_dict(),
+        "model_catalog": coordinator.model_catalog.as_dict(),
+        "keep_alive": coordinator.keep_alive.as_dict(),
+        "prewarm": (
+            coordinator.prewarmer.as_dict() if coordinator.prewarmer else None
+        ),
+        "latency": coordinator.latency.as_dict(),
+        "usage": coordinator.usage.as_dict(),
+        "response_cache": response_cache.as_dict() if response_cache else None,
+        "plan_cache": plan_cache.as_dict() if plan_cache else None,
+        "fast_path": fast_path.as_dict() if fast_path else None,
+        "recent_turns": coordinator.latency.recent_turns(),
+    }
@@ -0,0 +1,34 @@
+"""Base entity for openwebui_conversation."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, NAME
+from .coordinator import OpenWebUIDataUpdateCoordinator
+
+
+class OpenWebUIEntity(CoordinatorEntity[OpenWebUIDataUpdateCoordinator]):
+    """Entity backed by the entry's coordinator, grouped under one service device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: OpenWebUIDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer=NAME,
+            entry_type=DeviceEntryType.SERVICE,
+        )
@@ -0,0 +1,313 @@
+"""Persistent, event-driven index of exposed entities for local resolution."""
+
+from __future__ import annotations
+
+import re
+from time import monotonic
+from typing import Any
+
+from homeassistant.components.conversation import DOMAIN as CONVERSATION_DOMAIN
+from homeassistant.components.homeassistant.exposed_entities import (
+    async_listen_entity_updates,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import area_registry, device_registry, entity_registry
+
+from .const import DOMAIN, LOGGER
+from .helpers import exposed_entity_info
+
+DATA_ENTITY_INDEX = f"{DOMAIN}_entity_index"
+
+
+def lookup_key(value: str) -> str:
+    """Normalize a name for matching against index keys."""
+    text = value.strip().lower()
+    text = re.sub(r"^[Tt]he\s+", "", text)
+    text = re.sub(r"[^\w\s\.]", " ", text)
+    text = text.replace("_", " ").replace("-", " ")
+    text = re.sub(r"\s+", " ", text)
+    return text
+
+
+def lookup_variants(value: str) -> set[str]:
+    """Return the lookup key of a name with and without device-type suffixes."""
+    base = lookup_key(value)
+    if not base:
+        return set()
+    variants = {base}
+    suffixes = (" light", " lights", " switch", " switches")
+    for suffix in suffixes:
+        if base.endswith(suffix):
+            trimmed = base[: -len(suffix)].strip()
+            if trimmed:
+                variants.add(trimmed)
+        else:
+            variants.add(f"{base}{suffix}")
+    return variants
+
+
+def _entity_keys(entity: dict[str, Any]) -> set[str]:
+    entity_id = entity["entity_id"]
+    entity_name = entity["name"]
+    entity_slug = entity_id.split(".", 1)[-1]
+    keys = {
+        entity_id.lower(),
+        entity_slug.lower(),
+        entity_name.lower(),
+        lookup_key(entity_id),
+        lookup_key(entity_slug),
+        lookup_key(entity_name),
+    }
+    for value in (entity_id, entity_slug, entity_name):
+        keys.update(lookup_variants(value))
+    for alias in entity.get("aliases", []):
+        if alias:
+            alias_text = str(alias)
+            keys.add(alias_text.lower())
+            keys.add(lookup_key(alias_text))
+            keys.update(lookup_variants(alias_text))
+    keys.discard("")
+    return keys
+
+
+class EntityIndex:
+    """Exposed entities keyed by normalized lookup key and by domain.
+
+    The index is built once and then kept current from registry, state and
+    exposure events, so resolving a name never rescans the state machine.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entities: dict[str, dict[str, Any]] = {}
+        self._keys: dict[str, set[str]] = {}
+        self._by_key: dict[str, dict[str, dict[str, Any]]] = {}
+        self._by_domain: dict[str, dict[str, dict[str, Any]]] = {}
+        self._unsubscribers: list[CALLBACK_TYPE] = []
+        self._users = 0
+        self.built_at: float | None = None
+        self.build_seconds: float | None = None
+        self.incremental_updates = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed entities."""
+        return len(self._entities)
+
+    @property
+    def key_count(self) -> int:
+        """Return the number of distinct lookup keys."""
+        return len(self._by_key)
+
+    def lookup(self, key: str, domain: str | None = None) -> list[dict[str, Any]]:
+        """Return entities registered under an already-normalized key."""
+        matches = self._by_key.get(key)
+        if not matches:
+            return []
+        if domain is None:
+            return list(matches.values())
+        return [
+            entity
+            for entity_id, entity in matches.items()
+            if entity_id.split(".", 1)[0] == domain
+        ]
+
+    def entities(self, domain: str | None = None) -> list[dict[str, Any]]:
+        """Return indexed entities, optionally restricted to one domain."""
+        if domain is None:
+            return list(self._entities.values())
+        return list(self._by_domain.get(domain, {}).values())
+
+    def get(self, entity_id: str) -> dict[str, Any] | None:
+        """Return the indexed entity for an entity_id."""
+        return self._entities.get(entity_id)
+
+    @callback
+    def async_rebuild(self) -> None:
+        """Rebuild the whole index from the state machine."""
+        started = monotonic()
+        self._entities.clear()
+        self._keys.clear()
+        self._by_key.clear()
+        self._by_domain.clear()
+        for state in self.hass.states.async_all():
+            if (entity := exposed_entity_info(self.hass, state)) is not None:
+                self._add(entity)
+        self.built_at = monotonic()
+        self.build_seconds = self.built_at - started
+        LOGGER.debug(
+            "Built entity index with %s entities and %s keys in %.1f ms",
+            len(self._entities),
+            len(self._by_key),
+            self.build_seconds * 1000,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return index size and build statistics."""
+        return {
+            "entities": len(self._entities),
+            "keys": len(self._by_key),
+            "domains": {
+                domain: len(entities) for domain, entities in self._by_domain.items()
+            },
+            "age": monotonic() - self.built_at if self.built_at is not None else None,
+            "build_seconds": self.build_seconds,
+            "incremental_updates": self.incremental_updates,
+            "users": self._users,
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Build the index and subscribe to the events that keep it current."""
+        self._users += 1
+        if self._unsubscribers:
+            return
+        self.async_rebuild()
+        bus = self.hass.bus
+        self._unsubscribers = [
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            bus.async_listen(
+                entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_entity_registry_updated,
+            ),
+            bus.async_listen(
+                device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_device_registry_updated,
+            ),
+            bus.async_listen(
+                area_registry.EVENT_AREA_REGISTRY_UPDATED,
+                self._async_area_registry_updated,
+            ),
+            async_listen_entity_updates(
+                self.hass, CONVERSATION_DOMAIN, self._async_exposure_changed
+            ),
+        ]
+
+    @callback
+    def async_stop(self) -> bool:
+        """Release one user; unsubscribe when none are left."""
+        self._users = max(0, self._users - 1)
+        if self._users:
+            return False
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers.clear()
+        return True
+
+    def _add(self, entity: dict[str, Any]) -> None:
+        entity_id = entity["entity_id"]
+        keys = _entity_keys(entity)
+        self._entities[entity_id] = entity
+        self._keys[entity_id] = keys
+        self._by_domain.setdefault(entity_id.split(".", 1)[0], {})[entity_id] = entity
+        for key in keys:
+            self._by_key.setdefault(key, {})[entity_id] = entity
+
+    def _remove(self, entity_id: str) -> None:
+        if self._entities.pop(entity_id, None) is None:
+            return
+        for key in self._keys.pop(entity_id, set()):
+            bucket = self._by_key.get(key)
+            if bucket is None:
+                continue
+            bucket.pop(entity_id, None)
+            if not bucket:
+                del self._by_key[key]
+        domain = entity_id.split(".", 1)[0]
+        if (domain_bucket := self._by_domain.get(domain)) is not None:
+            domain_bucket.pop(entity_id, None)
+            if not domain_bucket:
+                del self._by_domain[domain]
+
+    @callback
+    def async_refresh_entity(self, entity_id: str) -> None:
+        """Re-read one entity's exposure, names and aliases."""
+        self.incremental_updates += 1
+        self._remove(entity_id)
+        state = self.hass.states.get(entity_id)
+        if state is None:
+            return
+        if (entity := exposed_entity_info(self.hass, state)) is not None:
+            self._add(entity)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        entity_id = event.data["entity_id"]
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self.incremental_updates += 1
+            self._remove(entity_id)
+            return
+        if old_state is None or old_state.name != new_state.name:
+            self.async_refresh_entity(entity_id)
+            return
+        if (entity := self._entities.get(entity_id)) is not None:
+            entity["state"] = new_state.state
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        if old_entity_id := event.data.get("old_entity_id"):
+            self._remove(old_entity_id)
+        self.async_refresh_entity(event.data["entity_id"])
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        if event.data.get("action") != "update":
+            return
+        if "area_id" not in (event.data.get("changes") or {}):
+            return
+        registry = entity_registry.async_get(self.hass)
+        for entry in entity_registry.async_entries_for_device(
+            registry, event.data["device_id"]
+        ):
+            self.async_refresh_entity(entry.entity_id)
+
+    @callback
+    def _async_area_registry_updated(self, event: Event) -> None:
+        area_id = event.data.get("area_id")
+        affected = [
+            entity_id
+            for entity_id, entity in self._entities.items()
+            if entity.get("area_id") == area_id
+        ]
+        for entity_id in affected:
+            self.async_refresh_entity(entity_id)
+
+    @callback
+    def _async_exposure_changed(self) -> None:
+        self.async_rebuild()
+
+
+@callback
+def async_get_entity_index(hass: HomeAssistant) -> EntityIndex:
+    """Return the shared entity index.
+
+    Only config entries hold references to the shared index. With none
+    loaded, a one-off snapshot is built instead; it subscribes to nothing,
+    so there is no reference for the caller to release.
+    """
+    index: EntityIndex | None = hass.data.get(DATA_ENTITY_INDEX)
+    if index is None:
+        index = EntityIndex(hass)
+        index.async_rebuild()
+    return index
+
+
+@callback
+def async_setup_entity_index(hass: HomeAssistant) -> EntityIndex:
+    """Start (or take another reference to) the shared entity index."""
+    index: EntityIndex | None = hass.data.get(DATA_ENTITY_INDEX)
+    if index is None:
+        index = hass.data[DATA_ENTITY_INDEX] = EntityIndex(hass)
+    index.async_start()
+    return index
+
+
+@callback
+def async_release_entity_index(hass: HomeAssistant) -> None:
+    """Drop one reference to the shared entity index."""
+    index: EntityIndex | None = hass.data.get(DATA_ENTITY_INDEX)
+    if index is not None and index.async_stop():
+        hass.data.pop(DATA_ENTITY_INDEX, None)
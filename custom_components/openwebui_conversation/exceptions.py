@@ -4,6 +4,9 @@ from homeassistant.exceptions import HomeAssistantError
 class ApiClientError(HomeAssistantError):
     """Exception to indicate a general API error."""
 
+    # HTTP status of the response that failed, when there was one.
+    status: int | None = None
+
 class ApiCommError(ApiClientError):
     """Exception to indicate a communication error."""
 
@@ -12,3 +15,25 @@ class ApiJsonError(ApiClientError):
 
 class ApiTimeoutError(ApiClientError):
      """Exception to indicate a timeout error."""
+
+     phase = "request"
+
+class ApiConnectTimeoutError(ApiTimeoutError):
+    """Exception to indicate the connection could not be established in time."""
+
+    phase = "connect"
+
+class ApiFirstByteTimeoutError(ApiTimeoutError):
+    """Exception to indicate the server did not start responding in time."""
+
+    phase = "first_byte"
+
+class ApiFirstTokenTimeoutError(ApiTimeoutError):
+    """Exception to indicate the model did not produce a first token in time."""
+
+    phase = "first_token"
+
+class ApiChunkTimeoutError(ApiTimeoutError):
+    """Exception to indicate a stream stalled between chunks."""
+
+    phase = "inter_chunk"
@@ -0,0 +1,237 @@
+"""Local grammar for simple device commands, answered before the model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .alias_overrides import AliasOverrides
+from .const import (
+    CONF_FAST_PATH_ENABLED,
+    DEFAULT_FAST_PATH_ENABLED,
+    DOMAIN,
+)
+from .entity_index import async_get_entity_index, lookup_variants
+from .helpers import normalize_utterance
+
+DATA_FAST_PATHS = f"{DOMAIN}_fast_paths"
+
+# Weight of the newest sample in the running latency averages.
+LATENCY_SMOOTHING = 0.2
+# The grammar below is English.
+FAST_PATH_LANGUAGE = "en"
+
+_ARTICLE = r"(?:the\s+)?"
+_POLITE = r"(?:please\s+)?"
+_POLITE_END = r"(?:\s+please)?"
+
+# (template, domains the target may be in, pattern). Names are matched against
+# the entity index afterwards, so the patterns only split verb from target.
+_TEMPLATES: tuple[tuple[str, tuple[str, ...], re.Pattern[str]], ...] = (
+    (
+        "on_off",
+        ("light", "switch"),
+        re.compile(
+            rf"^{_POLITE}(?:turn|switch)\s+(?P<state>on|off)\s+{_ARTICLE}"
+            rf"(?P<name>.+?){_POLITE_END}$"
+        ),
+    ),
+    (
+        "on_off",
+        ("light", "switch"),
+        re.compile(
+            rf"^{_POLITE}(?:turn|switch)\s+{_ARTICLE}(?P<name>.+?)\s+"
+            rf"(?P<state>on|off){_POLITE_END}$"
+        ),
+    ),
+    (
+        "brightness",
+        ("light",),
+        re.compile(
+            rf"^{_POLITE}(?:set|dim|turn)\s+{_ARTICLE}(?P<name>.+?)\s+"
+            r"(?:brightness\s+)?to\s+(?P<brightness>\d{1,3})\s*(?:%|percent)"
+            rf"(?:\s+brightness)?{_POLITE_END}$"
+        ),
+    ),
+    (
+        "temperature",
+        ("climate",),
+        re.compile(
+            rf"^{_POLITE}set\s+{_ARTICLE}(?P<name>.+?)\s+(?:temperature\s+)?to\s+"
+            r"(?P<temperature>\d{1,3}(?:\.\d)?)\s*(?:degrees?|°)?"
+            rf"{_POLITE_END}$"
+        ),
+    ),
+    (
+        "media",
+        ("media_player",),
+        re.compile(
+            rf"^{_POLITE}(?P<action>pause|play|resume|stop|mute|unmute)\s+"
+            rf"{_ARTICLE}(?P<name>.+?){_POLITE_END}$"
+        ),
+    ),
+)
+
+_TOOL_BY_DOMAIN = {
+    "light": "control_lights",
+    "switch": "control_switches",
+    "media_player": "media_player_command",
+    "climate": "climate_set_temperature",
+}
+
+
+@dataclass(slots=True)
+class FastPathMatch:
+    """A command the local grammar understood, as a tool call."""
+
+    template: str
+    entity_id: str
+    tool_call: dict[str, Any]
+
+
+class FastPath:
+    """Match simple commands against a fixed grammar and the entity index.
+
+    Handles on/off, light brightness, climate temperature and media
+    play/pause/stop/mute in English. A command is only taken when its
+    target name resolves, through the alias overrides or an exact entity
+    index key, to exactly one exposed entity of a domain the command
+    applies to; every other utterance falls through to the model.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.attempts = 0
+        self.hits = 0
+        self.ambiguous = 0
+        self.fast_seconds: float | None = None
+        self.model_seconds: float | None = None
+        self.seconds_saved = 0.0
+
+    @staticmethod
+    def handles_language(language: str | None) -> bool:
+        """Return True if utterances in this language can use the grammar."""
+        return bool(language) and (
+            re.split(r"[-_]", language, maxsplit=1)[0].casefold() == FAST_PATH_LANGUAGE
+        )
+
+    @callback
+    def async_match(
+        self,
+        hass: HomeAssistant,
+        text: str,
+        alias_map: AliasOverrides | None = None,
+    ) -> FastPathMatch | None:
+        """Return the tool call for an unambiguous simple command."""
+        self.attempts += 1
+        utterance = normalize_utterance(text)
+        for template, domains, pattern in _TEMPLATES:
+            if (match := pattern.match(utterance)) is None:
+                continue
+            entity_ids = _resolve_target(hass, match["name"], domains, alias_map)
+            if len(entity_ids) != 1:
+                if entity_ids:
+                    self.ambiguous += 1
+                continue
+            entity_id = next(iter(entity_ids))
+            if (parameters := _parameters(template, match)) is None:
+                continue
+            domain = entity_id.split(".", 1)[0]
+            return FastPathMatch(
+                template,
+                entity_id,
+                {
+                    "id": "fast_path_1",
+                    "name": _TOOL_BY_DOMAIN[domain],
+                    "parameters": {"entity_ids": [entity_id], **parameters},
+                },
+            )
+        return None
+
+    def record_hit(self, seconds: float) -> None:
+        """Record a command answered locally and the time it took."""
+        self.hits += 1
+        self.fast_seconds = _smooth(self.fast_seconds, seconds)
+        if self.model_seconds is not None:
+            self.seconds_saved += max(0.0, self.model_seconds - seconds)
+
+    def record_model_turn(self, seconds: float) -> None:
+        """Record how long a tool turn through the model took, for comparison."""
+        self.model_seconds = _smooth(self.model_seconds, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return fast-path statistics."""
+        return {
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.attempts if self.attempts else None,
+            "ambiguous": self.ambiguous,
+            "average_fast_path_seconds": self.fast_seconds,
+            "average_model_tool_turn_seconds": self.model_seconds,
+            "estimated_seconds_saved": self.seconds_saved,
+        }
+
+
+def _smooth(average: float | None, sample: float) -> float:
+    if average is None:
+        return sample
+    return average + LATENCY_SMOOTHING * (sample - average)
+
+
+def _resolve_target(
+    hass: HomeAssistant,
+    name: str,
+    domains: tuple[str, ...],
+    alias_map: AliasOverrides | None,
+) -> set[str]:
+    if alias_map and (entity_id := alias_map.async_resolve(hass, name)):
+        return {entity_id} if entity_id.split(".", 1)[0] in domains else set()
+    index = async_get_entity_index(hass)
+    entity_ids: set[str] = set()
+    for key in lookup_variants(name) | {name}:
+        for domain in domains:
+            entity_ids.update(
+                entity["entity_id"] for entity in index.lookup(key, domain)
+            )
+    return entity_ids
+
+
+def _parameters(template: str, match: re.Match[str]) -> dict[str, Any] | None:
+    if template == "on_off":
+        return {"state": match["state"]}
+    if template == "brightness":
+        brightness = int(match["brightness"])
+        if not 1 <= brightness <= 100:
+            return None
+        return {"state": "on", "brightness_pct": brightness}
+    if template == "temperature":
+        return {"temperature_c": float(match["temperature"])}
+    action = match["action"]
+    return {"action": "play" if action == "resume" else action}
+
+
+@callback
+def async_setup_fast_path(hass: HomeAssistant, entry: ConfigEntry) -> FastPath | None:
+    """Create the entry's fast path if the option is enabled."""
+    fast_paths = hass.data.setdefault(DATA_FAST_PATHS, {})
+    if not entry.options.get(CONF_FAST_PATH_ENABLED, DEFAULT_FAST_PATH_ENABLED):
+        fast_paths.pop(entry.entry_id, None)
+        return None
+    fast_path = fast_paths[entry.entry_id] = FastPath()
+    return fast_path
+
+
+@callback
+def async_get_fast_path(hass: HomeAssistant, entry: ConfigEntry) -> FastPath | None:
+    """Return the entry's fast path, or None if it is off."""
+    return hass.data.get(DATA_FAST_PATHS, {}).get(entry.entry_id)
+
+
+@callback
+def async_release_fast_path(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the entry's fast path."""
+    hass.data.get(DATA_FAST_PATHS, {}).pop(entry.entry_id, None)
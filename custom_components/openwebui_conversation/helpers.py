@@ -3,41 +3,57 @@
 from homeassistant.helpers import area_registry, device_registry
 from homeassistant.components.conversation import DOMAIN as CONVERSATION_DOMAIN
 from homeassistant.components.homeassistant.exposed_entities import async_should_expose
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry
 
 
-def get_exposed_entities(hass: HomeAssistant) -> list[dict]:
-    """Return exposed entities."""
+def exposed_entity_info(hass: HomeAssistant, state: State) -> dict | None:
+    """Return the exposed entity description for a state, or None if hidden."""
+    if not async_should_expose(hass, CONVERSATION_DOMAIN, state.entity_id):
+        return None
     hass_entity = entity_registry.async_get(hass)
     hass_device = device_registry.async_get(hass)
     hass_area = area_registry.async_get(hass)
-    exposed_entities: list[dict] = []
 
-    for state in hass.states.async_all():
-        if async_should_expose(hass, CONVERSATION_DOMAIN, state.entity_id):
-            entity = hass_entity.async_get(state.entity_id)
-            aliases = list(entity.aliases) if entity and entity.aliases else []
-            area_names: list[str] = []
-            area_id = entity.area_id if entity else None
-            if area_id:
-                if area_entry := hass_area.async_get_area(area_id):
-                    area_names.append(area_entry.name)
-            elif entity and entity.device_id:
-                if device := hass_device.async_get(entity.device_id):
-                    if device.area_id and (area_entry := hass_area.async_get_area(device.area_id)):
-                        area_names.append(area_entry.name)
-
-            for area_name in area_names:
-                if area_name and area_name not in aliases:
-                    aliases.append(area_name)
-            exposed_entities.append(
-                {
-                    "entity_id": state.entity_id,
-                    "name": state.name,
-                    "state": state.state,
-                    "aliases": aliases,
-                }
-            )
+    entity = hass_entity.async_get(state.entity_id)
+    aliases = list(entity.aliases) if entity and entity.aliases else []
+    area_names: list[str] = []
+    area_id = entity.area_id if entity else None
+    if area_id:
+        if area_entry := hass_area.async_get_area(area_id):
+            area_names.append(area_entry.name)
+    elif entity and entity.device_id:
+        if device := hass_device.async_get(entity.device_id):
+            area_id = device.area_id
+            if area_id and (area_entry := hass_area.async_get_area(area_id)):
+                area_names.append(area_entry.name)
 
+    for area_name in area_names:
+        if area_name and area_name not in aliases:
+            aliases.append(area_name)
+    return {
+        "entity_id": state.entity_id,
+        "name": state.name,
+        "state": state.state,
+        "aliases": aliases,
+        "area_id": area_id,
+        "device_id": entity.device_id if entity else None,
+    }
+
+
+def get_exposed_entities(hass: HomeAssistant) -> list[dict]:
+    """Return exposed entities."""
+    exposed_entities: list[dict] = []
+    for state in hass.states.async_all():
+        if (info := exposed_entity_info(hass, state)) is not None:
+            exposed_entities.append(info)
     return exposed_entities
+
+
+def normalize_utterance(text: str) -> str:
+    """Return an utterance folded for exact-match lookups.
+
+    Case, surrounding and repeated whitespace and trailing punctuation are
+    ignored, so "Tell me a joke." and "tell me a joke" match.
+    """
+    return " ".join(text.casefold().split()).rstrip(".!?,;: ")
@@ -0,0 +1,258 @@
+"""Keep the chat model loaded on the backend according to a configured policy."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import time as dt_time
+from time import monotonic, time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .api import OpenWebUIApiClient
+from .const import (
+    CONF_KEEP_ALIVE_END,
+    CONF_KEEP_ALIVE_IDLE_MINUTES,
+    CONF_KEEP_ALIVE_POLICY,
+    CONF_KEEP_ALIVE_START,
+    CONF_MODEL,
+    DEFAULT_KEEP_ALIVE_END,
+    DEFAULT_KEEP_ALIVE_IDLE_MINUTES,
+    DEFAULT_KEEP_ALIVE_POLICY,
+    DEFAULT_KEEP_ALIVE_START,
+    DEFAULT_MODEL,
+    KEEP_ALIVE_ALWAYS,
+    KEEP_ALIVE_SCHEDULED,
+    LOGGER,
+)
+from .exceptions import ApiClientError, ApiTimeoutError
+from .model_catalog import ModelCatalog
+
+# Keep-alive values are in minutes: -1 keeps the model loaded indefinitely and
+# 0 unloads it as soon as the request finishes.
+KEEP_ALIVE_FOREVER = -1
+KEEP_ALIVE_UNLOAD = 0
+WARMUP_PROMPT = "Hi"
+# /ollama/api/ps answers these when the backend cannot report loaded models;
+# any other failure is treated as transient.
+UNSUPPORTED_STATUSES = (404, 405)
+
+
+def keep_alive_fields(minutes: int) -> dict[str, Any]:
+    """Return the request fields that set the backend keep-alive."""
+    return {
+        "params": {"keep_alive": f"{minutes}m"},
+        "options": {"keep_alive": minutes * 60 if minutes > 0 else minutes},
+    }
+
+
+def _parse_time(value: Any, default: str) -> dt_time:
+    parsed = dt_util.parse_time(str(value)) if value else None
+    return parsed or dt_util.parse_time(default)
+
+
+def _same_model(running: str, model: str) -> bool:
+    # Ollama reports "name:tag"; an untagged id means the "latest" tag.
+    if ":" not in running:
+        running = f"{running}:latest"
+    if ":" not in model:
+        model = f"{model}:latest"
+    return running == model
+
+
+class ModelKeepAlive:
+    """Warm the chat model when it is cold and pick the keep-alive per request.
+
+    Policies:
+
+    * ``always_hot`` keeps the model loaded indefinitely and reloads it
+      whenever the backend reports it unloaded.
+    * ``scheduled`` does the same between the configured start and end
+      times; once the window closes the model is unloaded and requests
+      fall back to the idle timeout.
+    * ``unload_when_idle`` lets the backend unload the model after the
+      configured number of idle minutes.
+
+    Whether the model is loaded is read from ``/ollama/api/ps`` when the
+    backend is Ollama behind OpenWebUI. Other backends do not report it, so
+    a warm-up still runs at startup and after the backend comes back from
+    an outage, which is when the first voice command would otherwise pay
+    for the model load.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: OpenWebUIApiClient,
+        model_catalog: ModelCatalog,
+        options: Mapping[str, Any],
+        on_update: Callable[[], None],
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.client = client
+        self.model_catalog = model_catalog
+        self.model: str = options.get(CONF_MODEL, DEFAULT_MODEL)
+        self.policy: str = options.get(
+            CONF_KEEP_ALIVE_POLICY, DEFAULT_KEEP_ALIVE_POLICY
+        )
+        self.start = _parse_time(
+            options.get(CONF_KEEP_ALIVE_START), DEFAULT_KEEP_ALIVE_START
+        )
+        self.end = _parse_time(options.get(CONF_KEEP_ALIVE_END), DEFAULT_KEEP_ALIVE_END)
+        self.idle_minutes = max(
+            1,
+            int(
+                options.get(
+                    CONF_KEEP_ALIVE_IDLE_MINUTES, DEFAULT_KEEP_ALIVE_IDLE_MINUTES
+                )
+            ),
+        )
+        self._on_update = on_update
+        self._running = False
+        self._needs_warmup = True
+        self._was_hot = False
+        self._reports_loaded: bool | None = None
+        self.model_loaded: bool | None = None
+        self.warmups = 0
+        self.warmup_failures = 0
+        self.last_warmup_seconds: float | None = None
+        self.last_warmup_at: float | None = None
+        self.last_error: str | None = None
+
+    @property
+    def hot(self) -> bool:
+        """Return True if the policy wants the model loaded right now."""
+        if self.policy == KEEP_ALIVE_ALWAYS:
+            return True
+        if self.policy != KEEP_ALIVE_SCHEDULED:
+            return False
+        now = dt_util.now().time()
+        if self.start <= self.end:
+            return self.start <= now < self.end
+        return now >= self.start or now < self.end
+
+    @callback
+    def keep_alive_minutes(self) -> int:
+        """Return the keep-alive to send with a chat request."""
+        return KEEP_ALIVE_FOREVER if self.hot else self.idle_minutes
+
+    @callback
+    def request_fields(self) -> dict[str, Any]:
+        """Return the keep-alive fields for a chat request."""
+        return keep_alive_fields(self.keep_alive_minutes())
+
+    @callback
+    def async_backend_unavailable(self) -> None:
+        """Record a failed health check so the next success warms the model."""
+        self._needs_warmup = True
+        self._reports_loaded = None
+        # A backend that does not answer /health has nothing loaded.
+        if self.model_loaded:
+            self.model_loaded = False
+            self._on_update()
+
+    @callback
+    def async_schedule(self) -> None:
+        """Check the model in the background unless a check is running."""
+        if self._running:
+            return
+        self._running = True
+        self.hass.async_create_background_task(
+            self._async_check(), "openwebui_conversation model keep-alive"
+        )
+
+    async def _async_check(self) -> None:
+        try:
+            hot = self.hot
+            loaded = await self._async_probe()
+            if hot:
+                if self._needs_warmup or not self._was_hot or loaded is False:
+                    await self._async_warm_up()
+            elif self._was_hot:
+                if loaded is not False:
+                    await self._async_unload()
+            elif self._needs_warmup and self.policy != KEEP_ALIVE_SCHEDULED:
+                # Startup or backend restart: load once, the idle timeout unloads.
+                await self._async_warm_up()
+            else:
+                self._needs_warmup = False
+            self._was_hot = hot
+        finally:
+            self._running = False
+            self._on_update()
+
+    async def _async_probe(self) -> bool | None:
+        if self._reports_loaded is False:
+            return self.model_loaded
+        try:
+            running = await self.client.async_get_running_models()
+        except ApiTimeoutError:
+            return self.model_loaded
+        except ApiClientError as err:
+            if err.status in UNSUPPORTED_STATUSES:
+                # Not an Ollama backend (or an older OpenWebUI): stop asking.
+                LOGGER.debug("Backend does not report loaded models: %s", err)
+                self._reports_loaded = False
+            else:
+                LOGGER.debug("Could not read the loaded models: %s", err)
+            return self.model_loaded
+        self._reports_loaded = True
+        base_model = self.model_catalog.base_model_id(self.model)
+        self.model_loaded = any(_same_model(name, base_model) for name in running)
+        return self.model_loaded
+
+    async def _async_warm_up(self) -> None:
+        started = monotonic()
+        try:
+            await self._async_complete(self.keep_alive_minutes())
+        except ApiClientError as err:
+            self.warmup_failures += 1
+            self.last_error = str(err)
+            LOGGER.warning("Could not warm up model %s: %s", self.model, err)
+            return
+        self._needs_warmup = False
+        self.model_loaded = True
+        self.warmups += 1
+        self.last_warmup_seconds = monotonic() - started
+        self.last_warmup_at = time()
+        self.last_error = None
+        LOGGER.debug(
+            "Warmed up model %s in %.2f s", self.model, self.last_warmup_seconds
+        )
+
+    async def _async_unload(self) -> None:
+        try:
+            await self._async_complete(KEEP_ALIVE_UNLOAD)
+        except ApiClientError as err:
+            self.last_error = str(err)
+            LOGGER.debug("Could not unload model %s: %s", self.model, err)
+            return
+        self.model_loaded = False
+
+    async def _async_complete(self, keep_alive: int) -> None:
+        await self.client.async_generate(
+            {
+                "model": self.model,
+                "messages": [{"role": "user", "content": WARMUP_PROMPT}],
+                "stream": False,
+                "max_tokens": 1,
+                **keep_alive_fields(keep_alive),
+            }
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return keep-alive state and warm-up statistics."""
+        return {
+            "policy": self.policy,
+            "hot": self.hot,
+            "keep_alive_minutes": self.keep_alive_minutes(),
+            "model_loaded": self.model_loaded,
+            "reports_loaded": self._reports_loaded,
+            "warmups": self.warmups,
+            "warmup_failures": self.warmup_failures,
+            "last_warmup_seconds": self.last_warmup_seconds,
+            "last_warmup_at": self.last_warmup_at,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,236 @@
+"""Per-turn latency phases and their rolling percentiles."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from math import ceil
+from time import monotonic, time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .usage import TokenUsage, parse_usage
+
+# Phase key and the label its sensors are named with, in turn order.
+PHASES: tuple[tuple[str, str], ...] = (
+    ("tool_ids", "Tool lookup"),
+    ("connect", "Connect"),
+    ("first_token", "First token"),
+    ("generation", "Generation"),
+    ("resolve", "Target resolution"),
+    ("service_call", "Service call"),
+    ("verify", "State verification"),
+    ("tool_execution", "Tool execution"),
+    ("follow_up", "Follow-up rounds"),
+    ("total", "Turn total"),
+)
+# Phases of one model request; a follow-up round's requests count towards
+# follow_up instead.
+REQUEST_PHASES = frozenset({"connect", "first_token", "generation"})
+PERCENTILES = (50, 95, 99)
+# Turns kept per phase for the rolling percentiles.
+LATENCY_WINDOW = 200
+# Turns kept whole, with their tool executions, for diagnostics.
+RECENT_TURNS = 20
+
+_CURRENT_TRACE: ContextVar[TurnTrace | None] = ContextVar(
+    "openwebui_conversation_turn_trace", default=None
+)
+
+
+class TurnTrace:
+    """Seconds spent in each phase of one conversation turn, and its tokens.
+
+    A phase entered more than once (one service call per tool) adds up.
+    Model requests made during a follow-up round only count as follow_up,
+    so no request is timed twice. Tool calls in the same batch run
+    concurrently, so their resolve, service call and verification phases
+    can together exceed the turn total.
+    """
+
+    def __init__(self) -> None:
+        """Start the turn clock."""
+        self.started = monotonic()
+        self.started_at = time()
+        self.phases: dict[str, float] = {}
+        self.usage = TokenUsage()
+        # How the turn was answered: model, fast_path, plan_cache or
+        # response_cache.
+        self.path = "model"
+        self.error: str | None = None
+        self.tools: list[dict[str, Any]] = []
+        self.follow_up_rounds = 0
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase."""
+        if self.follow_up_rounds and phase in REQUEST_PHASES:
+            return
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def finish(self) -> None:
+        """Record the time since the turn started as its total."""
+        self.phases["total"] = monotonic() - self.started
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the phases in milliseconds, in turn order."""
+        return {
+            phase: round(self.phases[phase] * 1000, 1)
+            for phase, _label in PHASES
+            if phase in self.phases
+        }
+
+    def summary(self) -> dict[str, Any]:
+        """Return the whole turn without the user's words, for diagnostics."""
+        return {
+            "started_at": self.started_at,
+            "path": self.path,
+            "error": self.error,
+            "phases_ms": self.as_dict(),
+            "usage": self.usage.as_dict() if self.usage.requests else None,
+            "tools": self.tools,
+        }
+
+
+@contextmanager
+def active_trace(trace: TurnTrace) -> Iterator[TurnTrace]:
+    """Make the trace the one phases are recorded into for this task."""
+    token = _CURRENT_TRACE.set(trace)
+    try:
+        yield trace
+    finally:
+        _CURRENT_TRACE.reset(token)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Add time to a phase of the current turn, if one is being traced."""
+    if (trace := _CURRENT_TRACE.get()) is not None:
+        trace.add(phase, seconds)
+
+
+def record_usage(usage: Any, measured_seconds: float | None = None) -> None:
+    """Add a completion's usage block to the current turn, if one is traced."""
+    if (trace := _CURRENT_TRACE.get()) is not None and (
+        parsed := parse_usage(usage, measured_seconds)
+    ):
+        trace.usage.add(parsed)
+
+
+def record_tool_execution(
+    tool_name: str, tool_result: dict[str, Any], seconds: float
+) -> None:
+    """Add an executed tool call to the current turn, if one is traced."""
+    if (trace := _CURRENT_TRACE.get()) is not None:
+        trace.tools.append(
+            {
+                "tool": tool_name,
+                "success": tool_result.get("success") is True,
+                "error": tool_result.get("error"),
+                "ms": round(seconds * 1000, 1),
+            }
+        )
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Time the block as a phase of the current turn, if one is being traced."""
+    if (trace := _CURRENT_TRACE.get()) is None:
+        yield
+        return
+    started = monotonic()
+    try:
+        yield
+    finally:
+        trace.add(phase, monotonic() - started)
+
+
+@contextmanager
+def timed_follow_up() -> Iterator[None]:
+    """Time a follow-up round, including its model request, as follow_up."""
+    if (trace := _CURRENT_TRACE.get()) is None:
+        yield
+        return
+    started = monotonic()
+    trace.follow_up_rounds += 1
+    try:
+        yield
+    finally:
+        trace.follow_up_rounds -= 1
+        trace.add("follow_up", monotonic() - started)
+
+
+def _percentile(ordered: list[float], percentile: int) -> float:
+    # Nearest rank: the smallest sample with at least this share at or below it.
+    return ordered[max(0, ceil(percentile / 100 * len(ordered)) - 1)]
+
+
+class LatencyStats:
+    """Rolling window of the last turns' phase timings for one entry."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Initialize empty windows."""
+        self._samples: dict[str, deque[float]] = {
+            phase: deque(maxlen=window) for phase, _label in PHASES
+        }
+        self._recent: deque[dict[str, Any]] = deque(maxlen=RECENT_TURNS)
+        self._listeners: list[Callable[[], None]] = []
+        self.turns = 0
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call back after every recorded turn; returns the unsubscribe."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_record(self, trace: TurnTrace) -> None:
+        """Add a finished turn to the windows and notify listeners."""
+        for phase, seconds in trace.phases.items():
+            if (samples := self._samples.get(phase)) is not None:
+                samples.append(seconds)
+        self._recent.append(trace.summary())
+        self.turns += 1
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def samples(self, phase: str) -> int:
+        """Return how many turns a phase's window holds."""
+        return len(self._samples.get(phase, ()))
+
+    def percentiles(self, phase: str) -> dict[int, float] | None:
+        """Return p50/p95/p99 seconds for a phase, or None before any sample."""
+        if not (samples := self._samples.get(phase)):
+            return None
+        ordered = sorted(samples)
+        return {
+            percentile: _percentile(ordered, percentile) for percentile in PERCENTILES
+        }
+
+    def recent_turns(self) -> list[dict[str, Any]]:
+        """Return the last turns, oldest first."""
+        return list(self._recent)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the sample counts and percentiles of every phase."""
+        return {
+            "turns": self.turns,
+            "phases": {
+                phase: {
+                    "samples": self.samples(phase),
+                    **{
+                        f"p{percentile}": seconds
+                        for percentile, seconds in (
+                            self.percentiles(phase) or {}
+                        ).items()
+                    },
+                }
+                for phase, _label in PHASES
+            },
+        }
@@ -4,18 +4,27 @@ from __future__ import annotations
 
 import asyncio
 from difflib import get_close_matches
-import json
-import re
 from dataclasses import dataclass
+from time import monotonic
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry
 
-from .const import LOGGER
-from .helpers import get_exposed_entities
+from .alias_overrides import AliasOverrides
+from .codec import json_loads
+from .const import DEFAULT_STATE_VERIFY_TIMEOUT, LOGGER
+from .entity_index import async_get_entity_index, lookup_key, lookup_variants
+from .latency import record_tool_execution, timed
+from .state_verifier import (
+    StatePredicate,
+    StateVerifier,
+    VerificationResult,
+    expect_climate,
+    expect_state,
+)
 
-LIGHT_STATE_SETTLE_SECONDS = 1.2
+MAX_LIGHT_TRANSITION_SECONDS = 300
 
 
 @dataclass
@@ -69,7 +78,7 @@ def _normalize_name_list(value: Any) -> list[str]:
             return []
         if text.startswith("[") and text.endswith("]"):
             try:
-                parsed = json.loads(text)
+                parsed = json_loads(text)
             except Exception:
                 parsed = None
             if isinstance(parsed, list):
@@ -80,31 +89,6 @@ def _normalize_name_list(value: Any) -> list[str]:
     return []
 
 
-def _lookup_key(value: str) -> str:
-    text = value.strip().lower()
-    text = re.sub(r"^[Tt]he\s+", "", text)
-    text = re.sub(r"[^\w\s\.]", " ", text)
-    text = text.replace("_", " ").replace("-", " ")
-    text = re.sub(r"\s+", " ", text)
-    return text
-
-
-def _lookup_variants(value: str) -> set[str]:
-    base = _lookup_key(value)
-    if not base:
-        return set()
-    variants = {base}
-    suffixes = (" light", " lights", " switch", " switches")
-    for suffix in suffixes:
-        if base.endswith(suffix):
-            trimmed = base[: -len(suffix)].strip()
-            if trimmed:
-                variants.add(trimmed)
-        else:
-            variants.add(f"{base}{suffix}")
-    return variants
-
-
 def _parse_json_from_text(content: str | None) -> dict[str, Any] | None:
     if not isinstance(content, str):
         return None
@@ -116,14 +100,14 @@ def _parse_json_from_text(content: str | None) -> dict[str, Any] | None:
         if len(lines) >= 3 and lines[0].startswith("```") and lines[-1].startswith("```"):
             text = "\n".join(lines[1:-1]).strip()
     try:
-        parsed = json.loads(text)
+        parsed = json_loads(text)
     except Exception:
         start = text.find("{")
         end = text.rfind("}")
         if start == -1 or end == -1 or end <= start:
             return None
         try:
-            parsed = json.loads(text[start : end + 1])
+            parsed = json_loads(text[start : end + 1])
         except Exception:
             return None
     return parsed if isinstance(parsed, dict) else None
@@ -146,7 +130,7 @@ def extract_tool_calls(response: dict[str, Any]) -> list[dict[str, Any]]:
             args = fn.get("arguments")
             if isinstance(args, str):
                 try:
-                    args = json.loads(args)
+                    args = json_loads(args)
                 except Exception:
                     parsed = _parse_json_from_text(args)
                     args = parsed if isinstance(parsed, dict) else {}
@@ -195,43 +179,15 @@ def extract_tool_calls(response: dict[str, Any]) -> list[dict[str, Any]]:
     return normalized_calls
 
 
-def _entity_index(hass: HomeAssistant) -> dict[str, list[dict[str, Any]]]:
-    index: dict[str, list[dict[str, Any]]] = {}
-    for entity in get_exposed_entities(hass):
-        entity_id = entity["entity_id"]
-        entity_name = entity["name"]
-        entity_slug = entity_id.split(".", 1)[-1]
-        keys = {
-            entity_id.lower(),
-            entity_slug.lower(),
-            entity_name.lower(),
-            _lookup_key(entity_id),
-            _lookup_key(entity_slug),
-            _lookup_key(entity_name),
-        }
-        for value in (entity_id, entity_slug, entity_name):
-            keys.update(_lookup_variants(value))
-        for alias in entity.get("aliases", []):
-            if alias:
-                alias_text = str(alias)
-                keys.add(alias_text.lower())
-                keys.add(_lookup_key(alias_text))
-                keys.update(_lookup_variants(alias_text))
-        for key in keys:
-            index.setdefault(key, []).append(entity)
-    return index
-
-
 def _resolve_via_alias_map(
     hass: HomeAssistant,
     names: list[str],
-    alias_map: dict[str, str] | None,
+    alias_map: AliasOverrides | None,
     expected_domain: str | None = None,
 ) -> tuple[list[str], list[str]]:
     if not alias_map:
         return [], []
 
-    state_ids = {state.entity_id for state in hass.states.async_all()}
     resolved_ids: list[str] = []
     resolved_names: list[str] = []
 
@@ -239,18 +195,11 @@ def _resolve_via_alias_map(
         raw_text = raw_name.strip()
         if not raw_text:
             continue
-        entity_id = (
-            alias_map.get(raw_text)
-            or alias_map.get(raw_text.casefold())
-            or alias_map.get(_lookup_key(raw_text))
-        )
+        entity_id = alias_map.async_resolve(hass, raw_text)
         if not entity_id:
             continue
         if expected_domain and not entity_id.startswith(f"{expected_domain}."):
             continue
-        if entity_id not in state_ids:
-            LOGGER.debug("Alias map resolved %r to missing entity %r", raw_name, entity_id)
-            continue
         if entity_id not in resolved_ids:
             resolved_ids.append(entity_id)
             resolved_names.append(raw_text)
@@ -262,7 +211,7 @@ def _resolve_entities(
     hass: HomeAssistant,
     names: list[str],
     expected_domain: str | None = None,
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
 ) -> tuple[list[str], list[str]]:
     alias_ids, alias_names = _resolve_via_alias_map(
         hass, names, alias_map, expected_domain
@@ -270,25 +219,19 @@ def _resolve_entities(
     if alias_ids:
         return alias_ids, alias_names
 
-    index = _entity_index(hass)
+    index = async_get_entity_index(hass)
     resolved_ids: list[str] = []
     resolved_names: list[str] = []
     for raw_name in names:
         raw_text = raw_name.strip()
         candidates: list[dict[str, Any]] = []
         seen_entity_ids: set[str] = set()
-        for lookup_value in _lookup_variants(raw_text) | {raw_text.lower()}:
-            for entity in index.get(lookup_value, []):
+        for lookup_value in lookup_variants(raw_text) | {raw_text.lower()}:
+            for entity in index.lookup(lookup_value, expected_domain):
                 if entity["entity_id"] in seen_entity_ids:
                     continue
                 seen_entity_ids.add(entity["entity_id"])
                 candidates.append(entity)
-        if expected_domain:
-            candidates = [
-                entity
-                for entity in candidates
-                if entity["entity_id"].split(".", 1)[0] == expected_domain
-            ]
         if not candidates:
             LOGGER.debug(
                 "Unable to resolve entity for %r in domain %r", raw_name, expected_domain
@@ -332,18 +275,16 @@ def _suggest_targets(
     requested_names: list[str],
     expected_domain: str | None = None,
 ) -> list[str]:
-    entities = get_exposed_entities(hass)
+    entities = async_get_entity_index(hass).entities(expected_domain)
     candidates: list[str] = []
     normalized_to_display: dict[str, str] = {}
     for entity in entities:
-        if expected_domain and not entity["entity_id"].startswith(f"{expected_domain}."):
-            continue
         display_values = [entity["name"], entity["entity_id"], *entity.get("aliases", [])]
         for display_value in display_values:
             if not display_value:
                 continue
             display_text = str(display_value).strip()
-            normalized = _lookup_key(display_text)
+            normalized = lookup_key(display_text)
             if not normalized:
                 continue
             normalized_to_display.setdefault(normalized, display_text)
@@ -351,7 +292,7 @@ def _suggest_targets(
 
     suggestions: list[str] = []
     for requested_name in requested_names:
-        requested_key = _lookup_key(requested_name)
+        requested_key = lookup_key(requested_name)
         if not requested_key:
             continue
         for match in get_close_matches(requested_key, candidates, n=3, cutoff=0.6):
@@ -435,11 +376,11 @@ def _resolve_direct_entity_ids(
     return resolved_ids, resolved_names
 
 
-def _resolve_entity_targets(
+def _entity_targets(
     hass: HomeAssistant,
     parameters: dict[str, Any],
     expected_domain: str | None = None,
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
 ) -> tuple[list[str], list[str]]:
     entity_candidates = _entity_ids_from_parameters(parameters)
     if entity_candidates:
@@ -454,30 +395,52 @@ def _resolve_entity_targets(
     return _resolve_entities(hass, names, expected_domain, alias_map)
 
 
+def _resolve_entity_targets(
+    hass: HomeAssistant,
+    parameters: dict[str, Any],
+    expected_domain: str | None = None,
+    alias_map: AliasOverrides | None = None,
+) -> tuple[list[str], list[str]]:
+    # Only execution is timed; planning a batch resolves the same targets.
+    with timed("resolve"):
+        return _entity_targets(hass, parameters, expected_domain, alias_map)
+
+
 async def _call_service(
     hass: HomeAssistant, domain: str, service: str, data: dict[str, Any]
 ) -> None:
-    await hass.services.async_call(domain, service, data, blocking=True)
+    with timed("service_call"):
+        await hass.services.async_call(domain, service, data, blocking=True)
 
 
-async def _read_entity_states_after_settle(
-    hass: HomeAssistant, entity_ids: list[str]
-) -> dict[str, str]:
-    if LIGHT_STATE_SETTLE_SECONDS > 0:
-        await asyncio.sleep(LIGHT_STATE_SETTLE_SECONDS)
-    await hass.async_block_till_done()
-    actual_states: dict[str, str] = {}
-    for entity_id in entity_ids:
-        state = hass.states.get(entity_id)
-        actual_states[entity_id] = state.state if state is not None else "missing"
-    return actual_states
+async def _call_service_verified(
+    hass: HomeAssistant,
+    domain: str,
+    service: str,
+    data: dict[str, Any],
+    entity_ids: list[str],
+    predicate: StatePredicate,
+    verify_timeout: float,
+) -> VerificationResult:
+    async with StateVerifier(hass, entity_ids, predicate) as verifier:
+        await _call_service(hass, domain, service, data)
+        with timed("verify"):
+            result = await verifier.async_wait(verify_timeout)
+    LOGGER.debug(
+        "Verified %s.%s for %s in %.0f ms (timed out: %s)",
+        domain,
+        service,
+        entity_ids,
+        result.elapsed * 1000,
+        result.timed_out,
+    )
+    return result
 
 
 def _partition_verified_targets(
     entity_ids: list[str],
     resolved_names: list[str],
-    actual_states: dict[str, str],
-    expected_state: str,
+    confirmed: set[str],
 ) -> tuple[list[str], list[str], list[str], list[str]]:
     name_by_entity: dict[str, str] = {}
     for index, entity_id in enumerate(entity_ids):
@@ -492,7 +455,7 @@ def _partition_verified_targets(
     failed_names: list[str] = []
     for entity_id in entity_ids:
         display_name = name_by_entity[entity_id]
-        if actual_states.get(entity_id) == expected_state:
+        if entity_id in confirmed:
             confirmed_ids.append(entity_id)
             confirmed_names.append(display_name)
         else:
@@ -519,10 +482,50 @@ def _verification_failure_message(
     return f"{joined_names} did not stay at the requested state."
 
 
+def _verified_step(
+    kind: str,
+    entity_ids: list[str],
+    resolved_names: list[str],
+    expected_state: str,
+    verification: VerificationResult,
+) -> ExecutedStep:
+    actual_states = verification.actual_states
+    confirmed_ids, confirmed_names, failed_ids, failed_names = _partition_verified_targets(
+        entity_ids, resolved_names, verification.confirmed
+    )
+    if failed_ids:
+        return ExecutedStep(
+            kind,
+            confirmed_names,
+            confirmed_ids,
+            expected_state,
+            details={
+                "success": False,
+                "attempted_names": resolved_names or entity_ids,
+                "attempted_entity_ids": entity_ids,
+                "confirmed_names": confirmed_names,
+                "confirmed_entity_ids": confirmed_ids,
+                "failed_names": failed_names,
+                "failed_entity_ids": failed_ids,
+                "actual_states": actual_states,
+                "message": _verification_failure_message(
+                    expected_state, failed_names, actual_states, failed_ids
+                ),
+            },
+        )
+    return ExecutedStep(
+        kind,
+        resolved_names or entity_ids,
+        entity_ids,
+        expected_state,
+    )
+
+
 async def _execute_control_lights(
     hass: HomeAssistant,
     parameters: dict[str, Any],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
+    verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
 ) -> ExecutedStep | None:
     entity_ids, resolved_names = _resolve_entity_targets(
         hass, parameters, "light", alias_map
@@ -544,7 +547,7 @@ async def _execute_control_lights(
         rgb = parameters.get("rgb")
         if isinstance(rgb, str):
             try:
-                rgb = json.loads(rgb)
+                rgb = json_loads(rgb)
             except Exception:
                 rgb = None
         if isinstance(rgb, list) and len(rgb) == 3:
@@ -552,44 +555,39 @@ async def _execute_control_lights(
                 data["rgb_color"] = [int(part) for part in rgb]
             except Exception:
                 pass
-    await _call_service(hass, "light", service, data)
+    transition = parameters.get("transition")
+    if isinstance(transition, str):
+        try:
+            transition = float(transition.strip())
+        except Exception:
+            transition = None
+    if (
+        isinstance(transition, (int, float))
+        and 0 <= transition <= MAX_LIGHT_TRANSITION_SECONDS
+    ):
+        data["transition"] = transition
+        # Lights turning off with a transition only report "off" at the end.
+        verify_timeout += float(transition)
     expected_state = "off" if service == "turn_off" else "on"
-    actual_states = await _read_entity_states_after_settle(hass, entity_ids)
-    confirmed_ids, confirmed_names, failed_ids, failed_names = _partition_verified_targets(
-        entity_ids, resolved_names, actual_states, expected_state
-    )
-    if failed_ids:
-        return ExecutedStep(
-            "lights",
-            confirmed_names,
-            confirmed_ids,
-            expected_state,
-            details={
-                "success": False,
-                "attempted_names": resolved_names or entity_ids,
-                "attempted_entity_ids": entity_ids,
-                "confirmed_names": confirmed_names,
-                "confirmed_entity_ids": confirmed_ids,
-                "failed_names": failed_names,
-                "failed_entity_ids": failed_ids,
-                "actual_states": actual_states,
-                "message": _verification_failure_message(
-                    expected_state, failed_names, actual_states, failed_ids
-                ),
-            },
-        )
-    return ExecutedStep(
-        "lights",
-        resolved_names or entity_ids,
+    verification = await _call_service_verified(
+        hass,
+        "light",
+        service,
+        data,
         entity_ids,
-        expected_state,
+        expect_state(expected_state),
+        verify_timeout,
+    )
+    return _verified_step(
+        "lights", entity_ids, resolved_names, expected_state, verification
     )
 
 
 async def _execute_control_switches(
     hass: HomeAssistant,
     parameters: dict[str, Any],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
+    verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
 ) -> ExecutedStep | None:
     entity_ids, resolved_names = _resolve_entity_targets(
         hass, parameters, "switch", alias_map
@@ -599,19 +597,25 @@ async def _execute_control_switches(
         return None
     state = str(parameters.get("state", "")).strip().lower()
     service = "turn_off" if state == "off" else "turn_on"
-    await _call_service(hass, "switch", service, {"entity_id": entity_ids})
-    return ExecutedStep(
-        "switches",
-        resolved_names or entity_ids,
+    expected_state = "off" if service == "turn_off" else "on"
+    verification = await _call_service_verified(
+        hass,
+        "switch",
+        service,
+        {"entity_id": entity_ids},
         entity_ids,
-        "off" if service == "turn_off" else "on",
+        expect_state(expected_state),
+        verify_timeout,
+    )
+    return _verified_step(
+        "switches", entity_ids, resolved_names, expected_state, verification
     )
 
 
 async def _execute_media_player_command(
     hass: HomeAssistant,
     parameters: dict[str, Any],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
 ) -> ExecutedStep | None:
     entity_ids, resolved_names = _resolve_entity_targets(
         hass, parameters, "media_player", alias_map
@@ -652,7 +656,8 @@ async def _execute_media_player_command(
 async def _execute_climate_set_temperature(
     hass: HomeAssistant,
     parameters: dict[str, Any],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
+    verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
 ) -> ExecutedStep | None:
     entity_ids, resolved_names = _resolve_entity_targets(
         hass, parameters, "climate", alias_map
@@ -677,12 +682,21 @@ async def _execute_climate_set_temperature(
     hvac_mode = parameters.get("hvac_mode")
     if isinstance(hvac_mode, str) and hvac_mode.strip():
         data["hvac_mode"] = hvac_mode.strip()
-    await _call_service(hass, "climate", "set_temperature", data)
-    return ExecutedStep(
+    verification = await _call_service_verified(
+        hass,
         "climate",
-        resolved_names or entity_ids,
+        "set_temperature",
+        data,
         entity_ids,
+        expect_climate(float(temperature_c), data.get("hvac_mode")),
+        verify_timeout,
+    )
+    return _verified_step(
+        "climate",
+        entity_ids,
+        resolved_names,
         f"{float(temperature_c):g}C",
+        verification,
     )
 
 
@@ -703,7 +717,7 @@ async def _execute_wait(parameters: dict[str, Any]) -> ExecutedStep | None:
 async def _execute_get_entity_state(
     hass: HomeAssistant,
     parameters: dict[str, Any],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
 ) -> ExecutedStep | None:
     targets = (
         _normalize_name_list(parameters.get("name_or_id"))
@@ -743,13 +757,7 @@ async def _execute_list_entities(
     parameters: dict[str, Any],
 ) -> ExecutedStep | None:
     domain = str(parameters.get("domain", "")).strip()
-    entities = get_exposed_entities(hass)
-    if domain:
-        entities = [
-            entity
-            for entity in entities
-            if entity["entity_id"].startswith(f"{domain}.")
-        ]
+    entities = async_get_entity_index(hass).entities(domain or None)
     normalized_entities = [
         {
             "entity_id": entity["entity_id"],
@@ -771,7 +779,7 @@ async def _execute_list_entities(
 async def _execute_control_device(
     hass: HomeAssistant,
     parameters: dict[str, Any],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
 ) -> ExecutedStep | None:
     entity_ids, resolved_names = _resolve_entity_targets(
         hass, parameters, alias_map=alias_map
@@ -796,7 +804,7 @@ async def _execute_control_device(
 async def _execute_call_service_raw(
     hass: HomeAssistant,
     parameters: dict[str, Any],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
 ) -> ExecutedStep | None:
     domain = str(parameters.get("domain", "")).strip()
     service = str(parameters.get("service", "")).strip()
@@ -813,7 +821,7 @@ async def _execute_call_service_raw(
     data_json = parameters.get("data_json")
     if isinstance(data_json, str) and data_json.strip():
         try:
-            parsed_data = json.loads(data_json)
+            parsed_data = json_loads(data_json)
         except Exception:
             parsed_data = None
         if isinstance(parsed_data, dict):
@@ -942,77 +950,301 @@ def describe_tool_execution_result(result: ToolExecutionResult) -> str | None:
     return None
 
 
-async def execute_tool_calls_detailed(
+TARGETED_TOOL_NAMES = frozenset(
+    {
+        "control_lights",
+        "control_switches",
+        "media_player_command",
+        "climate_set_temperature",
+        "get_entity_state",
+        "controlDevice",
+        "call_service_raw",
+    }
+)
+
+# Tools whose successful result is fully described by the spoken summary.
+ACTION_TOOL_NAMES = frozenset(
+    {
+        "control_lights",
+        "control_switches",
+        "media_player_command",
+        "climate_set_temperature",
+        "wait",
+    }
+)
+
+
+async def _execute_tool_call(
+    hass: HomeAssistant,
+    index: int,
+    tool_call: dict[str, Any],
+    alias_map: AliasOverrides | None = None,
+    verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
+) -> ToolExecutionResult:
+    """Execute one tool call and return its structured result."""
+    started = monotonic()
+    tool_call_id = str(tool_call.get("id") or f"tool_call_{index}")
+    name = _normalize_tool_name(tool_call.get("name"))
+    parameters = tool_call.get("parameters")
+    if not isinstance(parameters, dict):
+        parameters = {}
+    step: ExecutedStep | None = None
+    if name == "control_lights":
+        step = await _execute_control_lights(
+            hass, parameters, alias_map, verify_timeout
+        )
+    elif name == "control_switches":
+        step = await _execute_control_switches(
+            hass, parameters, alias_map, verify_timeout
+        )
+    elif name == "media_player_command":
+        step = await _execute_media_player_command(hass, parameters, alias_map)
+    elif name == "climate_set_temperature":
+        step = await _execute_climate_set_temperature(
+            hass, parameters, alias_map, verify_timeout
+        )
+    elif name == "wait":
+        step = await _execute_wait(parameters)
+    elif name == "get_entity_state":
+        step = await _execute_get_entity_state(hass, parameters, alias_map)
+    elif name == "list_entities":
+        step = await _execute_list_entities(hass, parameters)
+    elif name == "controlDevice":
+        step = await _execute_control_device(hass, parameters, alias_map)
+    elif name == "call_service_raw":
+        step = await _execute_call_service_raw(hass, parameters, alias_map)
+    else:
+        LOGGER.debug("Ignoring unsupported local tool call: %s", name)
+    if step is None:
+        LOGGER.debug("Tool call produced no executed step: %s", tool_call)
+        if name in TARGETED_TOOL_NAMES:
+            failure = _build_resolution_failure(hass, name, parameters)
+            tool_result = {
+                "success": False,
+                "error": "unresolved_target",
+                "tool_name": name or "unknown",
+                "requested_names": failure.requested_names,
+                "matched_names": failure.matched_names,
+                "suggestions": failure.suggestions,
+                "message": failure.message,
+            }
+        else:
+            tool_result = {
+                "success": False,
+                "error": "unsupported_or_unresolved_tool_call",
+                "tool_name": name or "unknown",
+            }
+    else:
+        tool_result = _tool_result_from_step(step)
+    record_tool_execution(name or "unknown", tool_result, monotonic() - started)
+    return ToolExecutionResult(
+        tool_call_id=tool_call_id,
+        tool_name=name or "unknown",
+        parameters=parameters,
+        step=step,
+        tool_result=tool_result,
+    )
+
+
+def _tool_call_targets(
+    hass: HomeAssistant,
+    tool_call: dict[str, Any],
+    alias_map: AliasOverrides | None = None,
+) -> set[str]:
+    """Return the entity_ids a tool call touches, including group members."""
+    name = _normalize_tool_name(tool_call.get("name"))
+    if name not in TARGETED_TOOL_NAMES:
+        return set()
+    parameters = tool_call.get("parameters")
+    if not isinstance(parameters, dict):
+        return set()
+    if name == "get_entity_state":
+        targets = (
+            _normalize_name_list(parameters.get("name_or_id"))
+            or _normalize_name_list(parameters.get("name"))
+            or _normalize_name_list(parameters.get("names"))
+            or _normalize_name_list(parameters.get("entity_id"))
+        )
+        entity_ids, _ = _resolve_entities(hass, targets, alias_map=alias_map)
+    else:
+        entity_ids, _ = _entity_targets(
+            hass, parameters, _target_domain_for_tool(name), alias_map
+        )
+    targets_with_members = set(entity_ids)
+    for entity_id in entity_ids:
+        state = hass.states.get(entity_id)
+        members = state.attributes.get("entity_id") if state is not None else None
+        if isinstance(members, (list, tuple)):
+            targets_with_members.update(str(member) for member in members)
+    return targets_with_members
+
+
+def plan_tool_call_batches(
     hass: HomeAssistant,
     tool_calls: list[dict[str, Any]],
-    alias_map: dict[str, str] | None = None,
-) -> list[ToolExecutionResult]:
-    """Execute supported tool calls in order with structured results."""
-    results: list[ToolExecutionResult] = []
+    alias_map: AliasOverrides | None = None,
+) -> list[list[tuple[int, dict[str, Any]]]]:
+    """Group consecutive tool calls into batches that can run concurrently.
+
+    A ``wait`` call is a barrier and always runs alone. Any other call joins
+    the current batch unless it touches an entity already targeted there, in
+    which case it starts a new batch so calls on the same device keep their
+    order. Batches are contiguous, so flattening them preserves the plan order.
+    """
+    batches: list[list[tuple[int, dict[str, Any]]]] = []
+    current: list[tuple[int, dict[str, Any]]] = []
+    current_targets: set[str] = set()
     for index, tool_call in enumerate(tool_calls, start=1):
-        tool_call_id = str(tool_call.get("id") or f"tool_call_{index}")
-        name = _normalize_tool_name(tool_call.get("name"))
-        parameters = tool_call.get("parameters")
-        if not isinstance(parameters, dict):
-            parameters = {}
-        step: ExecutedStep | None = None
-        if name == "control_lights":
-            step = await _execute_control_lights(hass, parameters, alias_map)
-        elif name == "control_switches":
-            step = await _execute_control_switches(hass, parameters, alias_map)
-        elif name == "media_player_command":
-            step = await _execute_media_player_command(hass, parameters, alias_map)
-        elif name == "climate_set_temperature":
-            step = await _execute_climate_set_temperature(hass, parameters, alias_map)
-        elif name == "wait":
-            step = await _execute_wait(parameters)
-        elif name == "get_entity_state":
-            step = await _execute_get_entity_state(hass, parameters, alias_map)
-        elif name == "list_entities":
-            step = await _execute_list_entities(hass, parameters)
-        elif name == "controlDevice":
-            step = await _execute_control_device(hass, parameters, alias_map)
-        elif name == "call_service_raw":
-            step = await _execute_call_service_raw(hass, parameters, alias_map)
+        if _normalize_tool_name(tool_call.get("name")) == "wait":
+            if current:
+                batches.append(current)
+            batches.append([(index, tool_call)])
+            current, current_targets = [], set()
+            continue
+        targets = _tool_call_targets(hass, tool_call, alias_map)
+        if current and targets & current_targets:
+            batches.append(current)
+            current, current_targets = [], set()
+        current.append((index, tool_call))
+        current_targets |= targets
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def execute_tool_call_batch(
+    hass: HomeAssistant,
+    batch: list[tuple[int, dict[str, Any]]],
+    alias_map: AliasOverrides | None = None,
+    verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
+) -> list[ToolExecutionResult]:
+    """Execute one planned batch concurrently, returning results in order."""
+    with timed("tool_execution"):
+        if len(batch) == 1:
+            index, tool_call = batch[0]
+            return [
+                await _execute_tool_call(
+                    hass, index, tool_call, alias_map, verify_timeout
+                )
+            ]
+        outcomes = await asyncio.gather(
+            *(
+                _execute_tool_call(hass, index, tool_call, alias_map, verify_timeout)
+                for index, tool_call in batch
+            ),
+            return_exceptions=True,
+        )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return list(outcomes)
+
+
+class ToolCallDispatcher:
+    """Start tool calls as soon as they are known, keeping plan semantics.
+
+    Each dispatched call runs as its own task but first waits for the last
+    ``wait`` barrier and for any earlier call that shares one of its targets,
+    which gives the same ordering guarantees as plan_tool_call_batches while
+    letting device latency overlap with the rest of the model stream.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        alias_map: AliasOverrides | None = None,
+        verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
+    ) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self.alias_map = alias_map
+        self.verify_timeout = verify_timeout
+        self.tool_calls: list[dict[str, Any]] = []
+        self._tasks: list[asyncio.Task[ToolExecutionResult]] = []
+        self._targets: list[set[str]] = []
+        self._barrier: asyncio.Task[ToolExecutionResult] | None = None
+        self._since_barrier: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of dispatched tool calls."""
+        return len(self._tasks)
+
+    def dispatch(self, tool_call: dict[str, Any]) -> None:
+        """Start executing a complete tool call."""
+        index = len(self._tasks) + 1
+        is_barrier = _normalize_tool_name(tool_call.get("name")) == "wait"
+        if is_barrier:
+            targets: set[str] = set()
+            dependencies = [self._tasks[i] for i in self._since_barrier]
         else:
-            LOGGER.debug("Ignoring unsupported local tool call: %s", name)
-        if step is None:
-            LOGGER.debug("Tool call produced no executed step: %s", tool_call)
-            if name in {
-                "control_lights",
-                "control_switches",
-                "media_player_command",
-                "climate_set_temperature",
-                "get_entity_state",
-                "controlDevice",
-                "call_service_raw",
-            }:
-                failure = _build_resolution_failure(hass, name, parameters)
-                tool_result = {
-                    "success": False,
-                    "error": "unresolved_target",
-                    "tool_name": name or "unknown",
-                    "requested_names": failure.requested_names,
-                    "matched_names": failure.matched_names,
-                    "suggestions": failure.suggestions,
-                    "message": failure.message,
-                }
-            else:
-                tool_result = {
-                    "success": False,
-                    "error": "unsupported_or_unresolved_tool_call",
-                    "tool_name": name or "unknown",
-                }
+            targets = _tool_call_targets(self.hass, tool_call, self.alias_map)
+            dependencies = [
+                self._tasks[i]
+                for i in self._since_barrier
+                if self._targets[i] & targets
+            ]
+        if self._barrier is not None:
+            dependencies.append(self._barrier)
+        task = self.hass.async_create_task(
+            self._async_run(index, tool_call, dependencies),
+            f"openwebui_conversation tool call {index}",
+        )
+        self.tool_calls.append(tool_call)
+        self._tasks.append(task)
+        self._targets.append(targets)
+        if is_barrier:
+            self._barrier = task
+            self._since_barrier = []
         else:
-            tool_result = _tool_result_from_step(step)
-        results.append(
-            ToolExecutionResult(
-                tool_call_id=tool_call_id,
-                tool_name=name or "unknown",
-                parameters=parameters,
-                step=step,
-                tool_result=tool_result,
-            )
+            self._since_barrier.append(len(self._tasks) - 1)
+
+    async def _async_run(
+        self,
+        index: int,
+        tool_call: dict[str, Any],
+        dependencies: list[asyncio.Task[ToolExecutionResult]],
+    ) -> ToolExecutionResult:
+        for dependency in dependencies:
+            await dependency
+        return await _execute_tool_call(
+            self.hass, index, tool_call, self.alias_map, self.verify_timeout
+        )
+
+    async def async_cancel(self) -> None:
+        """Cancel calls still running and collect every outcome.
+
+        For when the stream that dispatched them failed: nothing will ask
+        for the results, so pending device actions stop here and errors of
+        finished ones are retrieved instead of logged as never retrieved.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def async_results(self) -> list[ToolExecutionResult]:
+        """Wait for every dispatched call and return results in plan order."""
+        with timed("tool_execution"):
+            outcomes = await asyncio.gather(*self._tasks, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return list(outcomes)
+
+
+async def execute_tool_calls_detailed(
+    hass: HomeAssistant,
+    tool_calls: list[dict[str, Any]],
+    alias_map: AliasOverrides | None = None,
+    verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
+) -> list[ToolExecutionResult]:
+    """Execute supported tool calls with structured results in plan order.
+
+    Independent calls run concurrently; see plan_tool_call_batches.
+    """
+    results: list[ToolExecutionResult] = []
+    for batch in plan_tool_call_batches(hass, tool_calls, alias_map):
+        results.extend(
+            await execute_tool_call_batch(hass, batch, alias_map, verify_timeout)
         )
     return results
 
@@ -1020,10 +1252,13 @@ async def execute_tool_calls_detailed(
 async def execute_tool_calls(
     hass: HomeAssistant,
     tool_calls: list[dict[str, Any]],
-    alias_map: dict[str, str] | None = None,
+    alias_map: AliasOverrides | None = None,
+    verify_timeout: float = DEFAULT_STATE_VERIFY_TIMEOUT,
 ) -> list[ExecutedStep]:
     """Execute supported tool calls in order."""
-    results = await execute_tool_calls_detailed(hass, tool_calls, alias_map)
+    results = await execute_tool_calls_detailed(
+        hass, tool_calls, alias_map, verify_timeout
+    )
     return [result.step for result in results if result.step is not None]
 
 
@@ -1077,6 +1312,15 @@ def summarize_executed_steps(steps: list[ExecutedStep]) -> str | None:
     return f"Done. {parts[0].capitalize()}, " + ", ".join(parts[1:-1]) + f", then {parts[-1]}."
 
 
+def is_successful_action_run(results: list[ToolExecutionResult]) -> bool:
+    """Return True if every result is a successful pure action."""
+    return bool(results) and all(
+        result.tool_name in ACTION_TOOL_NAMES
+        and result.tool_result.get("success") is True
+        for result in results
+    )
+
+
 def summarize_execution_results(results: list[ToolExecutionResult]) -> str | None:
     """Return a short spoken summary for mixed success/failure runs."""
     if not results:
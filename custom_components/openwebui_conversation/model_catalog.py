@@ -0,0 +1,179 @@
+"""Per-entry cache of the OpenWebUI model catalog (``/api/models``)."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic, time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import OpenWebUIApiClient
+from .const import LOGGER
+from .exceptions import ApiClientError
+
+# The coordinator refreshes every five minutes; readers only revalidate once
+# it has clearly missed a refresh.
+MODEL_CATALOG_TTL_SECONDS = 600.0
+# How long a turn waits for a catalog that has never loaded before it falls
+# back to the local tool prompt.
+COLD_CATALOG_WAIT_SECONDS = 2.0
+
+
+def _model_tool_ids(model: dict[str, Any]) -> list[str]:
+    info = model.get("info") or {}
+    meta = info.get("meta") or {}
+    tool_ids = meta.get("toolIds") or []
+    return [str(tool_id) for tool_id in tool_ids if tool_id]
+
+
+def _model_base_id(model: dict[str, Any]) -> str | None:
+    info = model.get("info") or {}
+    base_model_id = info.get("base_model_id")
+    return str(base_model_id) if base_model_id else None
+
+
+class ModelCatalog:
+    """Models and their tool ids for one config entry, with stale-while-revalidate.
+
+    Readers always get the cached catalog straight away. Once it is older
+    than the TTL the first reader schedules a background refresh; concurrent
+    readers share that refresh instead of issuing their own request. The
+    coordinator refreshes the catalog on every update, well inside the TTL,
+    so a voice turn normally finds fresh data and never waits on
+    ``/api/models``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: OpenWebUIApiClient,
+        ttl: float = MODEL_CATALOG_TTL_SECONDS,
+    ) -> None:
+        """Initialize the catalog."""
+        self.hass = hass
+        self.client = client
+        self.ttl = ttl
+        self._models: list[dict[str, Any]] = []
+        self._tool_ids: dict[str, list[str]] = {}
+        self._base_model_ids: dict[str, str] = {}
+        self._fetched_at: float | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self.fetched_at_timestamp: float | None = None
+        self.refresh_count = 0
+        self.refresh_failures = 0
+        self.last_error: str | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the catalog has been fetched at least once."""
+        return self._fetched_at is not None
+
+    @property
+    def age(self) -> float | None:
+        """Return the catalog age in seconds, or None if never fetched."""
+        if self._fetched_at is None:
+            return None
+        return monotonic() - self._fetched_at
+
+    @property
+    def stale(self) -> bool:
+        """Return True if the catalog is missing or older than the TTL."""
+        age = self.age
+        return age is None or age >= self.ttl
+
+    @property
+    def models(self) -> list[dict[str, Any]]:
+        """Return the cached models without refreshing."""
+        return self._models
+
+    async def async_refresh(self) -> None:
+        """Fetch the catalog now, joining a refresh that is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_task(self._async_fetch())
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_fetch(self) -> None:
+        try:
+            models = await self.client.async_get_models()
+        except ApiClientError as err:
+            self.refresh_failures += 1
+            self.last_error = str(err)
+            LOGGER.debug("Could not refresh the model catalog: %s", err)
+            return
+        self._models = models
+        self._tool_ids = {
+            str(model["id"]): _model_tool_ids(model)
+            for model in models
+            if isinstance(model, dict) and model.get("id")
+        }
+        self._base_model_ids = {
+            str(model["id"]): base_model_id
+            for model in models
+            if isinstance(model, dict)
+            and model.get("id")
+            and (base_model_id := _model_base_id(model))
+        }
+        self._fetched_at = monotonic()
+        self.fetched_at_timestamp = time()
+        self.refresh_count += 1
+        self.last_error = None
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Refresh in the background if the catalog is stale."""
+        if not self.stale or (
+            self._refresh_task is not None and not self._refresh_task.done()
+        ):
+            return
+        self._refresh_task = self.hass.async_create_background_task(
+            self._async_fetch(), "openwebui_conversation model catalog refresh"
+        )
+
+    @callback
+    def async_tool_ids(self, model: str) -> list[str]:
+        """Return the cached tool ids for a model, revalidating if stale."""
+        self.async_schedule_refresh()
+        return self._tool_ids.get(model, [])
+
+    async def async_wait_tool_ids(
+        self, model: str, timeout: float = COLD_CATALOG_WAIT_SECONDS
+    ) -> list[str]:
+        """Return the tool ids for a model, fetching a cold catalog first.
+
+        Only a catalog that has never loaded is waited on, for at most
+        ``timeout`` seconds; the fetch itself keeps running past that.
+        """
+        if self.loaded:
+            return self.async_tool_ids(model)
+        try:
+            async with asyncio.timeout(timeout):
+                await self.async_refresh()
+        except TimeoutError:
+            LOGGER.debug("Model catalog not fetched within %.1fs", timeout)
+        return self._tool_ids.get(model, [])
+
+    def base_model_id(self, model: str) -> str:
+        """Return the backend model an OpenWebUI custom model is built on."""
+        return self._base_model_ids.get(model, model)
+
+    async def async_get_models(self) -> list[dict[str, Any]]:
+        """Return the models, fetching only if nothing is cached yet."""
+        if not self.loaded:
+            await self.async_refresh()
+        else:
+            self.async_schedule_refresh()
+        return self._models
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            "models": len(self._models),
+            "age": self.age,
+            "ttl": self.ttl,
+            "fetched_at": self.fetched_at_timestamp,
+            "refresh_count": self.refresh_count,
+            "refresh_failures": self.refresh_failures,
+            "last_error": self.last_error,
+            "tool_ids": self._tool_ids,
+        }
@@ -0,0 +1,224 @@
+"""Cache of tool plans for repeated voice commands, replayed without the model."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry
+
+from .codec import json_bytes
+from .const import (
+    CONF_PLAN_CACHE_ENABLED,
+    CONF_PLAN_CACHE_MIN_CONFIDENCE,
+    CONF_PLAN_CACHE_SIZE,
+    CONF_PLAN_CACHE_TTL,
+    DEFAULT_PLAN_CACHE_ENABLED,
+    DEFAULT_PLAN_CACHE_MIN_CONFIDENCE,
+    DEFAULT_PLAN_CACHE_SIZE,
+    DEFAULT_PLAN_CACHE_TTL,
+    DOMAIN,
+    LOGGER,
+)
+from .helpers import normalize_utterance
+from .local_executor import ToolExecutionResult
+
+DATA_PLAN_CACHES = f"{DOMAIN}_plan_caches"
+
+# A later round may have acted on what these returned, so replaying the
+# plan without the model could do the wrong thing.
+READ_ONLY_TOOL_NAMES = frozenset({"get_entity_state", "list_entities"})
+
+
+@dataclass(slots=True)
+class CachedPlan:
+    """Normalized tool calls learned for one utterance."""
+
+    tool_calls: tuple[dict[str, Any], ...]
+    signature: bytes
+    stored_at: float
+    confidence: int = 1
+    hits: int = 0
+
+
+class PlanCache:
+    """LRU map of normalized utterances to tool plans that fully succeeded.
+
+    Every fully successful run of the same plan for an utterance raises its
+    confidence; a different plan replaces it at confidence one. A plan is
+    only replayed once its confidence reaches the configured minimum, is
+    dropped after the TTL or when a replay fails, and the whole cache is
+    cleared when an entity is renamed, re-aliased, moved or removed. Alias
+    override changes reload the entry, which starts a new cache.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_entries: int,
+        ttl: float,
+        min_confidence: int,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.min_confidence = max(1, min_confidence)
+        self._entries: OrderedDict[str, CachedPlan] = OrderedDict()
+        self._unsubscribe: CALLBACK_TYPE | None = None
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replay_failures = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached plans."""
+        return len(self._entries)
+
+    @callback
+    def async_start(self) -> None:
+        """Clear the cache whenever the entity registry changes."""
+        if self._unsubscribe is None:
+            self._unsubscribe = self.hass.bus.async_listen(
+                entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_entity_registry_updated,
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening for registry changes."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        if event.data.get("action") == "create" or not self._entries:
+            return
+        LOGGER.debug("Entity registry changed; clearing %s cached plans", len(self))
+        self._entries.clear()
+        self.invalidations += 1
+
+    def get(self, utterance: str) -> list[dict[str, Any]] | None:
+        """Return a confident, fresh plan for the utterance as new tool calls."""
+        key = normalize_utterance(utterance)
+        entry = self._entries.get(key)
+        if entry is not None and monotonic() - entry.stored_at >= self.ttl:
+            del self._entries[key]
+            self.expired += 1
+            entry = None
+        if entry is None or entry.confidence < self.min_confidence:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        self.hits += 1
+        return [
+            {"id": f"tool_call_{index}", **deepcopy(tool_call)}
+            for index, tool_call in enumerate(entry.tool_calls, start=1)
+        ]
+
+    def record(self, utterance: str, results: list[ToolExecutionResult]) -> bool:
+        """Learn the plan behind a run if every call succeeded."""
+        if not results or any(
+            result.tool_result.get("success") is not True
+            or result.tool_name in READ_ONLY_TOOL_NAMES
+            for result in results
+        ):
+            return False
+        tool_calls = tuple(
+            {"name": result.tool_name, "parameters": deepcopy(result.parameters)}
+            for result in results
+        )
+        signature = json_bytes(tool_calls)
+        key = normalize_utterance(utterance)
+        entry = self._entries.get(key)
+        if entry is not None and entry.signature == signature:
+            entry.confidence += 1
+            entry.stored_at = monotonic()
+        else:
+            self._entries[key] = CachedPlan(tool_calls, signature, monotonic())
+            self.stores += 1
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def discard(self, utterance: str) -> None:
+        """Forget the plan for an utterance after a failed replay."""
+        if self._entries.pop(normalize_utterance(utterance), None) is not None:
+            self.replay_failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        now = monotonic()
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "min_confidence": self.min_confidence,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "stores": self.stores,
+            "replay_failures": self.replay_failures,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "cached": [
+                {
+                    "age": now - entry.stored_at,
+                    "confidence": entry.confidence,
+                    "hits": entry.hits,
+                    "tools": [tool_call["name"] for tool_call in entry.tool_calls],
+                }
+                for entry in self._entries.values()
+            ],
+        }
+
+
+@callback
+def async_setup_plan_cache(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> PlanCache | None:
+    """Create and start the entry's plan cache if the option is enabled."""
+    caches = hass.data.setdefault(DATA_PLAN_CACHES, {})
+    if not entry.options.get(CONF_PLAN_CACHE_ENABLED, DEFAULT_PLAN_CACHE_ENABLED):
+        caches.pop(entry.entry_id, None)
+        return None
+    cache = PlanCache(
+        hass,
+        int(entry.options.get(CONF_PLAN_CACHE_SIZE, DEFAULT_PLAN_CACHE_SIZE)),
+        float(entry.options.get(CONF_PLAN_CACHE_TTL, DEFAULT_PLAN_CACHE_TTL)),
+        int(
+            entry.options.get(
+                CONF_PLAN_CACHE_MIN_CONFIDENCE, DEFAULT_PLAN_CACHE_MIN_CONFIDENCE
+            )
+        ),
+    )
+    cache.async_start()
+    caches[entry.entry_id] = cache
+    return cache
+
+
+@callback
+def async_get_plan_cache(hass: HomeAssistant, entry: ConfigEntry) -> PlanCache | None:
+    """Return the entry's plan cache, or None if it is off."""
+    return hass.data.get(DATA_PLAN_CACHES, {}).get(entry.entry_id)
+
+
+@callback
+def async_release_plan_cache(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop and forget the entry's plan cache."""
+    if cache := hass.data.get(DATA_PLAN_CACHES, {}).pop(entry.entry_id, None):
+        cache.async_stop()
@@ -0,0 +1,171 @@
+"""Warm up the OpenWebUI connection and local caches when a voice turn starts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+from homeassistant.components import assist_pipeline
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry
+
+from .api import OpenWebUIApiClient
+from .const import LOGGER
+from .entity_index import async_get_entity_index
+from .exceptions import ApiClientError
+from .model_catalog import ModelCatalog
+
+SATELLITE_DOMAIN = "assist_satellite"
+# Satellites switch to "listening" on wake word detection and on STT start.
+SATELLITE_LISTENING = "listening"
+# Several satellites waking together only need one warm-up.
+PREWARM_MIN_INTERVAL_SECONDS = 5.0
+# A satellite's pipeline is picked with a select entity on its device; this
+# option (and a satellite without the select) means the preferred pipeline.
+PIPELINE_SELECT_TRANSLATION_KEY = "pipeline"
+PIPELINE_PREFERRED = "preferred"
+
+
+class PipelinePrewarmer:
+    """Prepare for a voice turn while the user is still speaking.
+
+    Assist satellites report wake word detection and the start of speech to
+    text by entering the ``listening`` state. When that happens and the
+    satellite's pipeline uses this agent, the prewarmer touches ``/health`` on
+    the entry's pooled session (opening or reviving the TCP/TLS connection
+    the completion will reuse), revalidates the model catalog, makes sure
+    the entity index is built and compiles the search intents, so none of
+    that is left for after speech to text finishes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: OpenWebUIApiClient,
+        model_catalog: ModelCatalog,
+        agent_ids: Callable[[], set[str]],
+        warm_local: Callable[[], None],
+    ) -> None:
+        """Initialize the prewarmer."""
+        self.hass = hass
+        self.client = client
+        self.model_catalog = model_catalog
+        self._agent_ids = agent_ids
+        self._warm_local = warm_local
+        self._unsubscribe: CALLBACK_TYPE | None = None
+        self._last_started: float | None = None
+        self._running = False
+        self.warmups = 0
+        self.skipped = 0
+        self.last_warmup_seconds: float | None = None
+        self.last_error: str | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Listen for satellites starting a voice turn."""
+        if self._unsubscribe is None:
+            self._unsubscribe = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_satellite_listening,
+                event_filter=_is_satellite_listening,
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _uses_agent(self, satellite_entity_id: str) -> bool:
+        """Return True if the satellite's pipeline talks to this agent."""
+        registry = entity_registry.async_get(self.hass)
+        pipeline_name: str | None = None
+        if (entry := registry.async_get(satellite_entity_id)) and entry.device_id:
+            for device_entry in entity_registry.async_entries_for_device(
+                registry, entry.device_id
+            ):
+                if (
+                    device_entry.domain == "select"
+                    and device_entry.translation_key
+                    == PIPELINE_SELECT_TRANSLATION_KEY
+                ):
+                    state = self.hass.states.get(device_entry.entity_id)
+                    pipeline_name = state.state if state is not None else None
+                    break
+        if pipeline_name and pipeline_name != PIPELINE_PREFERRED:
+            pipeline = next(
+                (
+                    pipeline
+                    for pipeline in assist_pipeline.async_get_pipelines(self.hass)
+                    if pipeline.name == pipeline_name
+                ),
+                None,
+            )
+        else:
+            pipeline = assist_pipeline.async_get_pipeline(self.hass)
+        return (
+            pipeline is not None
+            and pipeline.conversation_engine in self._agent_ids()
+        )
+
+    @callback
+    def _async_satellite_listening(self, event: Event) -> None:
+        if self._uses_agent(event.data["entity_id"]):
+            self.async_prewarm()
+
+    @callback
+    def async_prewarm(self) -> None:
+        """Start a warm-up unless one ran or is running very recently."""
+        now = monotonic()
+        if self._running or (
+            self._last_started is not None
+            and now - self._last_started < PREWARM_MIN_INTERVAL_SECONDS
+        ):
+            self.skipped += 1
+            return
+        self._last_started = now
+        self._running = True
+        self.model_catalog.async_schedule_refresh()
+        index = async_get_entity_index(self.hass)
+        if index.built_at is None or not len(index):
+            index.async_rebuild()
+        self._warm_local()
+        self.hass.async_create_background_task(
+            self._async_warm_connection(now),
+            "openwebui_conversation prewarm",
+        )
+
+    async def _async_warm_connection(self, started: float) -> None:
+        try:
+            await self.client.async_get_heartbeat()
+        except ApiClientError as err:
+            self.last_error = str(err)
+            LOGGER.debug("Connection warm-up failed: %s", err)
+        else:
+            self.last_error = None
+        finally:
+            self._running = False
+            self.warmups += 1
+            self.last_warmup_seconds = monotonic() - started
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return warm-up statistics."""
+        return {
+            "warmups": self.warmups,
+            "skipped": self.skipped,
+            "last_warmup_seconds": self.last_warmup_seconds,
+            "last_error": self.last_error,
+        }
+
+
+@callback
+def _is_satellite_listening(event_data: dict[str, Any]) -> bool:
+    new_state = event_data.get("new_state")
+    return (
+        new_state is not None
+        and new_state.domain == SATELLITE_DOMAIN
+        and new_state.state == SATELLITE_LISTENING
+    )
@@ -0,0 +1,164 @@
+"""Opt-in exact-match cache of spoken replies for plain question turns."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+from time import monotonic
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .codec import json_bytes
+from .const import (
+    CONF_RESPONSE_CACHE_ENABLED,
+    CONF_RESPONSE_CACHE_SIZE,
+    CONF_RESPONSE_CACHE_TTL,
+    DEFAULT_RESPONSE_CACHE_ENABLED,
+    DEFAULT_RESPONSE_CACHE_SIZE,
+    DEFAULT_RESPONSE_CACHE_TTL,
+    DOMAIN,
+)
+from .helpers import normalize_utterance
+
+DATA_RESPONSE_CACHES = f"{DOMAIN}_response_caches"
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A reply and the stream deltas it was spoken with."""
+
+    final_text: str
+    deltas: tuple[dict[str, Any], ...]
+    stored_at: float
+    hits: int = 0
+
+
+class ResponseCache:
+    """LRU cache of replies keyed on the utterance and the request context.
+
+    The key is the normalized utterance plus a hash of the model, tool ids
+    and every message sent before it (system prompt and chat history), so a
+    reply is only reused for the same question asked in the same context.
+    Only turns that ran no tools and no web search are stored; entries
+    expire after the TTL and the least recently used entry is dropped once
+    the cache is full.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        """Initialize the cache."""
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], CachedResponse] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached replies."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(utterance: str, payload: dict[str, Any]) -> tuple[str, str]:
+        """Return the cache key for a turn's utterance and request payload."""
+        context = json_bytes(
+            [
+                payload.get("model"),
+                payload.get("tool_ids"),
+                payload.get("messages", [])[:-1],
+            ]
+        )
+        return normalize_utterance(utterance), hashlib.sha256(context).hexdigest()
+
+    def get(self, key: tuple[str, str]) -> CachedResponse | None:
+        """Return a fresh cached reply, counting the hit or miss."""
+        entry = self._entries.get(key)
+        if entry is not None and monotonic() - entry.stored_at >= self.ttl:
+            del self._entries[key]
+            self.expired += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: tuple[str, str],
+        final_text: str,
+        deltas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Store a reply, evicting the least recently used one if full."""
+        if deltas is None:
+            deltas = [{"role": "assistant", "content": final_text}]
+        self._entries[key] = CachedResponse(
+            final_text, tuple(dict(delta) for delta in deltas), monotonic()
+        )
+        self._entries.move_to_end(key)
+        self.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached reply."""
+        self._entries.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        now = monotonic()
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "stores": self.stores,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "cached": [
+                {"age": now - entry.stored_at, "hits": entry.hits}
+                for entry in self._entries.values()
+            ],
+        }
+
+
+def async_setup_response_cache(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ResponseCache | None:
+    """Create the entry's response cache if the option is enabled."""
+    caches = hass.data.setdefault(DATA_RESPONSE_CACHES, {})
+    if not entry.options.get(
+        CONF_RESPONSE_CACHE_ENABLED, DEFAULT_RESPONSE_CACHE_ENABLED
+    ):
+        caches.pop(entry.entry_id, None)
+        return None
+    cache = ResponseCache(
+        int(entry.options.get(CONF_RESPONSE_CACHE_SIZE, DEFAULT_RESPONSE_CACHE_SIZE)),
+        float(entry.options.get(CONF_RESPONSE_CACHE_TTL, DEFAULT_RESPONSE_CACHE_TTL)),
+    )
+    caches[entry.entry_id] = cache
+    return cache
+
+
+@callback
+def async_get_response_cache(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> ResponseCache | None:
+    """Return the entry's response cache, or None if caching is off."""
+    return hass.data.get(DATA_RESPONSE_CACHES, {}).get(entry.entry_id)
+
+
+@callback
+def async_release_response_cache(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the entry's response cache."""
+    hass.data.get(DATA_RESPONSE_CACHES, {}).pop(entry.entry_id, None)
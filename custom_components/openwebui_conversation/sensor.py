@@ -0,0 +1,231 @@
+"""Sensor platform for openwebui_conversation."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import OpenWebUIDataUpdateCoordinator
+from .entity import OpenWebUIEntity
+from .latency import PERCENTILES, PHASES
+from .usage import TokenUsage, UsageStats
+
+# Phases whose percentile sensors are enabled without a trip to the registry.
+DEFAULT_ENABLED_PHASES = frozenset({"first_token", "total"})
+
+LAST_WARMUP_LATENCY = SensorEntityDescription(
+    key="last_warmup_latency",
+    translation_key="last_warmup_latency",
+    name="Last warm-up latency",
+    device_class=SensorDeviceClass.DURATION,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.SECONDS,
+    suggested_display_precision=2,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class OpenWebUILatencySensorEntityDescription(SensorEntityDescription):
+    """Describes a rolling percentile of one turn phase."""
+
+    phase: str
+    label: str
+    percentile: int
+
+
+LATENCY_SENSORS = tuple(
+    OpenWebUILatencySensorEntityDescription(
+        key=f"{phase}_latency_p{percentile}",
+        translation_key="phase_latency",
+        name=f"{label} latency p{percentile}",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+        entity_registry_enabled_default=phase in DEFAULT_ENABLED_PHASES,
+        phase=phase,
+        label=label,
+        percentile=percentile,
+    )
+    for phase, label in PHASES
+    for percentile in PERCENTILES
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class OpenWebUIUsageSensorEntityDescription(SensorEntityDescription):
+    """Describes one token usage figure."""
+
+    value_fn: Callable[[UsageStats], float | int | None]
+    # The same figure per model, shown as an attribute.
+    model_value_fn: Callable[[TokenUsage], float | int | None] | None = None
+
+
+USAGE_SENSORS = (
+    OpenWebUIUsageSensorEntityDescription(
+        key="prompt_tokens",
+        translation_key="prompt_tokens",
+        name="Prompt tokens",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement="tokens",
+        value_fn=lambda usage: usage.total.prompt_tokens,
+        model_value_fn=lambda usage: usage.prompt_tokens,
+    ),
+    OpenWebUIUsageSensorEntityDescription(
+        key="completion_tokens",
+        translation_key="completion_tokens",
+        name="Completion tokens",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement="tokens",
+        value_fn=lambda usage: usage.total.completion_tokens,
+        model_value_fn=lambda usage: usage.completion_tokens,
+    ),
+    OpenWebUIUsageSensorEntityDescription(
+        key="last_prompt_tokens",
+        translation_key="last_prompt_tokens",
+        name="Last turn prompt tokens",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="tokens",
+        value_fn=lambda usage: usage.last_prompt_tokens,
+    ),
+    OpenWebUIUsageSensorEntityDescription(
+        key="generation_throughput",
+        translation_key="generation_throughput",
+        name="Generation throughput",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="tokens/s",
+        suggested_display_precision=1,
+        value_fn=lambda usage: usage.last_tokens_per_second,
+        model_value_fn=lambda usage: usage.tokens_per_second,
+    ),
+    OpenWebUIUsageSensorEntityDescription(
+        key="over_budget_turns",
+        translation_key="over_budget_turns",
+        name="Turns over prompt budget",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda usage: usage.over_budget_turns,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the sensor platform."""
+    coordinator: OpenWebUIDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        [
+            OpenWebUIWarmupLatencySensor(coordinator, entry),
+            *(
+                OpenWebUILatencySensor(coordinator, entry, description)
+                for description in LATENCY_SENSORS
+            ),
+            *(
+                OpenWebUIUsageSensor(coordinator, entry, description)
+                for description in USAGE_SENSORS
+            ),
+        ]
+    )
+
+
+class OpenWebUIWarmupLatencySensor(OpenWebUIEntity, SensorEntity):
+    """How long the last model warm-up completion took."""
+
+    def __init__(
+        self, coordinator: OpenWebUIDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, LAST_WARMUP_LATENCY)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last warm-up latency in seconds."""
+        return self.coordinator.keep_alive.last_warmup_seconds
+
+
+class OpenWebUILatencySensor(OpenWebUIEntity, SensorEntity):
+    """Rolling percentile of one phase over the entry's recent turns."""
+
+    entity_description: OpenWebUILatencySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: OpenWebUIDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: OpenWebUILatencySensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, description)
+        self._attr_translation_placeholders = {
+            "phase": description.label,
+            "percentile": f"p{description.percentile}",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Update after every recorded turn."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.latency.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True; turn timings don't depend on the health check."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the percentile in seconds, or None before the phase ran."""
+        percentiles = self.coordinator.latency.percentiles(
+            self.entity_description.phase
+        )
+        if percentiles is None:
+            return None
+        return percentiles[self.entity_description.percentile]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return how many turns the percentile is taken over."""
+        latency = self.coordinator.latency
+        return {"samples": latency.samples(self.entity_description.phase)}
+
+
+class OpenWebUIUsageSensor(OpenWebUIEntity, SensorEntity):
+    """Token usage reported by the backend for the entry's turns."""
+
+    entity_description: OpenWebUIUsageSensorEntityDescription
+
+    @property
+    def available(self) -> bool:
+        """Return True; usage totals don't depend on the health check."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the figure from the entry's usage totals."""
+        return self.entity_description.value_fn(self.coordinator.usage)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the figure for each model used, where it applies per model."""
+        if (model_value_fn := self.entity_description.model_value_fn) is None:
+            return None
+        return {
+            "models": {
+                model: model_value_fn(usage)
+                for model, usage in self.coordinator.usage.models.items()
+            }
+        }
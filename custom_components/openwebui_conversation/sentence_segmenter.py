@@ -0,0 +1,207 @@
+"""Incremental sentence segmentation for streamed model output."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from time import monotonic
+
+# Full-width terminators end a sentence without needing trailing whitespace.
+CJK_TERMINATORS = frozenset("。！？")
+TERMINATORS = frozenset(".!?")
+# Closing quotes and brackets that belong to the sentence they follow.
+CLOSERS = frozenset("\"')]}»”’」』）")
+OPENERS = "\"'([{«“‘「『（"
+ABBREVIATIONS = frozenset(
+    {
+        "approx",
+        "dept",
+        "dr",
+        "e.g",
+        "etc",
+        "i.e",
+        "jr",
+        "min",
+        "mr",
+        "mrs",
+        "ms",
+        "prof",
+        "sr",
+        "st",
+        "vs",
+    }
+)
+# Also ordinary sentence-final words ("The answer is no."), so they only
+# count as abbreviations when a number follows ("no. 5").
+NUMBER_ABBREVIATIONS = frozenset({"no"})
+_MAX_WORD_CHARS = 16
+
+
+class SentenceSegmenter:
+    """Split streamed text into sentences, scanning each character once.
+
+    Text is fed delta by delta. A cursor walks only the newly arrived
+    characters, so long unpunctuated runs cost linear time, and buffered text
+    is only joined when a sentence is actually emitted. Sentence boundaries
+    are ``.``, ``!`` and ``?`` followed by whitespace (skipping decimals,
+    common abbreviations, initials, numbered list markers and "no." before a
+    number), full-width CJK terminators, and newlines. When ``max_delay`` is
+    set and text has been waiting that long without a boundary, everything
+    up to the last word break is released so speech can start anyway: on
+    the next feed, or from flush_due when nothing more arrives in time.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_delay: float | None = None,
+        min_deadline_chars: int = 12,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initialize the segmenter."""
+        self.max_delay = max_delay
+        self.min_deadline_chars = min_deadline_chars
+        self._clock = clock
+        self._parts: list[str] = []
+        self._length = 0
+        self._pending_since: float | None = None
+        self._last_break = 0
+        self._word = ""
+        self._word_starts_line = True
+        self._terminal: str | None = None
+        self._before_number = False
+        # Boundary after "no. " held until the next word shows it is not
+        # followed by a number.
+        self._held_cut: int | None = None
+
+    @property
+    def pending(self) -> str:
+        """Return the buffered text that has not been emitted yet."""
+        return "".join(self._parts)
+
+    def feed(self, text: str) -> list[str]:
+        """Add a delta and return any sentences it completed."""
+        if not text:
+            return []
+        if self._pending_since is None:
+            self._pending_since = self._clock()
+        self._parts.append(text)
+        cuts: list[int] = []
+        for char in text:
+            position = self._length
+            self._length += 1
+            if self._held_cut is not None and not char.isspace():
+                if not char.isdigit():
+                    cuts.append(self._held_cut)
+                self._held_cut = None
+            if self._terminal is not None:
+                if char in CLOSERS or char in TERMINATORS:
+                    continue
+                if char in CJK_TERMINATORS:
+                    continue
+                if self._terminal in CJK_TERMINATORS:
+                    self._terminal = None
+                    cuts.append(position)
+                elif char.isspace():
+                    self._terminal = None
+                    if self._before_number:
+                        self._held_cut = position + 1
+                    else:
+                        cuts.append(position + 1)
+                    self._end_word(char)
+                    continue
+                else:
+                    # "3.5", "file.txt": the terminator was not a boundary.
+                    self._terminal = None
+            if char == "\n":
+                cuts.append(position + 1)
+                self._end_word(char)
+            elif char in CJK_TERMINATORS:
+                self._terminal = char
+            elif char in TERMINATORS:
+                if not (char == "." and self._is_abbreviation()):
+                    self._terminal = char
+                    self._before_number = char == "." and (
+                        self._word.lstrip(OPENERS).lower() in NUMBER_ABBREVIATIONS
+                    )
+                self._word = (self._word + char)[-_MAX_WORD_CHARS:]
+            elif char.isspace():
+                self._end_word(char)
+                self._last_break = position + 1
+            else:
+                self._word = (self._word + char)[-_MAX_WORD_CHARS:]
+        if cuts:
+            return self._emit(cuts)
+        return self.flush_due()
+
+    def time_to_deadline(self) -> float | None:
+        """Return seconds until buffered text is due, or None if none can be.
+
+        Text falls due once ``max_delay`` has passed and at least
+        ``min_deadline_chars`` of it end in a word break. Callers waiting on
+        a stalled stream sleep this long and then call flush_due.
+        """
+        if (
+            self.max_delay is None
+            or self._pending_since is None
+            or self._last_break < self.min_deadline_chars
+        ):
+            return None
+        return max(0.0, self._pending_since + self.max_delay - self._clock())
+
+    def flush_due(self) -> list[str]:
+        """Release text up to the last word break if its deadline has passed."""
+        if self.time_to_deadline() == 0.0:
+            return self._emit([self._last_break])
+        return []
+
+    def flush(self) -> str:
+        """Return and clear everything still buffered."""
+        text = "".join(self._parts)
+        self._reset(keep="")
+        return text
+
+    def _is_abbreviation(self) -> bool:
+        word = self._word.lstrip(OPENERS)
+        if not word:
+            return False
+        lowered = word.lower()
+        if lowered in ABBREVIATIONS:
+            return True
+        if len(word) == 1 and word.isalpha() and word.isupper():
+            return True
+        return self._word_starts_line and word.isdigit() and len(word) <= 2
+
+    def _end_word(self, char: str) -> None:
+        self._word = ""
+        self._word_starts_line = char == "\n"
+        if char == "\n":
+            self._last_break = self._length
+
+    def _emit(self, cuts: list[int]) -> list[str]:
+        text = "".join(self._parts)
+        sentences: list[str] = []
+        start = 0
+        for cut in cuts:
+            if cut > start:
+                sentences.append(text[start:cut])
+                start = cut
+        self._reset(keep=text[start:], consumed=start)
+        return [sentence for sentence in sentences if sentence.strip()]
+
+    def _reset(self, keep: str, consumed: int | None = None) -> None:
+        self._parts = [keep] if keep else []
+        if consumed is None:
+            self._length = 0
+            self._last_break = 0
+            self._word = ""
+            self._word_starts_line = True
+            self._terminal = None
+            self._held_cut = None
+        else:
+            self._length -= consumed
+            self._last_break = max(0, self._last_break - consumed)
+            if self._held_cut is not None:
+                self._held_cut -= consumed
+                if self._held_cut <= 0:
+                    self._held_cut = None
+        self._pending_since = self._clock() if keep else None
@@ -0,0 +1,114 @@
+"""Incremental server-sent events framing over raw response bytes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+DEFAULT_EVENT = "message"
+# Byte values: ``0x0D in data`` is a memchr, ``b"\r" in data`` a substring
+# search with far more per-call overhead on short reads.
+_CR = 0x0D
+_LF = 0x0A
+
+
+@dataclass(slots=True)
+class SSEFrame:
+    """One dispatched server-sent event."""
+
+    data: bytes | bytearray
+    event: str = DEFAULT_EVENT
+    id: str | None = None
+
+
+class SSEFramer:
+    """Split a byte stream into server-sent events without decoding lines.
+
+    Reads that end mid-event are kept as a list of parts, not copied into a
+    growing buffer. Each read is searched once for the blank line ending an
+    event, plus the one-byte seam with the previous read, and the parts are
+    joined only when their event completes. Completed frames are cut out
+    with a single C-level split. The common single-line ``data:`` frame is
+    taken as-is; other frames are parsed per field (``data``, ``event``,
+    ``id``, ``retry``; comments are skipped). ``\\r\\n`` and lone ``\\r``
+    line endings are normalized as they arrive. Nothing is decoded to text:
+    payloads are handed over as bytes for the JSON decoder.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the framer."""
+        self._parts: list[bytes] = []
+        self._trailing_cr = False
+        self.last_event_id: str | None = None
+        self.retry: int | None = None
+
+    def feed(self, chunk: bytes) -> list[SSEFrame]:
+        """Add received bytes and return every event they completed."""
+        if self._trailing_cr or _CR in chunk:
+            chunk = self._normalize_line_endings(chunk)
+            if not chunk:
+                return []
+        parts = self._parts
+        if parts and chunk[:1] == b"\n" and parts[-1][-1:] == b"\n":
+            # The separator straddles the two reads.
+            raw_frames = chunk[1:].split(b"\n\n")
+            raw_frames.insert(0, b"".join(parts)[:-1])
+        elif chunk.find(b"\n\n") == -1:
+            parts.append(chunk)
+            return []
+        else:
+            raw_frames = chunk.split(b"\n\n")
+            if parts:
+                parts.append(raw_frames[0])
+                raw_frames[0] = b"".join(parts)
+        tail = raw_frames.pop()
+        self._parts = [tail] if tail else []
+        frames: list[SSEFrame] = []
+        for raw in raw_frames:
+            if raw.startswith(b"data:") and _LF not in raw:
+                data = raw[6:] if raw[5:6] == b" " else raw[5:]
+                if data:
+                    frames.append(SSEFrame(data, DEFAULT_EVENT, self.last_event_id))
+            elif raw and (frame := self._parse(raw)) is not None:
+                frames.append(frame)
+        return frames
+
+    def flush(self) -> SSEFrame | None:
+        """Return an event left unterminated when the stream closed."""
+        raw = b"".join(self._parts).rstrip(b"\n")
+        self._parts = []
+        self._trailing_cr = False
+        return self._parse(raw) if raw else None
+
+    def _normalize_line_endings(self, chunk: bytes) -> bytes:
+        if self._trailing_cr:
+            chunk = b"\r" + chunk
+            self._trailing_cr = False
+        if chunk.endswith(b"\r"):
+            # The matching "\n" may arrive with the next read.
+            chunk = chunk[:-1]
+            self._trailing_cr = True
+        return chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    def _parse(self, raw: bytes | bytearray) -> SSEFrame | None:
+        lines: list[bytes] = []
+        event = DEFAULT_EVENT
+        for line in raw.split(b"\n"):
+            if not line or line[0] == 0x3A:
+                continue
+            name, _, value = line.partition(b":")
+            if value[:1] == b" ":
+                value = value[1:]
+            if name == b"data":
+                lines.append(value)
+            elif name == b"event":
+                event = value.decode("utf-8", errors="replace")
+            elif name == b"id":
+                if b"\0" not in value:
+                    self.last_event_id = value.decode("utf-8", errors="replace")
+            elif name == b"retry":
+                if value.isdigit():
+                    self.retry = int(value)
+        payload = b"\n".join(lines)
+        if not payload:
+            return None
+        return SSEFrame(payload, event=event, id=self.last_event_id)
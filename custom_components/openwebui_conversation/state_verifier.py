@@ -0,0 +1,182 @@
+"""Event-driven verification that service calls reached their target state."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from time import monotonic
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+StatePredicate = Callable[[State], bool]
+# Thermostats that do not declare a target_temp_step usually round to whole
+# degrees.
+DEFAULT_TARGET_TEMP_STEP = 1.0
+
+
+@dataclass
+class VerificationResult:
+    """Outcome of waiting for a set of entities to reach their expected state."""
+
+    actual_states: dict[str, str]
+    confirmed: set[str] = field(default_factory=set)
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+
+def expect_state(expected_state: str) -> StatePredicate:
+    """Return a predicate matching a plain on/off style state value."""
+
+    def _predicate(state: State) -> bool:
+        return state.state == expected_state
+
+    return _predicate
+
+
+def _number(value: object) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def expect_climate(temperature: float, hvac_mode: str | None = None) -> StatePredicate:
+    """Return a predicate matching a climate target temperature and mode.
+
+    The requested temperature is clamped to the entity's min/max and matches
+    within half its ``target_temp_step``, since thermostats round to their
+    step. Entities holding a low/high range instead (``heat_cool``) match
+    when the temperature lies inside it.
+    """
+
+    def _predicate(state: State) -> bool:
+        if hvac_mode and state.state != hvac_mode:
+            return False
+        attributes = state.attributes
+        step = _number(attributes.get("target_temp_step")) or DEFAULT_TARGET_TEMP_STEP
+        tolerance = step / 2 + 0.01
+        requested = temperature
+        if (min_temp := _number(attributes.get("min_temp"))) is not None:
+            requested = max(requested, min_temp)
+        if (max_temp := _number(attributes.get("max_temp"))) is not None:
+            requested = min(requested, max_temp)
+        if (target := _number(attributes.get("temperature"))) is not None:
+            return abs(target - requested) <= tolerance
+        low = _number(attributes.get("target_temp_low"))
+        high = _number(attributes.get("target_temp_high"))
+        if low is None or high is None:
+            return False
+        return low - tolerance <= requested <= high + tolerance
+
+    return _predicate
+
+
+def _group_members(state: State | None) -> list[str]:
+    if state is None:
+        return []
+    members = state.attributes.get(ATTR_ENTITY_ID)
+    if isinstance(members, (list, tuple)):
+        return [str(member) for member in members if isinstance(member, str)]
+    return []
+
+
+class StateVerifier:
+    """Wait for target entities to reach an expected state via state events.
+
+    Subscribe before the service call so fast devices that report back while
+    the call is still in flight are not missed, then resolve as soon as every
+    target matches or the deadline passes. Group entities (anything with an
+    ``entity_id`` member list) count as confirmed once either the group itself
+    or all of its members match.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_ids: list[str],
+        predicate: StatePredicate,
+    ) -> None:
+        """Initialize the verifier."""
+        self.hass = hass
+        self.entity_ids = list(entity_ids)
+        self.predicate = predicate
+        self._members: dict[str, list[str]] = {}
+        self._confirmed: set[str] = set()
+        self._done = asyncio.Event()
+        self._unsubscribe: CALLBACK_TYPE | None = None
+        self._started = 0.0
+
+    async def __aenter__(self) -> StateVerifier:
+        """Start listening for state changes."""
+        self._started = monotonic()
+        tracked: set[str] = set(self.entity_ids)
+        for entity_id in self.entity_ids:
+            members = _group_members(self.hass.states.get(entity_id))
+            if members:
+                self._members[entity_id] = members
+                tracked.update(members)
+        self._unsubscribe = async_track_state_change_event(
+            self.hass, list(tracked), self._async_state_changed
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop listening for state changes."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _matches(self, entity_id: str) -> bool:
+        state = self.hass.states.get(entity_id)
+        if state is not None and self.predicate(state):
+            return True
+        members = self._members.get(entity_id)
+        if not members:
+            return False
+        for member in members:
+            member_state = self.hass.states.get(member)
+            if member_state is None or not self.predicate(member_state):
+                return False
+        return True
+
+    @callback
+    def _async_check(self) -> None:
+        for entity_id in self.entity_ids:
+            if entity_id not in self._confirmed and self._matches(entity_id):
+                self._confirmed.add(entity_id)
+        if len(self._confirmed) == len(self.entity_ids):
+            self._done.set()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        self._async_check()
+
+    async def async_wait(self, timeout: float) -> VerificationResult:
+        """Wait until every target matches or the timeout expires."""
+        self._async_check()
+        timed_out = False
+        if not self._done.is_set() and timeout > 0:
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._done.wait()
+            except TimeoutError:
+                timed_out = True
+        elif not self._done.is_set():
+            timed_out = True
+        # Re-read once more so a target that flipped back (for example a bulb
+        # that reports on and then off again) is not reported as confirmed.
+        self._confirmed = {
+            entity_id for entity_id in self.entity_ids if self._matches(entity_id)
+        }
+        actual_states: dict[str, str] = {}
+        for entity_id in self.entity_ids:
+            state = self.hass.states.get(entity_id)
+            actual_states[entity_id] = state.state if state is not None else "missing"
+        return VerificationResult(
+            actual_states=actual_states,
+            confirmed=set(self._confirmed),
+            elapsed=monotonic() - self._started,
+            timed_out=timed_out,
+        )
@@ -0,0 +1,147 @@
+"""Token usage and generation throughput reported with completions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import callback
+
+from .const import LOGGER
+
+# Ollama reports durations in nanoseconds.
+NANOSECONDS = 1_000_000_000
+
+
+@dataclass(slots=True)
+class TokenUsage:
+    """Tokens used by one or more completions and how long generation took."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    generation_seconds: float = 0.0
+    requests: int = 0
+    # Largest single prompt, which is what a context budget is about.
+    largest_prompt_tokens: int = 0
+
+    def add(self, other: TokenUsage) -> None:
+        """Add another completion's usage."""
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.generation_seconds += other.generation_seconds
+        self.requests += other.requests
+        self.largest_prompt_tokens = max(
+            self.largest_prompt_tokens, other.largest_prompt_tokens
+        )
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Return the completion throughput, or None without timing."""
+        if not self.completion_tokens or self.generation_seconds <= 0:
+            return None
+        return self.completion_tokens / self.generation_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts and throughput."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "generation_seconds": self.generation_seconds,
+            "tokens_per_second": self.tokens_per_second,
+            "requests": self.requests,
+            "largest_prompt_tokens": self.largest_prompt_tokens,
+        }
+
+
+def _count(value: Any) -> int | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return int(value)
+
+
+def parse_usage(usage: Any, measured_seconds: float | None = None) -> TokenUsage | None:
+    """Return the usage block of a completion or its final stream chunk.
+
+    Reads the OpenAI fields and, for Ollama behind OpenWebUI, the native
+    eval counts, durations and ``response_token/s``. Generation time comes
+    from the backend when it reports one and otherwise from
+    ``measured_seconds``, the time the caller saw the tokens arrive over.
+    """
+    if not isinstance(usage, dict):
+        return None
+    prompt_tokens = _count(usage.get("prompt_tokens", usage.get("prompt_eval_count")))
+    completion_tokens = _count(
+        usage.get("completion_tokens", usage.get("eval_count"))
+    )
+    if prompt_tokens is None and completion_tokens is None:
+        return None
+    completion_tokens = completion_tokens or 0
+    rate = usage.get("response_token/s")
+    if (eval_duration := _count(usage.get("eval_duration"))) and eval_duration > 0:
+        seconds = eval_duration / NANOSECONDS
+    elif _count(rate) is not None and rate > 0 and completion_tokens:
+        seconds = completion_tokens / rate
+    else:
+        seconds = measured_seconds or 0.0
+    prompt_tokens = prompt_tokens or 0
+    return TokenUsage(prompt_tokens, completion_tokens, seconds, 1, prompt_tokens)
+
+
+class UsageStats:
+    """Token totals and throughput for one entry, overall and per model.
+
+    Totals only grow until the entry reloads, which suits total_increasing
+    sensors. A turn with a request whose prompt exceeds the configured
+    token budget is logged and counted; a budget of zero turns the check
+    off.
+    """
+
+    def __init__(self, prompt_token_budget: int, on_update: Callable[[], None]) -> None:
+        """Initialize empty totals."""
+        self.prompt_token_budget = max(0, prompt_token_budget)
+        self._on_update = on_update
+        self.total = TokenUsage()
+        self.models: dict[str, TokenUsage] = {}
+        self.turns = 0
+        self.over_budget_turns = 0
+        self.last_prompt_tokens: int | None = None
+        self.last_completion_tokens: int | None = None
+        self.last_tokens_per_second: float | None = None
+
+    @callback
+    def async_record(self, model: str, usage: TokenUsage) -> bool:
+        """Add a turn's usage; return True if a prompt went over the budget."""
+        if not usage.requests:
+            return False
+        self.total.add(usage)
+        self.models.setdefault(model, TokenUsage()).add(usage)
+        self.turns += 1
+        self.last_prompt_tokens = usage.prompt_tokens
+        self.last_completion_tokens = usage.completion_tokens
+        if (tokens_per_second := usage.tokens_per_second) is not None:
+            self.last_tokens_per_second = tokens_per_second
+        over_budget = 0 < self.prompt_token_budget < usage.largest_prompt_tokens
+        if over_budget:
+            self.over_budget_turns += 1
+            LOGGER.warning(
+                "Model %s was sent a %s token prompt, above the budget of %s",
+                model,
+                usage.largest_prompt_tokens,
+                self.prompt_token_budget,
+            )
+        self._on_update()
+        return over_budget
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return totals, the last turn and per-model usage."""
+        return {
+            "prompt_token_budget": self.prompt_token_budget,
+            "turns": self.turns,
+            "over_budget_turns": self.over_budget_turns,
+            "total": self.total.as_dict(),
+            "last_prompt_tokens": self.last_prompt_tokens,
+            "last_completion_tokens": self.last_completion_tokens,
+            "last_tokens_per_second": self.last_tokens_per_second,
+            "models": {model: usage.as_dict() for model, usage in self.models.items()},
+        }
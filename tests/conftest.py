@@ -0,0 +1,34 @@
+"""Shared fixtures for the unit tests.
+
+The integration's package imports Home Assistant. Self-contained modules are
+loaded straight from their files so their tests also run without it; the
+rest import the package and use the ``hass`` fixture from
+pytest-homeassistant-custom-component.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = ROOT / "custom_components" / "openwebui_conversation"
+
+
+@pytest.fixture
+def load_module(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], ModuleType]:
+    """Return a loader for one of the integration's standalone modules."""
+
+    def _load(name: str) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(name, PACKAGE_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    return _load
@@ -0,0 +1,101 @@
+"""Tests for the compiled local alias overrides."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openwebui_conversation.alias_overrides import (
+    AliasOverrides,
+    async_get_alias_overrides,
+    async_release_alias_overrides,
+    async_setup_alias_overrides,
+)
+from custom_components.openwebui_conversation.const import (
+    CONF_LOCAL_ALIAS_OVERRIDES,
+    DOMAIN,
+)
+
+LAYOUT = """\
+# Living room
+- **Reading Lamp** -> light.reading_lamp
+* `The_Big-Fan`: → switch.big_fan
+
+not a mapping line
+- -> light.nameless
+Porch -> LIGHT.Porch
+"""
+
+
+def test_parse_statistics() -> None:
+    """Mapping lines are parsed; anything else is counted as ignored."""
+    overrides = AliasOverrides(LAYOUT)
+    stats = overrides.as_dict()
+
+    assert (stats["lines"], stats["parsed_lines"], stats["ignored_lines"]) == (6, 3, 3)
+    assert overrides.entity_ids == {
+        "light.reading_lamp",
+        "switch.big_fan",
+        "light.porch",
+    }
+    assert stats["entity_ids"] == 3
+    assert stats["keys"] == len(overrides)
+
+
+@pytest.mark.parametrize(
+    ("spoken", "entity_id"),
+    [
+        ("Reading Lamp", "light.reading_lamp"),
+        ("reading lamp", "light.reading_lamp"),
+        ("the reading lamp", "light.reading_lamp"),
+        ("  Reading   lamp ", "light.reading_lamp"),
+        ("big fan", "switch.big_fan"),
+        ("The Big-Fan", "switch.big_fan"),
+        ("porch", "light.porch"),
+        ("kitchen", None),
+    ],
+)
+def test_lookup(spoken: str, entity_id: str | None) -> None:
+    """Spoken names resolve through their case and spacing variants."""
+    assert AliasOverrides(LAYOUT).lookup(spoken) == entity_id
+
+
+def test_later_line_wins() -> None:
+    """A repeated name maps to the entity from its last line."""
+    overrides = AliasOverrides("lamp -> light.old\nlamp -> light.new")
+
+    assert overrides.lookup("lamp") == "light.new"
+
+
+async def test_resolve_checks_the_state_machine(hass: HomeAssistant) -> None:
+    """Only existing entities resolve; missing ones are kept for diagnostics."""
+    overrides = AliasOverrides(LAYOUT)
+    hass.states.async_set("light.reading_lamp", "off")
+
+    assert overrides.async_resolve(hass, "reading lamp") == "light.reading_lamp"
+    assert overrides.async_resolve(hass, "porch") is None
+    assert overrides.async_resolve(hass, "kitchen") is None
+    stats = overrides.as_dict()
+    assert stats["resolutions"] == 2
+    assert stats["validated_entity_ids"] == 2
+    assert stats["missing_entity_ids"] == ["light.porch"]
+
+    hass.states.async_set("light.porch", "on")
+    assert overrides.async_resolve(hass, "porch") == "light.porch"
+    assert overrides.as_dict()["missing_entity_ids"] == []
+
+
+async def test_compiled_once_per_entry(hass: HomeAssistant) -> None:
+    """The entry's overrides are compiled once and dropped on release."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_LOCAL_ALIAS_OVERRIDES: "lamp -> light.lamp"}
+    )
+
+    overrides = async_setup_alias_overrides(hass, entry)
+    assert async_get_alias_overrides(hass, entry) is overrides
+    assert overrides.lookup("lamp") == "light.lamp"
+
+    async_release_alias_overrides(hass, entry)
+    assert async_get_alias_overrides(hass, entry) is not overrides
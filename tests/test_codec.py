@@ -0,0 +1,66 @@
+"""Tests for the shared JSON codec, with and without orjson."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+PAYLOAD = {
+    "model": "llama3",
+    "stream": True,
+    "temperature": 0.7,
+    "messages": [
+        {"role": "system", "content": "Du bist ein Assistent. Ünïcödé ✓ 灯"},
+        {"role": "user", "content": 'Turn "on" the\nlights'},
+    ],
+    "tools": None,
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, load_module, monkeypatch):
+    """Return the codec module on each JSON backend."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        # A None entry makes "import orjson" raise ImportError.
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    module = load_module("codec")
+    assert module.JSON_BACKEND == request.param
+    return module
+
+
+def test_round_trip(codec) -> None:
+    """Values survive encoding to bytes or text and decoding again."""
+    assert codec.json_loads(codec.json_bytes(PAYLOAD)) == PAYLOAD
+    assert codec.json_loads(codec.json_dumps(PAYLOAD)) == PAYLOAD
+    assert codec.json_loads(bytearray(codec.json_bytes(PAYLOAD))) == PAYLOAD
+
+
+def test_compact_utf8_output(codec) -> None:
+    """Both backends write compact JSON with non-ASCII text left as is."""
+    encoded = codec.json_bytes({"a": [1, 2], "b": "灯"})
+
+    assert encoded == '{"a":[1,2],"b":"灯"}'.encode()
+    assert codec.json_dumps({"a": [1, 2], "b": "灯"}) == encoded.decode()
+
+
+def test_decode_error_is_value_error(codec) -> None:
+    """Malformed input raises the shared JSONDecodeError alias."""
+    with pytest.raises(codec.JSONDecodeError):
+        codec.json_loads(b'{"choices": [')
+
+
+def test_request_encoder_matches_plain_encoding(codec) -> None:
+    """Reused message bytes give the same body as encoding from scratch."""
+    encoder = codec.RequestEncoder()
+    messages = list(PAYLOAD["messages"])
+
+    first = encoder.encode({**PAYLOAD, "messages": messages})
+    messages.append({"role": "assistant", "content": "Done."})
+    second = encoder.encode({**PAYLOAD, "messages": messages})
+
+    assert codec.json_loads(first) == PAYLOAD
+    assert codec.json_loads(second) == {**PAYLOAD, "messages": messages}
+    assert encoder.reused_messages == 2
@@ -0,0 +1,256 @@
+"""Tests for classifying and streaming model replies."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from types import MethodType, SimpleNamespace
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openwebui_conversation import conversation
+from custom_components.openwebui_conversation.conversation import (
+    OpenWebUIAgent,
+    _StreamReplyClassifier,
+)
+from custom_components.openwebui_conversation.local_executor import (
+    ToolExecutionResult,
+)
+
+
+@pytest.mark.parametrize(
+    ("deltas", "verdict"),
+    [
+        (["Sure, turning it on."], "prose"),
+        (["  ", "\n", "Okay"], "prose"),
+        (['{"tool_calls": []}'], "plan"),
+        (["[", "{"], "plan"),
+        (["```json\n", '{"tool_calls"'], "plan"),
+        (["``", "`\n{"], "plan"),
+        (["```python\nprint()"], "prose"),
+        (["```\nHello"], "prose"),
+        (["`code` is prose"], "prose"),
+    ],
+)
+def test_classifier_verdict(deltas: list[str], verdict: str) -> None:
+    """The opening characters decide between prose and a JSON plan."""
+    classifier = _StreamReplyClassifier()
+
+    for delta in deltas:
+        result = classifier.feed(delta)
+
+    assert result == verdict
+    assert classifier.is_prose is (verdict == "prose")
+
+
+def test_classifier_waits_for_a_decisive_opening() -> None:
+    """An unfinished code fence stays undecided until its body starts."""
+    classifier = _StreamReplyClassifier()
+
+    assert classifier.feed("  ") is None
+    assert classifier.feed("``") is None
+    assert classifier.feed("`json") is None
+    assert classifier.feed("\n  ") is None
+    assert classifier.feed("{") == classifier.PLAN
+
+
+def test_classifier_gives_up_on_long_undecided_openings() -> None:
+    """A fence whose info line never ends is treated as prose."""
+    classifier = _StreamReplyClassifier()
+
+    assert classifier.feed("```" + "x" * 100) == classifier.PROSE
+
+
+def test_classifier_native_tool_calls() -> None:
+    """Native tool calls before any content mark a plan, not after prose."""
+    plan = _StreamReplyClassifier()
+    plan.mark_tool_calls()
+    assert plan.feed("Doing that.") == plan.PLAN
+
+    prose = _StreamReplyClassifier()
+    prose.feed("Sure.")
+    prose.mark_tool_calls()
+    assert prose.is_prose
+
+
+class _FakeClient:
+    """Stream canned content deltas as completion chunks.
+
+    A None delta stalls the stream until ``resume`` is set.
+    """
+
+    def __init__(self, *rounds: list[str | None]) -> None:
+        self.rounds = list(rounds)
+        self.requests = 0
+        self.resume = asyncio.Event()
+
+    async def async_generate_stream(
+        self, data: bytes
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        self.requests += 1
+        for content in self.rounds.pop(0):
+            if content is None:
+                await self.resume.wait()
+                continue
+            yield {"choices": [{"delta": {"content": content}}]}
+
+
+def _agent(hass: HomeAssistant, client: _FakeClient) -> SimpleNamespace:
+    """Return just the agent state the streaming methods read."""
+    agent = SimpleNamespace(
+        hass=hass,
+        client=client,
+        narrate_streaming_progress=False,
+        search_result_prefix="",
+        state_verify_timeout=0,
+        strip_markdown=False,
+        markdown_parser=None,
+    )
+    agent._async_stream_followup_round = MethodType(
+        OpenWebUIAgent._async_stream_followup_round, agent
+    )
+    return agent
+
+
+async def _stream(
+    agent: SimpleNamespace, payload: dict[str, Any]
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    stream_state: dict[str, Any] = {}
+    deltas = [
+        delta
+        async for delta in OpenWebUIAgent._async_stream_chat(
+            agent, payload, should_search=False, stream_state=stream_state
+        )
+    ]
+    return deltas, stream_state
+
+
+@pytest.mark.parametrize("tool_ids", [[], ["home_assistant"]])
+async def test_prose_reaches_the_chat_log_once(
+    hass: HomeAssistant, tool_ids: list[str]
+) -> None:
+    """A streamed answer is one message: a role, then content-only deltas."""
+    answer = "Hello there. How are you today? I am fine"
+    client = _FakeClient(["Hello", " there. How are", " you today? I am fine"])
+
+    deltas, stream_state = await _stream(
+        _agent(hass, client), {"messages": [], "tool_ids": tool_ids}
+    )
+
+    assert [delta.get("role") for delta in deltas] == ["assistant"] + [None] * (
+        len(deltas) - 1
+    )
+    assert "".join(delta["content"] for delta in deltas) == answer
+    assert stream_state["final_text"] == answer
+    assert not stream_state["tool_flow"]
+
+
+async def test_short_answer_is_sent_whole(hass: HomeAssistant) -> None:
+    """An answer the segmenter never cut is sent as one message at the end."""
+    client = _FakeClient(["Done"])
+
+    deltas, _ = await _stream(_agent(hass, client), {"messages": [], "tool_ids": []})
+
+    assert deltas == [{"role": "assistant", "content": "Done"}]
+
+
+async def test_plan_after_spoken_prose_is_not_run(hass: HomeAssistant) -> None:
+    """JSON later in an answer already spoken as prose is not executed."""
+    hass.states.async_set("light.desk", "off")
+    plan = (
+        '{"tool_calls": [{"name": "control_lights", '
+        '"parameters": {"entity_id": ["light.desk"], "state": "on"}}]}'
+    )
+    client = _FakeClient(["Here is what I would send. ", plan])
+
+    deltas, stream_state = await _stream(
+        _agent(hass, client), {"messages": [], "tool_ids": ["home_assistant"]}
+    )
+
+    assert not stream_state["tool_flow"]
+    assert not any("tool_calls" in delta for delta in deltas)
+    assert "".join(delta["content"] for delta in deltas).endswith(plan)
+    assert client.requests == 1
+
+
+async def test_stalled_stream_releases_text_at_the_deadline(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Buffered prose is spoken when its deadline passes, not at the next chunk."""
+    monkeypatch.setattr(conversation, "STREAM_FLUSH_DEADLINE_SECONDS", 0.01)
+    client = _FakeClient(["Turning on all of the kitchen lig", None, "hts now."])
+    stream = OpenWebUIAgent._async_stream_chat(
+        _agent(hass, client), {"messages": [], "tool_ids": []}, should_search=False
+    )
+
+    async with asyncio.timeout(1):
+        first = await stream.__anext__()
+    assert first == {"role": "assistant", "content": "Turning on all of the kitchen "}
+
+    client.resume.set()
+    rest = [delta async for delta in stream]
+    assert rest == [{"content": "lights now."}]
+
+
+def _result(
+    tool_name: str = "control_lights", success: bool = True
+) -> ToolExecutionResult:
+    return ToolExecutionResult(
+        tool_call_id="tool_call_1",
+        tool_name=tool_name,
+        parameters={},
+        step=None,
+        tool_result={"success": success},
+    )
+
+
+def _turn(text: Any) -> dict[str, Any]:
+    return {
+        "messages": [
+            {"role": "system", "content": "You are a voice assistant."},
+            {"role": "user", "content": text},
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    ("utterance", "results", "expected"),
+    [
+        ("Turn on the desk lamp", [_result()], True),
+        ("dim the lights and wait", [_result(), _result("wait")], True),
+        (
+            [{"type": "text", "text": "Turn on the fan"}],
+            [_result("control_switches")],
+            True,
+        ),
+        ("Turn on the desk lamp?", [_result()], False),
+        ("What is the desk lamp set to", [_result()], False),
+        ("can you turn on the lamp", [_result()], False),
+        ("Turn on the desk lamp", [], False),
+        ("Turn on the desk lamp", [_result(success=False)], False),
+        ("Turn on the desk lamp", [_result(), _result("get_entity_state")], False),
+    ],
+)
+def test_summary_answers_turn(
+    utterance: Any, results: list[ToolExecutionResult], expected: bool
+) -> None:
+    """Only successful actions for a command skip the follow-up round."""
+    agent = SimpleNamespace(skip_tool_follow_up=True)
+
+    assert (
+        OpenWebUIAgent._summary_answers_turn(agent, _turn(utterance), results)
+        is expected
+    )
+
+
+def test_summary_never_answers_when_the_option_is_off() -> None:
+    """With the option off the model always gets the follow-up round."""
+    agent = SimpleNamespace(skip_tool_follow_up=False)
+
+    assert not OpenWebUIAgent._summary_answers_turn(
+        agent, _turn("Turn on the desk lamp"), [_result()]
+    )
+
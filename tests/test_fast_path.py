@@ -0,0 +1,166 @@
+"""Tests for the local grammar for simple commands."""
+
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.openwebui_conversation.alias_overrides import AliasOverrides
+from custom_components.openwebui_conversation.fast_path import FastPath
+
+ENTITIES = {
+    "light.desk_lamp": "Desk lamp",
+    "light.kitchen_ceiling": "Kitchen ceiling",
+    "light.kitchen_counter": "Kitchen counter",
+    "switch.coffee_maker": "Coffee maker",
+    "climate.hallway": "Hallway",
+    "media_player.living_room_tv": "Living room TV",
+}
+
+
+@pytest.fixture
+async def entities(hass: HomeAssistant) -> None:
+    """Register and expose a few devices."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    registry = er.async_get(hass)
+    for entity_id, name in ENTITIES.items():
+        domain, object_id = entity_id.split(".")
+        registry.async_get_or_create(
+            domain, "test", object_id, suggested_object_id=object_id
+        )
+        hass.states.async_set(entity_id, "off", {"friendly_name": name})
+    # Two lights answer to "kitchen".
+    for entity_id in ("light.kitchen_ceiling", "light.kitchen_counter"):
+        registry.async_update_entity(entity_id, aliases={"Kitchen"})
+
+
+@pytest.mark.usefixtures("entities")
+@pytest.mark.parametrize(
+    ("utterance", "template", "tool_call"),
+    [
+        (
+            "Turn on the desk lamp.",
+            "on_off",
+            ("control_lights", "light.desk_lamp", {"state": "on"}),
+        ),
+        (
+            "please switch the coffee maker off",
+            "on_off",
+            ("control_switches", "switch.coffee_maker", {"state": "off"}),
+        ),
+        (
+            "Dim the desk lamp to 30%",
+            "brightness",
+            (
+                "control_lights",
+                "light.desk_lamp",
+                {"state": "on", "brightness_pct": 30},
+            ),
+        ),
+        (
+            "set hallway temperature to 21.5 degrees",
+            "temperature",
+            ("climate_set_temperature", "climate.hallway", {"temperature_c": 21.5}),
+        ),
+        (
+            "Resume the living room TV please",
+            "media",
+            ("media_player_command", "media_player.living_room_tv", {"action": "play"}),
+        ),
+    ],
+)
+async def test_simple_commands_match(
+    hass: HomeAssistant,
+    utterance: str,
+    template: str,
+    tool_call: tuple[str, str, dict],
+) -> None:
+    """Simple commands on one known entity become a local tool call."""
+    name, entity_id, parameters = tool_call
+
+    match = FastPath().async_match(hass, utterance)
+
+    assert match is not None
+    assert match.template == template
+    assert match.entity_id == entity_id
+    assert match.tool_call == {
+        "id": "fast_path_1",
+        "name": name,
+        "parameters": {"entity_ids": [entity_id], **parameters},
+    }
+
+
+@pytest.mark.usefixtures("entities")
+@pytest.mark.parametrize(
+    "utterance",
+    [
+        pytest.param("turn on the garage door", id="unknown_name"),
+        pytest.param("turn on the living room tv", id="wrong_domain"),
+        pytest.param("dim the desk lamp to 0%", id="brightness_out_of_range"),
+        pytest.param("turn on the desk lamp and the coffee maker", id="two_targets"),
+        pytest.param("what is the weather like", id="not_a_command"),
+    ],
+)
+async def test_other_utterances_fall_through(
+    hass: HomeAssistant, utterance: str
+) -> None:
+    """Anything not clearly one simple command is left to the model."""
+    fast_path = FastPath()
+
+    assert fast_path.async_match(hass, utterance) is None
+    assert fast_path.attempts == 1
+    assert fast_path.hits == 0
+
+
+@pytest.mark.usefixtures("entities")
+async def test_ambiguous_name_falls_through(hass: HomeAssistant) -> None:
+    """A name shared by several entities is counted and left to the model."""
+    fast_path = FastPath()
+
+    assert fast_path.async_match(hass, "turn off kitchen") is None
+    assert fast_path.ambiguous == 1
+
+
+@pytest.mark.usefixtures("entities")
+async def test_alias_overrides_win(hass: HomeAssistant) -> None:
+    """An alias override resolves a name the entity index does not know."""
+    aliases = AliasOverrides("Big light -> light.kitchen_ceiling")
+
+    match = FastPath().async_match(hass, "turn the big light on", aliases)
+
+    assert match is not None
+    assert match.entity_id == "light.kitchen_ceiling"
+
+
+@pytest.mark.parametrize(
+    ("language", "expected"),
+    [
+        ("en", True),
+        ("en-GB", True),
+        ("EN_us", True),
+        ("de", False),
+        ("de-DE", False),
+        ("eng", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_handles_language(language: str | None, expected: bool) -> None:
+    """Only English turns use the English grammar."""
+    assert FastPath.handles_language(language) is expected
+
+
+def test_statistics() -> None:
+    """Time saved is measured against the model's tool turns."""
+    fast_path = FastPath()
+    fast_path.record_hit(0.2)
+    fast_path.record_model_turn(2.0)
+    fast_path.record_hit(0.2)
+
+    stats = fast_path.as_dict()
+    assert stats["hits"] == 2
+    assert stats["average_model_tool_turn_seconds"] == 2.0
+    assert stats["estimated_seconds_saved"] == pytest.approx(1.8)
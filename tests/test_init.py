@@ -0,0 +1,61 @@
+"""Tests for setting up a config entry."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.openwebui_conversation import async_setup_entry
+from custom_components.openwebui_conversation.api import OpenWebUIApiClient
+from custom_components.openwebui_conversation.const import (
+    CONF_API_KEY,
+    CONF_BASE_URL,
+    DOMAIN,
+)
+from custom_components.openwebui_conversation.exceptions import ApiClientError
+
+
+@pytest.mark.parametrize(
+    "heartbeat",
+    [
+        pytest.param([ApiClientError("connection refused")], id="first_refresh"),
+        pytest.param([{"status": True}, ApiClientError("reset")], id="heartbeat"),
+        pytest.param([{"status": True}, None], id="invalid_server"),
+    ],
+)
+async def test_failed_setup_leaves_no_coordinator(
+    hass: HomeAssistant, heartbeat: list
+) -> None:
+    """A retried setup does not leave its closed client's coordinator behind."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_BASE_URL: "http://openwebui.local", CONF_API_KEY: "key"},
+    )
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, ConfigEntryState.SETUP_IN_PROGRESS)
+    session = Mock(closed=False, close=AsyncMock())
+    client = OpenWebUIApiClient(
+        "http://openwebui.local", "key", 10, True, session, owns_session=True
+    )
+
+    with (
+        patch(
+            "custom_components.openwebui_conversation._async_create_client",
+            return_value=client,
+        ),
+        patch.object(client, "async_get_heartbeat", side_effect=heartbeat),
+        patch.object(client, "async_get_models", return_value=[]),
+        pytest.raises(ConfigEntryNotReady),
+    ):
+        await async_setup_entry(hass, entry)
+
+    assert entry.entry_id not in hass.data.get(DOMAIN, {})
+    # What Home Assistant does after a failed setup attempt.
+    await entry._async_process_on_unload(hass)
+    session.close.assert_awaited_once()
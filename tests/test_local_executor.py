@@ -0,0 +1,260 @@
+"""Tests for planning and running tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.openwebui_conversation.local_executor import (
+    ToolCallDispatcher,
+    execute_tool_calls_detailed,
+    plan_tool_call_batches,
+)
+
+ENTITIES = ("light.desk", "light.lamp", "switch.fan", "switch.heater")
+
+
+def _light(entity_id: str, state: str = "on") -> dict:
+    return {
+        "name": "control_lights",
+        "parameters": {"entity_id": [entity_id], "state": state},
+    }
+
+
+def _switch(entity_id: str, state: str = "on") -> dict:
+    return {
+        "name": "control_switches",
+        "parameters": {"entity_id": [entity_id], "state": state},
+    }
+
+
+WAIT = {"name": "wait", "parameters": {"seconds": 0}}
+
+
+@pytest.fixture
+def entities(hass: HomeAssistant) -> None:
+    """Register a few lights and switches that start off."""
+    registry = er.async_get(hass)
+    for entity_id in (*ENTITIES, "light.group"):
+        domain, object_id = entity_id.split(".")
+        registry.async_get_or_create(
+            domain, "test", object_id, suggested_object_id=object_id
+        )
+        hass.states.async_set(entity_id, "off")
+    hass.states.async_set(
+        "light.group", "off", {"entity_id": ["light.desk", "light.lamp"]}
+    )
+
+
+def _plan(hass: HomeAssistant, tool_calls: list[dict]) -> list[list[int]]:
+    return [
+        [index for index, _ in batch]
+        for batch in plan_tool_call_batches(hass, tool_calls)
+    ]
+
+
+@pytest.mark.usefixtures("entities")
+async def test_independent_calls_share_a_batch(hass: HomeAssistant) -> None:
+    """Calls on different entities run together."""
+    tool_calls = [_light("light.desk"), _switch("switch.fan"), _light("light.lamp")]
+
+    assert _plan(hass, tool_calls) == [[1, 2, 3]]
+
+
+@pytest.mark.usefixtures("entities")
+async def test_same_target_keeps_order(hass: HomeAssistant) -> None:
+    """A second call on the same entity starts a new batch."""
+    tool_calls = [
+        _light("light.desk"),
+        _switch("switch.fan"),
+        _light("light.desk", "off"),
+        _switch("switch.heater"),
+    ]
+
+    assert _plan(hass, tool_calls) == [[1, 2], [3, 4]]
+
+
+@pytest.mark.usefixtures("entities")
+async def test_group_members_count_as_targets(hass: HomeAssistant) -> None:
+    """A group and one of its members are not run concurrently."""
+    tool_calls = [_light("light.group"), _light("light.lamp", "off")]
+
+    assert _plan(hass, tool_calls) == [[1], [2]]
+
+
+@pytest.mark.usefixtures("entities")
+async def test_wait_is_a_barrier(hass: HomeAssistant) -> None:
+    """A wait runs alone between the calls before and after it."""
+    tool_calls = [
+        _light("light.desk"),
+        WAIT,
+        _light("light.lamp"),
+        _switch("switch.fan"),
+    ]
+
+    assert _plan(hass, tool_calls) == [[1], [2], [3, 4]]
+
+
+@pytest.mark.usefixtures("entities")
+async def test_batches_run_concurrently_in_plan_order(hass: HomeAssistant) -> None:
+    """Independent calls overlap; results and same-entity order follow the plan."""
+    running = 0
+    overlap = 0
+    calls: list[tuple[str, str]] = []
+
+    async def _handle(call: ServiceCall) -> None:
+        nonlocal running, overlap
+        running += 1
+        overlap = max(overlap, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        state = "on" if call.service == "turn_on" else "off"
+        for entity_id in call.data["entity_id"]:
+            calls.append((entity_id, state))
+            hass.states.async_set(entity_id, state)
+
+    for domain in ("light", "switch"):
+        for service in ("turn_on", "turn_off"):
+            hass.services.async_register(domain, service, _handle)
+
+    results = await execute_tool_calls_detailed(
+        hass,
+        [
+            _light("light.desk"),
+            _switch("switch.fan"),
+            _light("light.desk", "off"),
+        ],
+        verify_timeout=1,
+    )
+
+    assert overlap == 2
+    assert [result.tool_call_id for result in results] == [
+        "tool_call_1",
+        "tool_call_2",
+        "tool_call_3",
+    ]
+    assert all(result.tool_result["success"] for result in results)
+    desk = [state for entity_id, state in calls if entity_id == "light.desk"]
+    assert desk == ["on", "off"]
+    assert hass.states.get("light.desk").state == "off"
+
+
+async def _settle() -> None:
+    # hass.async_block_till_done would wait for the blocked calls themselves.
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class _GatedServices:
+    """Light and switch services that block until their entity is released."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+        for domain in ("light", "switch"):
+            for service in ("turn_on", "turn_off"):
+                hass.services.async_register(domain, service, self._handle)
+
+    def gate(self, entity_id: str) -> asyncio.Event:
+        return self.gates.setdefault(entity_id, asyncio.Event())
+
+    async def _handle(self, call: ServiceCall) -> None:
+        (entity_id,) = call.data["entity_id"]
+        self.started.append(entity_id)
+        await self.gate(entity_id).wait()
+        self.hass.states.async_set(
+            entity_id, "on" if call.service == "turn_on" else "off"
+        )
+        self.finished.append(entity_id)
+
+
+@pytest.mark.usefixtures("entities")
+async def test_dispatcher_overlaps_independent_calls(hass: HomeAssistant) -> None:
+    """A call starts while an earlier call on another entity is still running."""
+    services = _GatedServices(hass)
+    dispatcher = ToolCallDispatcher(hass, verify_timeout=1)
+
+    dispatcher.dispatch(_light("light.desk"))
+    dispatcher.dispatch(_switch("switch.fan"))
+    await _settle()
+
+    assert services.started == ["light.desk", "switch.fan"]
+    services.gate("switch.fan").set()
+    services.gate("light.desk").set()
+    results = await dispatcher.async_results()
+
+    assert len(dispatcher) == 2
+    assert [result.tool_call_id for result in results] == [
+        "tool_call_1",
+        "tool_call_2",
+    ]
+    assert all(result.tool_result["success"] for result in results)
+
+
+@pytest.mark.usefixtures("entities")
+async def test_dispatcher_orders_calls_on_the_same_entity(
+    hass: HomeAssistant,
+) -> None:
+    """A later call on the same entity waits for the earlier one."""
+    services = _GatedServices(hass)
+    dispatcher = ToolCallDispatcher(hass, verify_timeout=1)
+
+    dispatcher.dispatch(_light("light.desk"))
+    dispatcher.dispatch(_light("light.desk", "off"))
+    await _settle()
+
+    assert services.started == ["light.desk"]
+    services.gate("light.desk").set()
+    await dispatcher.async_results()
+
+    assert services.started == ["light.desk", "light.desk"]
+    assert hass.states.get("light.desk").state == "off"
+
+
+@pytest.mark.usefixtures("entities")
+async def test_dispatcher_waits_at_barrier(hass: HomeAssistant) -> None:
+    """Calls after a wait start only once every call before it finished."""
+    services = _GatedServices(hass)
+    dispatcher = ToolCallDispatcher(hass, verify_timeout=1)
+
+    dispatcher.dispatch(_light("light.desk"))
+    dispatcher.dispatch(WAIT)
+    dispatcher.dispatch(_switch("switch.fan"))
+    await _settle()
+
+    assert services.started == ["light.desk"]
+    services.gate("switch.fan").set()
+    services.gate("light.desk").set()
+    results = await dispatcher.async_results()
+
+    assert services.finished == ["light.desk", "switch.fan"]
+    assert [result.tool_name for result in results] == [
+        "control_lights",
+        "wait",
+        "control_switches",
+    ]
+
+
+@pytest.mark.usefixtures("entities")
+async def test_dispatcher_cancel_stops_pending_calls(hass: HomeAssistant) -> None:
+    """Cancelling stops running calls and those still waiting their turn."""
+    services = _GatedServices(hass)
+    dispatcher = ToolCallDispatcher(hass, verify_timeout=1)
+
+    dispatcher.dispatch(_light("light.desk"))
+    dispatcher.dispatch(_light("light.desk", "off"))
+    await _settle()
+    await dispatcher.async_cancel()
+    services.gate("light.desk").set()
+    await _settle()
+
+    assert services.started == ["light.desk"]
+    assert services.finished == []
+    with pytest.raises(asyncio.CancelledError):
+        await dispatcher.async_results()
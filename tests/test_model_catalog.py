@@ -0,0 +1,66 @@
+"""Tests for the model catalog cache."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openwebui_conversation.exceptions import ApiClientError
+from custom_components.openwebui_conversation.model_catalog import ModelCatalog
+
+MODELS = [{"id": "assist", "info": {"meta": {"toolIds": ["home_assistant"]}}}]
+
+
+class _FakeClient:
+    """Answer /api/models after an optional gate, or fail."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.requests = 0
+
+    async def async_get_models(self) -> list[dict[str, Any]]:
+        self.requests += 1
+        await self.gate.wait()
+        if self.fail:
+            raise ApiClientError("connection refused")
+        return MODELS
+
+
+async def test_cold_catalog_is_fetched_once(hass: HomeAssistant) -> None:
+    """The first turn waits for the fetch; later turns read the cache."""
+    client = _FakeClient()
+    catalog = ModelCatalog(hass, client)
+
+    assert await catalog.async_wait_tool_ids("assist") == ["home_assistant"]
+    assert await catalog.async_wait_tool_ids("assist") == ["home_assistant"]
+    assert client.requests == 1
+
+
+async def test_cold_catalog_wait_is_bounded(hass: HomeAssistant) -> None:
+    """A slow fetch is given up on, but keeps running for later turns."""
+    client = _FakeClient()
+    client.gate.clear()
+    catalog = ModelCatalog(hass, client)
+
+    assert await catalog.async_wait_tool_ids("assist", timeout=0.01) == []
+    assert not catalog.loaded
+
+    client.gate.set()
+    await hass.async_block_till_done()
+    assert catalog.loaded
+    assert catalog.async_tool_ids("assist") == ["home_assistant"]
+    assert client.requests == 1
+
+
+async def test_failed_catalog_has_no_tool_ids(hass: HomeAssistant) -> None:
+    """A failed fetch leaves no tool ids and records the error."""
+    catalog = ModelCatalog(hass, _FakeClient(fail=True))
+
+    assert await catalog.async_wait_tool_ids("assist") == []
+    assert not catalog.loaded
+    assert catalog.as_dict()["last_error"] == "connection refused"
+    assert catalog.refresh_failures == 1
@@ -0,0 +1,149 @@
+"""Tests for the learned tool plan cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.openwebui_conversation import plan_cache
+from custom_components.openwebui_conversation.local_executor import (
+    ToolExecutionResult,
+)
+from custom_components.openwebui_conversation.plan_cache import PlanCache
+
+
+@pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Drive the cache clock by hand."""
+    clock = [1000.0]
+    monkeypatch.setattr(plan_cache, "monotonic", lambda: clock[0])
+    return clock
+
+
+def _result(
+    entity_id: str, *, tool: str = "turn_on", success: bool = True
+) -> ToolExecutionResult:
+    return ToolExecutionResult(
+        tool_call_id="call",
+        tool_name=tool,
+        parameters={"entity_id": entity_id},
+        step=None,
+        tool_result={"success": success},
+    )
+
+
+def _cache(hass: HomeAssistant, **kwargs: Any) -> PlanCache:
+    options = {"max_entries": 8, "ttl": 60.0, "min_confidence": 2} | kwargs
+    return PlanCache(hass, **options)
+
+
+async def test_replayed_after_enough_confidence(hass: HomeAssistant) -> None:
+    """A plan is replayed only after succeeding min_confidence times."""
+    cache = _cache(hass)
+
+    assert cache.record("Turn on the desk lamp.", [_result("light.desk")])
+    assert cache.get("turn on the desk lamp") is None
+    assert cache.record("turn on the desk lamp", [_result("light.desk")])
+
+    assert cache.get("Turn on the desk lamp") == [
+        {
+            "id": "tool_call_1",
+            "name": "turn_on",
+            "parameters": {"entity_id": "light.desk"},
+        }
+    ]
+    assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+
+
+async def test_replayed_calls_are_copies(hass: HomeAssistant) -> None:
+    """Changing a replayed call does not change the cached plan."""
+    cache = _cache(hass, min_confidence=1)
+    cache.record("desk on", [_result("light.desk")])
+
+    cache.get("desk on")[0]["parameters"]["entity_id"] = "light.other"
+
+    assert cache.get("desk on")[0]["parameters"] == {"entity_id": "light.desk"}
+
+
+async def test_different_plan_starts_over(hass: HomeAssistant) -> None:
+    """A new plan for the utterance replaces the old one at confidence one."""
+    cache = _cache(hass)
+    cache.record("lamp on", [_result("light.desk")])
+    cache.record("lamp on", [_result("light.desk")])
+
+    cache.record("lamp on", [_result("light.lamp")])
+
+    assert cache.get("lamp on") is None
+    cache.record("lamp on", [_result("light.lamp")])
+    assert cache.get("lamp on")[0]["parameters"] == {"entity_id": "light.lamp"}
+
+
+@pytest.mark.parametrize(
+    "results",
+    [
+        pytest.param([], id="no_calls"),
+        pytest.param([_result("light.desk", success=False)], id="failed"),
+        pytest.param(
+            [_result("light.desk"), _result("light.desk", tool="get_entity_state")],
+            id="read_only",
+        ),
+    ],
+)
+async def test_unsafe_plans_are_not_learned(
+    hass: HomeAssistant, results: list[ToolExecutionResult]
+) -> None:
+    """Failed runs and plans that read state are never cached."""
+    cache = _cache(hass, min_confidence=1)
+
+    assert not cache.record("lamp on", results)
+    assert len(cache) == 0
+
+
+async def test_expiry_discard_and_eviction(
+    hass: HomeAssistant, now: list[float]
+) -> None:
+    """Plans expire, are dropped after a failed replay, and are evicted LRU."""
+    cache = _cache(hass, max_entries=2, min_confidence=1)
+    cache.record("a", [_result("light.a")])
+    now[0] += 60
+    assert cache.get("a") is None
+    assert cache.expired == 1
+
+    cache.record("b", [_result("light.b")])
+    cache.discard("B!")
+    assert cache.get("b") is None
+    assert cache.replay_failures == 1
+
+    cache.record("c", [_result("light.c")])
+    cache.record("d", [_result("light.d")])
+    assert cache.get("c") is not None
+    cache.record("e", [_result("light.e")])
+    assert cache.get("d") is None
+    assert cache.evictions == 1
+
+
+async def test_registry_changes_clear_the_cache(hass: HomeAssistant) -> None:
+    """Renaming an entity clears the cache; adding one does not."""
+    registry = er.async_get(hass)
+    cache = _cache(hass, min_confidence=1)
+    cache.async_start()
+    cache.record("desk on", [_result("light.desk")])
+
+    entry = registry.async_get_or_create("light", "test", "desk")
+    await hass.async_block_till_done()
+    assert len(cache) == 1
+
+    registry.async_update_entity(entry.entity_id, name="Reading lamp")
+    await hass.async_block_till_done()
+    assert len(cache) == 0
+    assert cache.invalidations == 1
+
+    cache.async_stop()
+    cache.record("desk on", [_result("light.desk")])
+    registry.async_update_entity(entry.entity_id, name="Desk")
+    await hass.async_block_till_done()
+    assert len(cache) == 1
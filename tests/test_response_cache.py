@@ -0,0 +1,119 @@
+"""Tests for the exact-match response cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.openwebui_conversation import response_cache
+from custom_components.openwebui_conversation.const import (
+    CONF_RESPONSE_CACHE_ENABLED,
+    CONF_RESPONSE_CACHE_SIZE,
+    DOMAIN,
+)
+from custom_components.openwebui_conversation.response_cache import ResponseCache
+
+
+@pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Drive the cache clock by hand."""
+    clock = [1000.0]
+    monkeypatch.setattr(response_cache, "monotonic", lambda: clock[0])
+    return clock
+
+
+def _payload(*history: str, model: str = "assist") -> dict[str, Any]:
+    messages = [{"role": "system", "content": "You are a voice assistant."}]
+    messages += [{"role": "user", "content": text} for text in history]
+    return {"model": model, "tool_ids": [], "messages": messages}
+
+
+def test_key_ignores_case_whitespace_and_punctuation() -> None:
+    """Only the utterance's wording and the context before it matter."""
+    key = ResponseCache.key("Tell me a joke.", _payload("Tell me a joke."))
+
+    assert ResponseCache.key("  tell me   a JOKE", _payload("tell me a joke")) == key
+    assert ResponseCache.key("Tell me a joke", _payload("Hi", "Tell me a joke")) != key
+    assert ResponseCache.key("Tell me a joke", _payload("x", model="other")) != key
+
+
+def test_hit_replays_the_spoken_deltas(now: list[float]) -> None:
+    """A hit returns the stored deltas; counters follow lookups."""
+    cache = ResponseCache(max_entries=4, ttl=60)
+    key = ResponseCache.key("What is 2+2?", _payload("What is 2+2?"))
+    deltas = [{"role": "assistant", "content": "Four. "}, {"content": "Easy."}]
+
+    assert cache.get(key) is None
+    cache.put(key, "Four. Easy.", deltas)
+    deltas[0]["content"] = "changed"
+    cached = cache.get(key)
+
+    assert cached is not None
+    assert cached.final_text == "Four. Easy."
+    assert cached.deltas == (
+        {"role": "assistant", "content": "Four. "},
+        {"content": "Easy."},
+    )
+    assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+    assert cache.as_dict()["hit_rate"] == 0.5
+
+
+def test_default_delta_is_the_whole_reply() -> None:
+    """A reply stored without deltas replays as one assistant message."""
+    cache = ResponseCache(max_entries=4, ttl=60)
+    cache.put(("hi", ""), "Hello!")
+
+    assert cache.get(("hi", "")).deltas == ({"role": "assistant", "content": "Hello!"},)
+
+
+def test_entries_expire(now: list[float]) -> None:
+    """An entry is dropped once it is as old as the TTL."""
+    cache = ResponseCache(max_entries=4, ttl=60)
+    cache.put(("hi", ""), "Hello!")
+
+    now[0] += 59.9
+    assert cache.get(("hi", "")) is not None
+    now[0] += 0.1
+    assert cache.get(("hi", "")) is None
+    assert cache.expired == 1
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted() -> None:
+    """A full cache drops the entry that was used longest ago."""
+    cache = ResponseCache(max_entries=2, ttl=60)
+    cache.put(("a", ""), "A")
+    cache.put(("b", ""), "B")
+    assert cache.get(("a", "")) is not None
+
+    cache.put(("c", ""), "C")
+
+    assert cache.get(("b", "")) is None
+    assert cache.get(("a", "")) is not None
+    assert cache.get(("c", "")) is not None
+    assert cache.evictions == 1
+
+
+async def test_setup_follows_the_option(hass: HomeAssistant) -> None:
+    """The cache exists only while the option is on, sized from the options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_RESPONSE_CACHE_ENABLED: True, CONF_RESPONSE_CACHE_SIZE: 3},
+    )
+
+    cache = response_cache.async_setup_response_cache(hass, entry)
+    assert cache is not None
+    assert cache.max_entries == 3
+    assert response_cache.async_get_response_cache(hass, entry) is cache
+
+    response_cache.async_release_response_cache(hass, entry)
+    assert response_cache.async_get_response_cache(hass, entry) is None
+
+    disabled = MockConfigEntry(
+        domain=DOMAIN, options={CONF_RESPONSE_CACHE_ENABLED: False}
+    )
+    assert response_cache.async_setup_response_cache(hass, disabled) is None
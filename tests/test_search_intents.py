@@ -0,0 +1,59 @@
+"""Tests for search trigger detection."""
+
+from __future__ import annotations
+
+from types import MethodType, SimpleNamespace
+
+import pytest
+
+from custom_components.openwebui_conversation.const import DEFAULT_SEARCH_SENTENCES
+from custom_components.openwebui_conversation.conversation import (
+    OpenWebUIAgent,
+    compile_search_intents,
+)
+
+
+def _agent(sentences: str = DEFAULT_SEARCH_SENTENCES) -> SimpleNamespace:
+    agent = SimpleNamespace(
+        search_enabled=True,
+        search_sentences=sentences.splitlines(),
+        lang="en",
+        _search_intents=None,
+    )
+    agent._get_search_intents = MethodType(OpenWebUIAgent._get_search_intents, agent)
+    return agent
+
+
+@pytest.mark.parametrize(
+    ("prompt", "expected"),
+    [
+        ("look up the weather in Paris", ("the weather in Paris", True)),
+        ("Look up the news", ("the news", True)),
+        ("turn on the kitchen lights", ("turn on the kitchen lights", False)),
+        ("search the attic", ("search the attic", False)),
+    ],
+)
+def test_prepare_prompt(prompt: str, expected: tuple[str, bool]) -> None:
+    """Only utterances matching a trigger sentence become search queries."""
+    assert OpenWebUIAgent._prepare_prompt(_agent(), prompt) == expected
+
+
+def test_prefilter_needs_every_literal_word() -> None:
+    """The prefilter skips utterances missing a template's literal words."""
+    compiled = compile_search_intents("en", DEFAULT_SEARCH_SENTENCES.splitlines())
+
+    assert compiled.might_match("Look up, please: the news")
+    assert compiled.might_match("search the attic for the box")
+    assert not compiled.might_match("search the attic")
+    assert not compiled.might_match("look at the lights")
+
+
+def test_intents_compiled_once_per_agent() -> None:
+    """An agent compiles its intents once; a new agent compiles its own."""
+    first = _agent()
+    compiled = first._get_search_intents()
+    assert first._get_search_intents() is compiled
+
+    second = _agent("find {query}")
+    assert OpenWebUIAgent._prepare_prompt(second, "find my keys") == ("my keys", True)
+    assert second._search_intents is not compiled
@@ -0,0 +1,142 @@
+"""Tests for the streamed sentence segmenter."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def segmenter_module(load_module):
+    """Return the sentence_segmenter module."""
+    return load_module("sentence_segmenter")
+
+
+def _feed_chars(segmenter, text: str) -> list[str]:
+    sentences = []
+    for char in text:
+        sentences.extend(segmenter.feed(char))
+    return sentences
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Hello there. How are you? ", ["Hello there. ", "How are you? "]),
+        ("Wow! Really?! Yes. ", ["Wow! ", "Really?! ", "Yes. "]),
+        ('He said "stop." Then left. ', ['He said "stop." ', "Then left. "]),
+        ("First line\nSecond", ["First line\n"]),
+        (
+            "The answer is no. The door is locked and the lights are off now. ",
+            [
+                "The answer is no. ",
+                "The door is locked and the lights are off now. ",
+            ],
+        ),
+    ],
+)
+def test_boundaries(segmenter_module, text: str, expected: list[str]) -> None:
+    """Terminators followed by whitespace and newlines end sentences."""
+    assert segmenter_module.SentenceSegmenter().feed(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Dr. Smith and Mr. Jones arrived. ",
+        "Buy apples, pears etc. and more. ",
+        "It is 21.5 degrees outside. ",
+        "Open file.txt now please. ",
+        "Ask J. Doe about it. ",
+        "Take exit no. 5 to get there. ",
+    ],
+)
+def test_non_boundaries(segmenter_module, text: str) -> None:
+    """Abbreviations, decimals, dotted names and initials do not cut."""
+    assert segmenter_module.SentenceSegmenter().feed(text) == [text]
+
+
+def test_numbered_list_markers(segmenter_module) -> None:
+    """A short number at the start of a line is a list marker."""
+    sentences = segmenter_module.SentenceSegmenter().feed("1. Turn on\n2. Dim it\n")
+
+    assert sentences == ["1. Turn on\n", "2. Dim it\n"]
+
+
+def test_cjk_terminators(segmenter_module) -> None:
+    """Full-width terminators cut without trailing whitespace."""
+    segmenter = segmenter_module.SentenceSegmenter()
+
+    assert segmenter.feed("灯を消しました。エアコンは？」次") == [
+        "灯を消しました。",
+        "エアコンは？」",
+    ]
+    assert segmenter.flush() == "次"
+
+
+def test_same_result_when_fed_by_character(segmenter_module) -> None:
+    """Deltas split anywhere, even inside "no. 5", give the same sentences."""
+    text = "The answer is no. Take exit no. 5 now. Pi is 3.14. Done! "
+    whole = segmenter_module.SentenceSegmenter().feed(text)
+
+    assert _feed_chars(segmenter_module.SentenceSegmenter(), text) == whole
+    assert whole == [
+        "The answer is no. ",
+        "Take exit no. 5 now. ",
+        "Pi is 3.14. ",
+        "Done! ",
+    ]
+
+
+def test_flush_returns_remainder(segmenter_module) -> None:
+    """Text without a boundary stays pending until flushed."""
+    segmenter = segmenter_module.SentenceSegmenter()
+
+    assert segmenter.feed("Turning on the kitchen") == []
+    assert segmenter.pending == "Turning on the kitchen"
+    assert segmenter.flush() == "Turning on the kitchen"
+    assert segmenter.pending == ""
+
+
+def test_deadline_flushes_up_to_last_word_break(segmenter_module) -> None:
+    """After max_delay, text up to the last whole word is released."""
+    now = [0.0]
+    segmenter = segmenter_module.SentenceSegmenter(
+        max_delay=0.5, min_deadline_chars=5, clock=lambda: now[0]
+    )
+
+    assert segmenter.feed("Turning on the kitchen li") == []
+    now[0] = 0.6
+    assert segmenter.feed("ghts and") == ["Turning on the kitchen lights "]
+    assert segmenter.pending == "and"
+
+
+def test_deadline_waits_for_enough_text(segmenter_module) -> None:
+    """The deadline does not release fragments shorter than the minimum."""
+    now = [0.0]
+    segmenter = segmenter_module.SentenceSegmenter(
+        max_delay=0.5, min_deadline_chars=12, clock=lambda: now[0]
+    )
+
+    segmenter.feed("Okay so")
+    now[0] = 1.0
+    assert segmenter.feed(" um") == []
+
+
+def test_deadline_without_new_text(segmenter_module) -> None:
+    """A stalled stream's text is released by flush_due once it falls due."""
+    now = [0.0]
+    segmenter = segmenter_module.SentenceSegmenter(
+        max_delay=0.5, min_deadline_chars=5, clock=lambda: now[0]
+    )
+
+    assert segmenter.time_to_deadline() is None
+    assert segmenter.feed("Turning on the kitchen li") == []
+    assert segmenter.time_to_deadline() == 0.5
+    now[0] = 0.2
+    assert segmenter.flush_due() == []
+    assert segmenter.time_to_deadline() == pytest.approx(0.3)
+    now[0] = 0.5
+    assert segmenter.flush_due() == ["Turning on the kitchen "]
+    assert segmenter.pending == "li"
+    # Too little text left to ever fall due on its own.
+    assert segmenter.time_to_deadline() is None
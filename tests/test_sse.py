@@ -0,0 +1,115 @@
+"""Tests for the server-sent events framer."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+STREAM = (
+    b'data: {"choices":[{"delta":{"content":"Hello"}}]}\n\n'
+    b": keep-alive\n\n"
+    b'data: {"choices":[{"delta":{"content":" there"}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+
+
+@pytest.fixture
+def sse(load_module):
+    """Return the sse module."""
+    return load_module("sse")
+
+
+def _feed_in_pieces(framer, data: bytes, size: int) -> list:
+    frames = []
+    for start in range(0, len(data), size):
+        frames.extend(framer.feed(data[start : start + size]))
+    return frames
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 64, len(STREAM)])
+def test_frames_split_across_reads(sse, size: int) -> None:
+    """Any split of the byte stream yields the same frames."""
+    frames = _feed_in_pieces(sse.SSEFramer(), STREAM, size)
+
+    assert [bytes(frame.data) for frame in frames] == [
+        b'{"choices":[{"delta":{"content":"Hello"}}]}',
+        b'{"choices":[{"delta":{"content":" there"}}]}',
+        b"[DONE]",
+    ]
+    assert all(frame.event == sse.DEFAULT_EVENT for frame in frames)
+
+
+@pytest.mark.parametrize("size", [1, 5, 1000])
+def test_crlf_line_endings(sse, size: int) -> None:
+    """CRLF and lone CR line endings are normalized, even split in between."""
+    data = STREAM.replace(b"\n", b"\r\n")
+    frames = _feed_in_pieces(sse.SSEFramer(), data, size)
+
+    assert [bytes(frame.data) for frame in frames][-1] == b"[DONE]"
+    assert len(frames) == 3
+
+
+def test_lone_cr_line_endings(sse) -> None:
+    """A trailing CR waits for the next read in case a LF follows it."""
+    framer = sse.SSEFramer()
+
+    assert [bytes(f.data) for f in framer.feed(b"data: a\r\rdata: b\r")] == [b"a"]
+    assert [bytes(f.data) for f in framer.feed(b"\rdata: c\r\n\r\n")] == [b"b", b"c"]
+
+
+def test_comments_are_skipped(sse) -> None:
+    """Comment lines neither produce frames nor end up in the data."""
+    framer = sse.SSEFramer()
+
+    assert framer.feed(b": ping\n\n:\n\n") == []
+    frames = framer.feed(b": note\ndata: x\n\n")
+    assert [bytes(frame.data) for frame in frames] == [b"x"]
+
+
+def test_multi_line_data_and_fields(sse) -> None:
+    """Data lines are joined with newlines; event, id and retry are parsed."""
+    framer = sse.SSEFramer()
+
+    (frame,) = framer.feed(b"event: error\nid: 7\nretry: 1500\ndata: one\ndata:two\n\n")
+
+    assert bytes(frame.data) == b"one\ntwo"
+    assert frame.event == "error"
+    assert frame.id == "7"
+    assert framer.last_event_id == "7"
+    assert framer.retry == 1500
+
+
+def test_done_marker_is_passed_through(sse) -> None:
+    """[DONE] is an ordinary frame; the API client decides it ends the stream."""
+    (frame,) = sse.SSEFramer().feed(b"data: [DONE]\n\n")
+
+    assert bytes(frame.data) == b"[DONE]"
+
+
+def test_malformed_payload_is_handed_over_unparsed(sse) -> None:
+    """The framer does not decode JSON, so a broken payload fails downstream."""
+    (frame,) = sse.SSEFramer().feed(b'data: {"choices": [\n\n')
+
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(frame.data)
+
+
+def test_malformed_lines_are_ignored(sse) -> None:
+    """Unknown fields, a bad retry and a NUL in the id are ignored."""
+    framer = sse.SSEFramer()
+
+    assert framer.feed(b"bogus\nretry: soon\nid: a\0b\n\n") == []
+    assert framer.retry is None
+    assert framer.last_event_id is None
+
+
+def test_flush_returns_unterminated_frame(sse) -> None:
+    """A frame cut off by the end of the stream is still returned by flush."""
+    framer = sse.SSEFramer()
+
+    assert framer.feed(b'data: {"usage": {}}\n') == []
+    frame = framer.flush()
+    assert frame is not None
+    assert bytes(frame.data) == b'{"usage": {}}'
+    assert framer.flush() is None
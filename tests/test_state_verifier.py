@@ -0,0 +1,89 @@
+"""Tests for event-driven state verification."""
+
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.openwebui_conversation.state_verifier import (
+    StateVerifier,
+    expect_climate,
+    expect_state,
+)
+
+
+@pytest.mark.parametrize(
+    ("attributes", "matches"),
+    [
+        ({"temperature": 21.3}, True),
+        # Rounded to the entity's half-degree step.
+        ({"temperature": 21.5, "target_temp_step": 0.5}, True),
+        ({"temperature": 22.0, "target_temp_step": 0.5}, False),
+        ({"temperature": 21.0, "target_temp_step": 0.1}, False),
+        # No declared step: whole degrees.
+        ({"temperature": 21.0}, True),
+        ({"temperature": 22.0}, False),
+        # Dual setpoint (heat_cool).
+        ({"target_temp_low": 19.0, "target_temp_high": 23.0}, True),
+        ({"target_temp_low": 22.0, "target_temp_high": 25.0}, False),
+        ({}, False),
+    ],
+)
+def test_expect_climate(attributes: dict, matches: bool) -> None:
+    """Targets match within the thermostat's step or inside its range."""
+    predicate = expect_climate(21.3)
+
+    assert predicate(State("climate.hall", "heat", attributes)) is matches
+
+
+def test_expect_climate_clamps_to_limits() -> None:
+    """A request beyond max_temp matches the clamped target."""
+    predicate = expect_climate(35.0)
+
+    assert predicate(State("climate.hall", "heat", {"temperature": 30, "max_temp": 30}))
+    assert not predicate(State("climate.hall", "heat", {"temperature": 30}))
+
+
+def test_expect_climate_checks_mode() -> None:
+    """A requested hvac mode must also match."""
+    predicate = expect_climate(21.0, "cool")
+
+    assert not predicate(State("climate.hall", "heat", {"temperature": 21}))
+    assert predicate(State("climate.hall", "cool", {"temperature": 21}))
+
+
+async def test_verifier_confirms_from_state_events(hass: HomeAssistant) -> None:
+    """A target that reports the expected state later is confirmed."""
+    hass.states.async_set("light.desk", "off")
+
+    async with StateVerifier(hass, ["light.desk"], expect_state("on")) as verifier:
+        hass.loop.call_soon(hass.states.async_set, "light.desk", "on")
+        result = await verifier.async_wait(1)
+
+    assert result.confirmed == {"light.desk"}
+    assert not result.timed_out
+
+
+async def test_verifier_confirms_group_from_members(hass: HomeAssistant) -> None:
+    """A group counts as confirmed once all of its members match."""
+    hass.states.async_set("light.group", "off", {"entity_id": ["light.a", "light.b"]})
+    hass.states.async_set("light.a", "on")
+    hass.states.async_set("light.b", "on")
+
+    async with StateVerifier(hass, ["light.group"], expect_state("on")) as verifier:
+        result = await verifier.async_wait(0)
+
+    assert result.confirmed == {"light.group"}
+
+
+async def test_verifier_times_out(hass: HomeAssistant) -> None:
+    """A target that never matches is reported with its actual state."""
+    hass.states.async_set("switch.fan", "off")
+
+    async with StateVerifier(hass, ["switch.fan"], expect_state("on")) as verifier:
+        result = await verifier.async_wait(0.01)
+
+    assert result.timed_out
+    assert result.confirmed == set()
+    assert result.actual_states == {"switch.fan": "off"}
@@ -0,0 +1,131 @@
+"""Tests for token usage accounting."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from custom_components.openwebui_conversation.usage import (
+    TokenUsage,
+    UsageStats,
+    parse_usage,
+)
+
+
+@pytest.mark.parametrize(
+    ("usage", "measured", "expected"),
+    [
+        pytest.param(
+            {"prompt_tokens": 812, "completion_tokens": 40, "total_tokens": 852},
+            2.0,
+            (812, 40, 2.0),
+            id="openai_measured",
+        ),
+        pytest.param(
+            {"prompt_tokens": 812, "completion_tokens": 40},
+            None,
+            (812, 40, 0.0),
+            id="openai_untimed",
+        ),
+        pytest.param(
+            {
+                "prompt_eval_count": 900,
+                "eval_count": 50,
+                "eval_duration": 1_250_000_000,
+                "response_token/s": 10,
+            },
+            9.0,
+            (900, 50, 1.25),
+            id="ollama_eval_duration",
+        ),
+        pytest.param(
+            {"prompt_tokens": 900, "completion_tokens": 50, "response_token/s": 20.0},
+            9.0,
+            (900, 50, 2.5),
+            id="ollama_rate",
+        ),
+        pytest.param(
+            {"completion_tokens": 12, "eval_duration": 0, "response_token/s": 0},
+            0.5,
+            (0, 12, 0.5),
+            id="zero_timings_fall_back",
+        ),
+        pytest.param({"prompt_tokens": 30}, None, (30, 0, 0.0), id="prompt_only"),
+    ],
+)
+def test_parse_usage(
+    usage: dict[str, Any],
+    measured: float | None,
+    expected: tuple[int, int, float],
+) -> None:
+    """OpenAI and Ollama fields are read; backend timing beats measured time."""
+    parsed = parse_usage(usage, measured)
+
+    assert parsed is not None
+    assert (
+        parsed.prompt_tokens,
+        parsed.completion_tokens,
+        parsed.generation_seconds,
+    ) == pytest.approx(expected)
+    assert parsed.requests == 1
+    assert parsed.largest_prompt_tokens == expected[0]
+
+
+@pytest.mark.parametrize(
+    "usage",
+    [
+        None,
+        "812 tokens",
+        {},
+        {"total_tokens": 852},
+        {"prompt_tokens": True, "completion_tokens": "40"},
+    ],
+)
+def test_parse_usage_without_counts(usage: Any) -> None:
+    """Blocks without usable token counts are ignored."""
+    assert parse_usage(usage, 1.0) is None
+
+
+def test_turn_usage_adds_up() -> None:
+    """A turn's rounds add up; the largest prompt is kept, not summed."""
+    turn = TokenUsage()
+    turn.add(parse_usage({"prompt_tokens": 800, "completion_tokens": 20}, 1.0))
+    turn.add(parse_usage({"prompt_tokens": 950, "completion_tokens": 30}, 1.5))
+
+    assert turn.as_dict() == {
+        "prompt_tokens": 1750,
+        "completion_tokens": 50,
+        "generation_seconds": 2.5,
+        "tokens_per_second": 20.0,
+        "requests": 2,
+        "largest_prompt_tokens": 950,
+    }
+    assert TokenUsage().tokens_per_second is None
+
+
+def test_stats_flag_prompts_over_budget(caplog: pytest.LogCaptureFixture) -> None:
+    """Turns are totalled per model and a prompt over the budget is flagged."""
+    updates: list[None] = []
+    stats = UsageStats(1000, lambda: updates.append(None))
+
+    assert not stats.async_record("llama", TokenUsage())
+    assert not stats.async_record("llama", parse_usage({"prompt_tokens": 900}))
+    assert stats.async_record(
+        "qwen", parse_usage({"prompt_tokens": 1200, "completion_tokens": 10}, 0.5)
+    )
+
+    assert len(updates) == 2
+    assert stats.turns == 2
+    assert stats.over_budget_turns == 1
+    assert stats.total.prompt_tokens == 2100
+    assert stats.models["qwen"].completion_tokens == 10
+    assert stats.last_tokens_per_second == 20.0
+    assert "above the budget of 1000" in caplog.text
+
+
+def test_zero_budget_turns_the_check_off() -> None:
+    """A budget of zero never flags a prompt."""
+    stats = UsageStats(0, lambda: None)
+
+    assert not stats.async_record("llama", parse_usage({"prompt_tokens": 10**6}))